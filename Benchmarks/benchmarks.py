@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:06:36 2026
+
+########################################################################
+####                                                                ####
+####                          benchmarks                            ####
+####                                                                ####
+########################################################################
+
+Benchmarks for the package. They never touch stats.wnba.com: searches
+are answered from payloads held in memory, and the batch benchmark runs
+against a StubServer on localhost (see the stubserver module).
+
+    python Benchmarks/benchmarks.py
+
+    or
+
+    python Benchmarks/benchmarks.py --fixtures Tests/fixtures \
+                                    --output results.json \
+                                    --compare baseline.json
+
+    The payloads are synthetic (see the stubserver module) unless a
+    fixture directory recorded with a ReplayTransport is passed with
+    --fixtures (see the replay module), in which case the first recorded
+    response for each endpoint is used instead.
+
+    Benchmarks:
+        - import.wnbAPI: import wnbAPI in a new interpreter, which loads
+          neither numpy, pandas nor the endpoint classes (see the lazy
+          module)
+        - import.Player: import wnbAPI and load the Player class
+        - search.new: Search.search for params never searched before,
+          which merges params, checks them, records history and parses
+          the response
+        - search.repeat: Search.search for params already searched, which
+          is answered from Search.data
+        - search.cached: Search.search answered from a SQLiteCache held in
+          memory (see the cache module)
+        - dataFrame.<endpoint>: Search.dataFrame for the result sets of
+          each endpoint
+        - pbp.array and pbp.frame: flattening a full game of play by play
+          with decode.pbpArray and Game.pbpFrame
+        - batch.throughput: Player.batch against a StubServer, reported as
+          requests per second
+
+    Results are written as JSON to --output (benchmark-results.json by
+    default): the Python version, platform, git commit and time of the
+    run, and for every benchmark its name, the number of calls timed,
+    and the min, median and mean seconds per call (or requests per
+    second for throughput). --compare prints every benchmark which is more
+    than --threshold (20% by default) slower than in an earlier results
+    file, and exits with status 1 if there are any.
+
+    --quick runs fewer calls, for a fast check that everything works.
+"""
+import argparse            # import argparse to read options
+import json                # import json to write results
+import os                  # import os to lay out paths
+import platform            # import platform to describe the machine
+import statistics          # import statistics to summarize timings
+import subprocess          # import subprocess to read the git commit
+import sys                 # import sys to exit with a status
+import time                # import time to time calls
+
+from context import wnbAPI
+from wnbAPI.replay import FixtureResponse, FixtureStore
+from wnbAPI.stubserver import StubServer, syntheticStats, syntheticPbp
+from wnbAPI.endpoints import endpoints
+
+class MemoryTransport(object):
+    '''
+    Transport answering every request from a dictionary of response
+    bodies keyed by URL, with no I/O
+    '''
+    def __init__(self, bodies):
+        self.bodies = bodies
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        return FixtureResponse(url, 200, {}, self.bodies[url])
+
+def measure(function, number, repeat=5):
+    '''
+    calls function number times, repeat times over, and returns the min,
+    median and mean seconds per call of the repeats
+    '''
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        times.append((time.perf_counter() - start) / number)
+    return {'calls': number * repeat, 'min': min(times),
+            'median': statistics.median(times),
+            'mean': statistics.mean(times), 'unit': 'seconds'}
+
+def syntheticPayloads(rows):
+    '''
+    returns {url: body} of synthetic responses for every endpoint
+    '''
+    return dict((spec.url, json.dumps(syntheticStats(spec.url, rows))
+                 .encode('utf-8'))
+                for spec in endpoints)
+
+def recordedPayloads(path):
+    '''
+    returns {url: body} of the first recorded 200 response for each URL
+    in the fixture directory path
+    '''
+    bodies = {}
+    for url, params, response in FixtureStore(path):
+        if response.status_code == 200 and url not in bodies:
+            bodies[url] = response.content
+    return bodies
+
+def importTime(number, statement=''):
+    '''
+    times import wnbAPI, followed by statement, in number new
+    interpreters. each interpreter times itself, so starting python isn't
+    counted.
+    '''
+    script = ('import time\n'
+              'start = time.perf_counter()\n'
+              'import wnbAPI\n' + statement + '\n'
+              'print(time.perf_counter() - start)')
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    times = [float(subprocess.check_output([sys.executable, '-c', script],
+                                           cwd=root))
+             for _ in range(number)]
+    return {'calls': number, 'min': min(times),
+            'median': statistics.median(times),
+            'mean': statistics.mean(times), 'unit': 'seconds'}
+
+def searchOverhead(number):
+    '''
+    times searches answered by a MemoryTransport holding a small payload,
+    so the time is the search's own bookkeeping
+    '''
+    url = 'https://stats.wnba.com/stats/playergamelogs'
+    bodies = {url: json.dumps(syntheticStats(url, 1)).encode('utf-8')}
+    results = {}
+
+    player = wnbAPI.Player()
+    player.setTransport(MemoryTransport(bodies))
+    ids = iter(range(10**9))
+    results['search.new'] = measure(
+            lambda: player.gamelogs(PlayerID=str(next(ids))), number)
+
+    player.gamelogs(PlayerID='203399')
+    results['search.repeat'] = measure(
+            lambda: player.gamelogs(PlayerID='203399'), number)
+
+    previous = wnbAPI.setCache(wnbAPI.SQLiteCache(':memory:', ttl=None))
+    try:
+        def cached():
+            p = wnbAPI.Player()
+            p.setTransport(MemoryTransport(bodies))
+            p.gamelogs(PlayerID='203399')
+        cached()          # the first search fills the cache
+        results['search.cached'] = measure(cached, number)
+    finally:
+        wnbAPI.getCache().close()
+        wnbAPI.setCache(previous)
+    return results
+
+def dataFrames(bodies, number):
+    '''
+    times Search.dataFrame for each endpoint with a payload
+    '''
+    results = {}
+    for spec in endpoints:
+        if spec.url not in bodies:
+            continue
+        search = wnbAPI.Search()
+        search.setTransport(MemoryTransport(bodies))
+        search.search(spec.url, spec.requiredParams, {})
+        results['dataFrame.' + spec.url.rsplit('/', 1)[-1]] = measure(
+                search.dataFrame, number)
+    return results
+
+def pbpFlattening(rows, number):
+    '''
+    times flattening a full game of play by play, rows plays a period
+    '''
+    data = syntheticPbp('/1041900405_full_pbp.json', rows)
+    body = json.dumps(data).encode('utf-8')
+    game = wnbAPI.Game()
+    game.setTransport(MemoryTransport({game.pbpURL(Period=''): body}))
+    return {'pbp.array': measure(lambda: wnbAPI.pbpArray(data), number),
+            'pbp.frame': measure(lambda: game.pbpFrame(Period=''), number)}
+
+def batchThroughput(requests, workers, latency, rows):
+    '''
+    times Player.batch of requests distinct searches against a
+    StubServer, and returns requests per second
+    '''
+    with StubServer(latency=latency, rows=rows, seed=0) as server:
+        previous = wnbAPI.setTransport(server.transport(poolSize=workers))
+        try:
+            paramSets = [{'PlayerID': str(i)} for i in range(requests)]
+            start = time.perf_counter()
+            results = wnbAPI.Player.batch('gamelogs', paramSets, workers)
+            elapsed = time.perf_counter() - start
+        finally:
+            wnbAPI.setTransport(previous)
+    errors = sum(result.error is not None for result in results)
+    return {'batch.throughput': {'calls': requests, 'errors': errors,
+                                 'seconds': elapsed,
+                                 'value': requests / elapsed,
+                                 'unit': 'requests/second'}}
+
+def environment():
+    '''
+    returns a dictionary describing the run
+    '''
+    try:
+        commit = subprocess.check_output(
+                ['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL,
+                cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {'python': platform.python_version(),
+            'platform': platform.platform(),
+            'commit': commit,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S')}
+
+def compare(old, new, threshold):
+    '''
+    returns a list of (name, old, new) for every benchmark in new more
+    than threshold slower than in old
+    '''
+    slower = []
+    for name, result in new['results'].items():
+        before = old['results'].get(name)
+        if before is None or before.get('unit') != result.get('unit'):
+            continue
+        if result['unit'] == 'seconds':
+            was, now = before['median'], result['median']
+            worse = now > was * (1 + threshold)
+        else:                      # rates, where higher is better
+            was, now = before['value'], result['value']
+            worse = now < was / (1 + threshold)
+        if worse:
+            slower.append((name, was, now))
+    return slower
+
+def run(fixtures=None, rows=100, quick=False):
+    '''
+    runs every benchmark and returns the results dictionary
+    '''
+    number = 20 if quick else 200
+    bodies = recordedPayloads(fixtures) if fixtures else syntheticPayloads(rows)
+    results = {}
+    results['import.wnbAPI'] = importTime(max(number // 4, 5))
+    results['import.Player'] = importTime(max(number // 4, 5), 'wnbAPI.Player')
+    results.update(searchOverhead(number * 5))
+    results.update(dataFrames(bodies, max(number // 10, 2)))
+    results.update(pbpFlattening(rows, max(number // 10, 2)))
+    results.update(batchThroughput(100 if quick else 2000, 16, 0.002, rows))
+    return {'environment': environment(), 'results': results}
+
+def main():
+    parser = argparse.ArgumentParser(description='wnbAPI benchmarks')
+    parser.add_argument('--fixtures', default=None,
+                        help='directory of recorded fixtures to use')
+    parser.add_argument('--rows', type=int, default=100,
+                        help='rows in each synthetic result set')
+    parser.add_argument('--output', default='benchmark-results.json')
+    parser.add_argument('--compare', default=None,
+                        help='earlier results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2)
+    parser.add_argument('--quick', action='store_true')
+    args = parser.parse_args()
+
+    report = run(args.fixtures, args.rows, args.quick)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+    for name, result in sorted(report['results'].items()):
+        if result['unit'] == 'seconds':
+            print('%-50s %12.1f us' % (name, result['median'] * 1e6))
+        else:
+            print('%-50s %12.1f %s' % (name, result['value'], result['unit']))
+
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        slower = compare(old, report, args.threshold)
+        for name, was, now in slower:
+            print('SLOWER %s: %g -> %g' % (name, was, now))
+        if slower:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -10,4 +10,14 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-import wnbAPI
\ No newline at end of file
+import wnbAPI
+
+# replay recorded responses instead of hitting stats.wnba.com when
+# WNBAPI_FIXTURES names a fixture directory, or when Tests/fixtures holds
+# any (see the replay module). WNBAPI_FIXTURE_MODE=record records into it.
+fixtures = os.environ.get('WNBAPI_FIXTURES') or \
+           os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+fixtureMode = os.environ.get('WNBAPI_FIXTURE_MODE', 'replay')
+if os.environ.get('WNBAPI_FIXTURES') or fixtureMode == 'record' \
+        or len(wnbAPI.FixtureStore(fixtures)):
+    wnbAPI.setTransport(wnbAPI.ReplayTransport(fixtures, mode=fixtureMode))
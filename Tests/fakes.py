@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:14:40 2026
+
+Stand-in transports and responses shared by the test modules, so tests
+can run searches without touching the network.
+"""
+import json     # import json to encode canned bodies
+
+class RecordingTransport(object):
+    '''
+    Stand-in transport which records the requests it is asked to send
+    and returns a canned response body instead of touching the network.
+    '''
+    def __init__(self, body):
+        self.body = body
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        self.calls.append((url, dict(params or {})))
+        return CannedResponse(self.body)
+
+class CannedResponse(object):
+    '''
+    Minimal response object returned by RecordingTransport
+    '''
+    status_code = 200
+
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+    @property
+    def content(self):
+        return json.dumps(self.body).encode('utf-8')
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 12:52:30 2026
+
+Basic tests for the asyncsearch module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+from .fakes import RecordingTransport
+from .tests_decode_module_basic import pbp
+from wnbAPI.stubserver import StubServer
+import asyncio
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                  asyncsearch module tests                  ####
+####                                                            ####
+####################################################################
+
+class TestAsyncObjects(unittest.TestCase):
+    '''
+    Test async searches run through an AsyncTransport wrapping a
+    recording transport.
+    '''
+    def setUp(self):
+        self.fake = RecordingTransport({'resource': 'test'})
+        self.previous = wnbAPI.setAsyncTransport(
+                wnbAPI.AsyncTransport(transport=self.fake, concurrency=2))
+
+    def tearDown(self):
+        wnbAPI.setAsyncTransport(self.previous)
+
+    def test_initial_values(self):
+        '''
+        async objects should initialize like their blocking counterparts
+        '''
+        self.assertEqual(wnbAPI.AsyncGame().requiredParams, wnbAPI.Game().requiredParams)
+        self.assertEqual(wnbAPI.AsyncTeam().endpoints, wnbAPI.Team().endpoints)
+        self.assertIsInstance(wnbAPI.AsyncPlayer(), wnbAPI.Player)
+
+    def test_endpoint_method(self):
+        '''
+        endpoint methods should return awaitables giving the same data
+        and recording the same history as blocking searches
+        '''
+        p = wnbAPI.AsyncPlayer()
+        data = asyncio.run(p.career())
+        self.assertEqual(data, {'resource': 'test'})
+        self.assertEqual(p.pointer, data)
+        self.assertEqual(len(p.history), 1)
+        self.assertEqual(self.fake.calls[0][0], p.endpoints['career'])
+
+    def test_gather(self):
+        '''
+        concurrent searches on one object should each use their own params
+        '''
+        s = wnbAPI.AsyncSearch()
+        async def run():
+            return await asyncio.gather(*[s.search('endpoint', {}, {'TeamID': str(n)})
+                                          for n in range(5)])
+        results = asyncio.run(run())
+        self.assertEqual(len(results), 5)
+        self.assertEqual(sorted(call[1]['TeamID'] for call in self.fake.calls),
+                         ['0', '1', '2', '3', '4'])
+        self.assertEqual(len(s.data), 5)
+
+    def test_pbp(self):
+        '''
+        pbp should request the same URL as the blocking method
+        '''
+        g = wnbAPI.AsyncGame(Season='2019')
+        asyncio.run(g.pbp())
+        self.assertEqual(self.fake.calls[0][0], wnbAPI.Game(Season='2019').pbpURL())
+
+class TestAsyncTransport(unittest.TestCase):
+    '''
+    Test which transport async requests are sent through
+    '''
+    def setUp(self):
+        self.previous = wnbAPI.getTransport()
+        self.addCleanup(wnbAPI.setTransport, self.previous)
+
+    def test_installed_transport(self):
+        '''
+        a transport installed with setTransport() should answer async
+        requests too
+        '''
+        fake = RecordingTransport({'resource': 'test'})
+        wnbAPI.setTransport(fake)
+        p = wnbAPI.AsyncPlayer()
+        p.setAsyncTransport(wnbAPI.AsyncTransport())
+        self.assertEqual(asyncio.run(p.career()), {'resource': 'test'})
+        self.assertEqual(fake.calls[0][0], p.endpoints['career'])
+
+    @unittest.skipUnless(wnbAPI.asyncsearch.aiohttp, 'aiohttp is not installed')
+    def test_single_flight(self):
+        '''
+        identical aiohttp requests in flight at once should be sent once
+        '''
+        server = StubServer(latency=0.05).start()
+        self.addCleanup(server.stop)
+        wnbAPI.setTransport(wnbAPI.Transport())
+        transport = wnbAPI.AsyncTransport()
+        url = server.localURL('https://stats.wnba.com/stats/teamdetails')
+        async def run():
+            try:
+                return await asyncio.gather(
+                        *[transport.get(url, {'TeamID': teamID})
+                          for teamID in ['1', '1', '1', '2']])
+            finally:
+                await transport.close()
+        responses = asyncio.run(run())
+        self.assertTrue(all(r.status_code == 200 for r in responses))
+        self.assertEqual(server.stats['requests'], 2)
+        self.assertEqual(transport.stats['shared'], 2)
+
+class TestAsyncMethods(unittest.TestCase):
+    '''
+    Test the coroutine versions of the methods which send requests
+    '''
+    def test_pbp_frame(self):
+        '''
+        pbpFrame should await pbp and return a DataFrame
+        '''
+        g = wnbAPI.AsyncGame()
+        g.setAsyncTransport(wnbAPI.AsyncTransport(
+                transport=RecordingTransport(pbp)))
+        plays = asyncio.run(g.pbpFrame(GameID='1041900405'))
+        self.assertEqual(len(plays), 3)
+
+    def test_batch(self):
+        '''
+        batch should await every call, dedupe identical ones, and report
+        failures per item
+        '''
+        fake = RecordingTransport({'resource': 'playergamelogs'})
+        previous = wnbAPI.setAsyncTransport(wnbAPI.AsyncTransport(transport=fake))
+        self.addCleanup(wnbAPI.setAsyncTransport, previous)
+        results = asyncio.run(wnbAPI.AsyncPlayer.batch(
+                'gamelogs', [{'PlayerID': 1}, {'PlayerID': '1'},
+                             {'PlayerID': 2}], max_workers=2, Season='2019'))
+        self.assertEqual([r.data for r in results],
+                         [{'resource': 'playergamelogs'}] * 3)
+        self.assertEqual(len(fake.calls), 2)
+        self.assertEqual(fake.calls[0][1]['Season'], '2019')
+
+        results = asyncio.run(wnbAPI.AsyncTeam.batch('logo', [{'TeamID': 'x'}]))
+        self.assertIsInstance(results[0].error, KeyError)
+
+    def test_stream(self):
+        '''
+        stream should return a RowStream over the object's own transport,
+        without streaming other calls running at the same time
+        '''
+        server = StubServer(rows=3).start()
+        self.addCleanup(server.stop)
+        p = wnbAPI.AsyncPlayer()
+        p.setTransport(server.transport())
+        async def run():
+            return await asyncio.gather(p.stream('gamelogs'), p.career())
+        rows, career = asyncio.run(run())
+        self.assertEqual(len(list(rows)), 3)
+        self.assertIn('resultSets', career)
+        self.assertIsNone(p.streaming)
+        self.assertEqual(server.stats['requests'], 2)
+
+    def test_object_transport(self):
+        '''
+        a Transport handed to the object should be used instead of the
+        shared AsyncTransport
+        '''
+        shared = RecordingTransport({'resource': 'shared'})
+        own = RecordingTransport({'resource': 'own'})
+        previous = wnbAPI.setAsyncTransport(wnbAPI.AsyncTransport(transport=shared))
+        self.addCleanup(wnbAPI.setAsyncTransport, previous)
+        p = wnbAPI.AsyncPlayer()
+        p.setTransport(own)
+        self.assertEqual(asyncio.run(p.career()), {'resource': 'own'})
+        self.assertEqual(shared.calls, [])
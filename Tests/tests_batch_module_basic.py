@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:51:18 2026
+
+Basic tests for the batch module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+from .fakes import RecordingTransport
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                     batch module tests                     ####
+####                                                            ####
+####################################################################
+
+class TestBatch(unittest.TestCase):
+    '''
+    Test running endpoint methods over many param sets
+    '''
+    def setUp(self):
+        self.fake = RecordingTransport({'resource': 'playergamelogs'})
+        self.previous = wnbAPI.setTransport(self.fake)
+
+    def tearDown(self):
+        wnbAPI.setTransport(self.previous)
+
+    def test_isolated_params_and_order(self):
+        '''
+        every call should use its own params, shared params should be
+        applied to all calls, and results should come back in order
+        '''
+        paramSets = [{'PlayerID': str(n)} for n in range(10)]
+        results = wnbAPI.Player.batch('gamelogs', paramSets, max_workers=4,
+                                      Season='2018')
+        self.assertEqual([r.params for r in results], paramSets)
+        self.assertTrue(all(r.error is None for r in results))
+        sent = sorted((call[1]['PlayerID'], call[1]['Season']) for call in self.fake.calls)
+        self.assertEqual(sent, [(str(n), '2018') for n in range(10)])
+
+    def test_dedupe(self):
+        '''
+        identical requests should only be sent once, including ones that
+        differ only in params the endpoint ignores
+        '''
+        results = wnbAPI.Player.batch('gamelogs', [{'PlayerID': 1}, {'PlayerID': '1'},
+                                                   {'PlayerID': 2},
+                                                   {'PlayerID': 2, 'TopX': '10'}])
+        self.assertEqual(len(results), 4)
+        self.assertEqual(len(self.fake.calls), 2)
+        self.assertEqual(results[0].data, results[1].data)
+        self.assertEqual(results[3].params, {'PlayerID': 2, 'TopX': '10'})
+
+    def test_failures(self):
+        '''
+        failures should be reported per item without stopping the batch
+        '''
+        results = wnbAPI.Team.batch('logo', [{'TeamID': 'not a team'},
+                                             {'TeamID': '1611661322'}])
+        self.assertIsInstance(results[0].error, KeyError)
+        self.assertIsNone(results[0].data)
+        self.assertIsNone(results[1].error)
+        self.assertEqual(self.fake.calls[0][0], 'https://stats.wnba.com/media/img/teams/logos/WAS.svg')
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:41:27 2026
+
+Basic tests for the cache module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+from .fakes import RecordingTransport
+import os
+import tempfile
+import time
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                     cache module tests                     ####
+####                                                            ####
+####################################################################
+
+class TestSQLiteCache(unittest.TestCase):
+    '''
+    Test storing, expiring and evicting results in a SQLiteCache
+    '''
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'cache.sqlite')
+        self.cache = wnbAPI.SQLiteCache(self.path)
+
+    def tearDown(self):
+        self.cache.close()
+        self.dir.cleanup()
+
+    def test_set_and_get(self):
+        '''
+        results should be returned for the same endpoint and params
+        regardless of the order the params were set in
+        '''
+        self.cache.set('endpoint', {'Season': '2018', 'TeamID': '1'}, {'a': [1, 2]})
+        self.assertEqual(self.cache.get('endpoint', {'TeamID': '1', 'Season': '2018'}),
+                         {'a': [1, 2]})
+        self.assertIsNone(self.cache.get('endpoint', {'TeamID': '2', 'Season': '2018'}))
+        self.assertIsNone(self.cache.get('other', {'TeamID': '1', 'Season': '2018'}))
+
+    def test_raw_bodies(self):
+        '''
+        raw bodies should be stored as they are, and be readable either
+        raw or parsed
+        '''
+        self.cache.set('endpoint', {'Season': '2018'}, b'{"a": [1, 2]}')
+        self.assertEqual(self.cache.get('endpoint', {'Season': '2018'}, raw=True),
+                         b'{"a": [1, 2]}')
+        self.assertEqual(self.cache.get('endpoint', {'Season': '2018'}),
+                         {'a': [1, 2]})
+
+    def test_persistence(self):
+        '''
+        results should survive closing and reopening the file
+        '''
+        self.cache.set('endpoint', {'Season': '2018'}, {'a': 1})
+        self.cache.close()
+        self.cache = wnbAPI.SQLiteCache(self.path)
+        self.assertEqual(self.cache.get('endpoint', {'Season': '2018'}), {'a': 1})
+
+    def test_season_ttl(self):
+        '''
+        past seasons are kept forever, the current season for minutes
+        '''
+        past = str(int(wnbAPI.currentSeason) - 1)
+        self.assertIsNone(self.cache.getTTL('endpoint', {'Season': past}))
+        self.assertEqual(self.cache.getTTL('endpoint', {'Season': wnbAPI.currentSeason}),
+                         wnbAPI.cache.CURRENT_SEASON_TTL)
+        self.assertEqual(self.cache.getTTL('endpoint', {}),
+                         wnbAPI.cache.CURRENT_SEASON_TTL)
+
+    def test_endpoint_ttl(self):
+        '''
+        endpoint rules should take priority, and expired or uncacheable
+        results should not be returned
+        '''
+        self.cache.endpointTTL = {'fast': 0.01, 'never': 0}
+        self.cache.set('fast', {}, {'a': 1})
+        self.cache.set('never', {}, {'a': 1})
+        self.assertIsNone(self.cache.get('never', {}))
+        time.sleep(0.02)
+        self.assertIsNone(self.cache.get('fast', {}))
+
+    def test_eviction(self):
+        '''
+        least recently used results should be evicted first once
+        the cache is over maxBytes
+        '''
+        self.cache.set('endpoint', {'n': 1}, {'a': 1})
+        size = self.cache.size()
+        self.cache.maxBytes = size * 2
+        self.cache.set('endpoint', {'n': 2}, {'a': 2})
+        # touch the first entry so the second is least recently used
+        time.sleep(0.01)
+        self.cache.get('endpoint', {'n': 1})
+        self.cache.set('endpoint', {'n': 3}, {'a': 3})
+        self.assertEqual(self.cache.get('endpoint', {'n': 1}), {'a': 1})
+        self.assertIsNone(self.cache.get('endpoint', {'n': 2}))
+        self.assertEqual(self.cache.get('endpoint', {'n': 3}), {'a': 3})
+        self.assertLessEqual(self.cache.size(), size * 2)
+
+class TestSearchWithCache(unittest.TestCase):
+    '''
+    Test that Search.search reads from and writes to the cache
+    '''
+    def setUp(self):
+        self.fake = RecordingTransport({'resource': 'teamdetails'})
+        self.previousTransport = wnbAPI.setTransport(self.fake)
+        self.previousCache = wnbAPI.setCache(wnbAPI.SQLiteCache(':memory:'))
+
+    def tearDown(self):
+        wnbAPI.setCache(self.previousCache).close()
+        wnbAPI.setTransport(self.previousTransport)
+
+    def test_search_uses_cache(self):
+        '''
+        a second Search object should be served from the cache
+        '''
+        first = wnbAPI.Search().search('endpoint', {}, {'TeamID': '1'})
+        second = wnbAPI.Search().search('endpoint', {}, {'TeamID': '1'})
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.fake.calls), 1)
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:49:02 2026
+
+Basic tests for the decode module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+from .fakes import RecordingTransport
+import numpy as np
+import pandas as pd
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                    decode module tests                     ####
+####                                                            ####
+####################################################################
+
+gamelogs = {'name': 'PlayerGameLogs',
+            'headers': ['PLAYER_ID', 'PLAYER_NAME', 'GAME_ID', 'MIN', 'PTS',
+                        'FG_PCT', 'PLUS_MINUS', 'NOTE'],
+            'rowSet': [[203399, 'Player One', '1021900405', 32, 21, 1, 4, None],
+                       [203399, 'Player One', '1021900406', 30.5, 9, 0.5, None, 'x']]}
+
+class TestColumns(unittest.TestCase):
+    '''
+    Test decoding result sets into typed columns
+    '''
+    def test_column_types(self):
+        '''
+        columns should get the dtype named by their header, falling back
+        to a more general type when the values don't fit it
+        '''
+        cols = dict(wnbAPI.decode.columns(gamelogs))
+        self.assertEqual(cols['PLAYER_ID'].dtype, np.int64)
+        self.assertEqual(cols['PTS'].dtype, np.int64)
+        self.assertEqual(cols['MIN'].dtype, np.float64)
+        # rates are floats even when every value is a whole number
+        self.assertEqual(cols['FG_PCT'].dtype, np.float64)
+        # nulls in number columns become NaN
+        self.assertTrue(np.isnan(cols['PLUS_MINUS'][1]))
+        # ids with leading zeros stay as text
+        self.assertEqual(cols['GAME_ID'].dtype, object)
+        self.assertEqual(cols['GAME_ID'][0], '1021900405')
+        self.assertEqual(list(cols['NOTE']), [None, 'x'])
+
+    def test_empty_result_set(self):
+        '''
+        a result set without rows should still have every column
+        '''
+        df = wnbAPI.decode.frame({'name': 'Empty', 'headers': ['A', 'B'],
+                                  'rowSet': []})
+        self.assertEqual(list(df.columns), ['A', 'B'])
+        self.assertEqual(len(df), 0)
+
+    def test_frame_matches_pandas(self):
+        '''
+        the DataFrame should hold the same values as one built by pandas
+        from the rowSet, including repeated headers
+        '''
+        resultSet = dict(gamelogs, headers=gamelogs['headers'][:-1] + ['PTS'])
+        df = wnbAPI.decode.frame(resultSet)
+        expected = pd.DataFrame(resultSet['rowSet'], columns=resultSet['headers'])
+        self.assertEqual(list(df.columns), list(expected.columns))
+        self.assertEqual(df.shape, expected.shape)
+        self.assertEqual(df.iloc[1, 1], expected.iloc[1, 1])
+        self.assertEqual(df.iloc[0, 4], expected.iloc[0, 4])
+
+    def test_frames(self):
+        '''
+        frames() should handle both resultSet and resultSets
+        '''
+        single = wnbAPI.decode.frames({'resultSet': gamelogs})
+        plural = wnbAPI.decode.frames({'resultSets': [gamelogs]})
+        self.assertEqual(list(single), ['PlayerGameLogs'])
+        self.assertEqual(list(plural), ['PlayerGameLogs'])
+        self.assertIsNone(wnbAPI.decode.frames({'resource': 'none'}))
+
+pbp = {'g': {'gid': '1041900405',
+             'pd': [{'p': 1, 'pla': [
+                        {'evt': 2, 'cl': '09:42', 'de': 'Jump Shot', 'locX': -120,
+                         'locY': 35, 'opt1': 2, 'opt2': 0, 'mtype': 1, 'etype': 1,
+                         'opid': '', 'tid': 1611661322, 'pid': 203399, 'hs': 2,
+                         'vs': 0, 'epid': '', 'oftid': 1611661322, 'ord': 20000},
+                        {'evt': 3, 'cl': '09:30', 'de': 'Timeout', 'locX': 0,
+                         'locY': -80, 'opt1': 0, 'opt2': 0, 'mtype': 0, 'etype': 9,
+                         'opid': '', 'tid': 1611661323, 'pid': 0, 'hs': 2,
+                         'vs': 0, 'epid': '', 'oftid': 1611661322, 'ord': 30000}]},
+                    {'p': 2, 'pla': [
+                        {'evt': 40, 'cl': '00:04.2', 'de': 'Layup', 'locX': 5,
+                         'locY': 10, 'opt1': 2, 'opt2': 0, 'mtype': 5, 'etype': 1,
+                         'opid': 1628276, 'tid': 1611661323, 'pid': 1627668,
+                         'hs': 2, 'vs': 2, 'epid': 1628890,
+                         'oftid': 1611661323, 'ord': 400000}]}]}}
+
+class TestPbp(unittest.TestCase):
+    '''
+    Test flattening play-by-play results
+    '''
+    def test_pbp_array(self):
+        '''
+        the plays of every period should be flattened into one typed table
+        '''
+        plays = wnbAPI.decode.pbpArray(pbp)
+        self.assertEqual(len(plays), 3)
+        self.assertEqual(list(plays['period']), [1, 1, 2])
+        self.assertEqual(list(plays['clock']), [582, 570, 4])
+        self.assertEqual(plays['locX'].dtype, np.int16)
+        self.assertEqual(list(plays['epid']), [0, 0, 1628890])
+        self.assertEqual(plays['de'][2], 'Layup')
+
+    def test_spatial_only(self):
+        '''
+        spatialOnly should leave out events without a court location
+        '''
+        df = wnbAPI.decode.pbpFrame(pbp, spatialOnly=True)
+        self.assertEqual(list(df['evt']), [2, 40])
+        self.assertEqual(df['locY'].dtype, np.int16)
+
+    def test_single_period(self):
+        '''
+        single period results should be read the same way
+        '''
+        period = {'g': {'gid': '1041900405', 'p': 2,
+                        'pla': pbp['g']['pd'][1]['pla']}}
+        plays = wnbAPI.decode.pbpArray(period)
+        self.assertEqual(list(plays['period']), [2])
+
+    def test_game_pbp_frame(self):
+        '''
+        Game.pbpFrame() should return the flattened plays of Game.pbp()
+        '''
+        g = wnbAPI.Game()
+        g.setTransport(RecordingTransport(pbp))
+        df = g.pbpFrame(GameID='1041900405')
+        self.assertEqual(df.shape, (3, len(wnbAPI.decode.pbpFields)))
+
+shotLocations = {
+    'resource': 'leaguedashteamshotlocations',
+    'resultSets': {
+        'name': 'ShotLocations',
+        'headers': [{'name': 'SHOT_CATEGORY', 'columnsToSkip': 2,
+                     'columnSpan': 3,
+                     'columnNames': ['Restricted Area', 'Mid-Range']},
+                    {'name': 'columns', 'columnSpan': 1,
+                     'columnNames': ['TEAM_ID', 'TEAM_NAME', 'FGM', 'FGA',
+                                     'FG_PCT', 'FGM', 'FGA', 'FG_PCT']}],
+        'rowSet': [[1611661322, 'Washington Mystics', 10, 16, 0.625, 5, 13, 0.385],
+                   [1611661323, 'Connecticut Sun', 12, 20, 0.6, 4, 12, None]]}}
+
+class TestMultiLevelHeaders(unittest.TestCase):
+    '''
+    Test decoding result sets with two rows of headers
+    '''
+    def test_flat_names(self):
+        '''
+        two level headers should be flattened into group.stat names, typed
+        by the stat
+        '''
+        df = wnbAPI.decode.frames(shotLocations)['ShotLocations']
+        self.assertEqual(list(df.columns)[:4], ['TEAM_ID', 'TEAM_NAME',
+                                                'Restricted Area.FGM',
+                                                'Restricted Area.FGA'])
+        self.assertEqual(df['Mid-Range.FGM'].dtype, np.int64)
+        self.assertEqual(df['Mid-Range.FG_PCT'].dtype, np.float64)
+
+    def test_multi_index(self):
+        '''
+        multiIndex should keep the header levels
+        '''
+        df = wnbAPI.decode.frame(shotLocations['resultSets'], multiIndex=True)
+        self.assertEqual(df[('Restricted Area', 'FGM')].tolist(), [10, 12])
+        self.assertEqual(df[('', 'TEAM_ID')].tolist(), [1611661322, 1611661323])
+
+    def test_long_frame(self):
+        '''
+        longFrame should return one row per row and group
+        '''
+        df = wnbAPI.decode.longFrame(shotLocations['resultSets'])
+        self.assertEqual(list(df.columns), ['TEAM_ID', 'TEAM_NAME',
+                                            'SHOT_CATEGORY', 'FGM', 'FGA', 'FG_PCT'])
+        self.assertEqual(len(df), 4)
+        self.assertEqual(df['SHOT_CATEGORY'].tolist(), ['Restricted Area'] * 2
+                                                       + ['Mid-Range'] * 2)
+        self.assertEqual(df['FGM'].tolist(), [10, 12, 5, 4])
+        self.assertEqual(df['TEAM_ID'].tolist()[2], 1611661322)
+
+    def test_lazy_result(self):
+        '''
+        lazy Results should decode two level headers the same way
+        '''
+        import json
+        r = wnbAPI.Result(json.dumps(shotLocations))
+        self.assertEqual(r.toFrame('ShotLocations').shape, (2, 8))
+        self.assertIsNone(r.parsed)
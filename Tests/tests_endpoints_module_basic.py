@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:58:12 2026
+
+Basic tests for the endpoints module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+from .fakes import RecordingTransport
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                    endpoints module tests                  ####
+####                                                            ####
+####################################################################
+
+class TestRegistry(unittest.TestCase):
+    '''
+    Test the classes built from the endpoint registry
+    '''
+    def test_class_endpoints(self):
+        '''
+        each class's endpoints dictionary should list the URL of each of
+        its endpoint methods
+        '''
+        team = wnbAPI.Team()
+        self.assertEqual(team.endpoints['yearByYearStats'],
+                         'https://stats.wnba.com/stats/teamyearbyyearstats')
+        for spec in wnbAPI.endpoints.endpoints:
+            if spec.kind == 'search':
+                continue
+            cls = getattr(wnbAPI, spec.kind.title())
+            self.assertEqual(cls().endpoints[spec.key], spec.url)
+            self.assertIs(getattr(cls, spec.method).endpoint, spec)
+
+    def test_method_searches(self):
+        '''
+        endpoint methods should search their URL with the class defaults,
+        then the method's defaults, then any forced params
+        '''
+        calls = []
+        league = wnbAPI.League()
+        league.search = lambda *args: calls.append(args)
+        league.statLeaders(PerMode='PerGame', Season='2018')
+        endpoint, requiredParams, params, forcedParams = calls[0]
+        self.assertEqual(endpoint, 'https://stats.wnba.com/stats/leagueLeaders')
+        self.assertEqual(requiredParams['StatCategory'], 'FT_PCT')
+        self.assertEqual(requiredParams['LeagueID'], '10')
+        self.assertEqual(params, {'PerMode': 'PerGame', 'Season': '2018'})
+        self.assertEqual(forcedParams, {'PerMode': 'Totals'})
+
+    def test_defaults_per_call(self):
+        '''
+        one method's defaults and forced params shouldn't stay in the
+        object's params and leak into the next method's search
+        '''
+        fake = RecordingTransport({'resultSets': []})
+        previous = wnbAPI.setTransport(fake)
+        self.addCleanup(wnbAPI.setTransport, previous)
+
+        player = wnbAPI.Player()
+        player.shotchartDetail()
+        player.career()
+        self.assertEqual(fake.calls[0][1]['PlayerID'], '0')
+        self.assertEqual(fake.calls[1][1]['PlayerID'], '203399')
+        self.assertNotIn('TeamID', fake.calls[1][1])
+
+        league = wnbAPI.League()
+        league.statLeaders(Season='2018')
+        league.players()
+        self.assertEqual(fake.calls[2][1]['PerMode'], 'Totals')
+        self.assertEqual(fake.calls[3][1]['PerMode'], 'PerGame')
+        self.assertEqual(fake.calls[3][1]['Season'], '2018')
+        self.assertEqual(league.getParams(), {'Season': '2018'})
+
+    def test_result_sets(self):
+        '''
+        the TABLES AND HEADERS section of each method docstring should be
+        read into its Endpoint
+        '''
+        resultSets = wnbAPI.Player.gamelogs.endpoint.resultSets
+        headers = resultSets['PlayerGameLogs']
+        self.assertEqual(headers[:3], ['SEASON_YEAR', 'PLAYER_ID', 'PLAYER_NAME'])
+        roster = wnbAPI.endpoints.registry['team.roster'].resultSets
+        self.assertEqual(sorted(roster), ['Coaches', 'CommonTeamRoster'])
+
+class TestSentParams(unittest.TestCase):
+    '''
+    Test that params an endpoint doesn't use aren't sent
+    '''
+    def setUp(self):
+        self.fake = RecordingTransport({'resource': 'test'})
+        self.previous = wnbAPI.setTransport(self.fake)
+
+    def tearDown(self):
+        wnbAPI.setTransport(self.previous)
+
+    def test_accepts(self):
+        '''
+        teamdetails accepts only TeamID, so nothing else should be sent
+        '''
+        wnbAPI.Team().details(TeamID='1611661313', Season='2019')
+        url, params = self.fake.calls[0]
+        self.assertEqual(params, {'TeamID': '1611661313'})
+
+    def test_ignores(self):
+        '''
+        ignored params should be left out of the request, and searches
+        which differ only in them should share one stored result
+        '''
+        player = wnbAPI.Player()
+        player.gamelogs(TopX='10')
+        url, params = self.fake.calls[0]
+        self.assertNotIn('TopX', params)
+        self.assertEqual(params['PlayerID'], '203399')
+        player.gamelogs(TopX='20')
+        self.assertEqual(len(self.fake.calls), 1)
+
+    def test_defaults_kept(self):
+        '''
+        ignored params which are default required params should still be
+        sent, since the API may refuse requests missing them
+        '''
+        wnbAPI.Player().clutch()
+        url, params = self.fake.calls[0]
+        self.assertIn('Rank', params)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:48:26 2026
+
+Basic tests for the export module. None of these tests touch the
+network. They are skipped if pyarrow isn't installed.
+"""
+from .context import wnbAPI
+from .fakes import RecordingTransport, CannedResponse
+from .tests_decode_module_basic import gamelogs, pbp
+import os
+import shutil
+import tempfile
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+####################################################################
+####                                                            ####
+####                    export module tests                     ####
+####                                                            ####
+####################################################################
+
+@unittest.skipUnless(pyarrow, 'pyarrow is not installed')
+class TestExport(unittest.TestCase):
+    '''
+    Test writing and reading back partitioned files
+    '''
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.fake = RecordingTransport({'resultSets': [gamelogs]})
+        self.previous = wnbAPI.setTransport(self.fake)
+
+    def tearDown(self):
+        wnbAPI.setTransport(self.previous)
+        shutil.rmtree(self.path)
+
+    def test_search_export(self):
+        '''
+        s.export() should write the pointer's result sets into partitions
+        named by its params, which readExport() should read back
+        '''
+        for fmt in ['parquet', 'arrow']:
+            for season in ['2018', '2019']:
+                p = wnbAPI.Player(Season=season, SeasonType='Regular Season')
+                p.gamelogs(PlayerID='203399')
+                files = p.export(self.path, format=fmt)
+                self.assertEqual(len(files), 1)
+                self.assertIn(os.path.join('Season=' + season,
+                                           'SeasonType=Regular Season'), files[0])
+
+            table = wnbAPI.readExport('playergamelogs', self.path,
+                                      format=fmt, Season='2019')
+            self.assertEqual(table.num_rows, 2)
+            self.assertEqual(str(table.schema.field('PTS').type), 'int64')
+            self.assertEqual(str(table.schema.field('GAME_ID').type), 'string')
+            self.assertEqual(table.column('PlayerID').to_pylist(), ['203399'] * 2)
+            self.assertEqual(wnbAPI.readExport('playergamelogs', self.path,
+                                               format=fmt).num_rows, 4)
+            shutil.rmtree(os.path.join(self.path, 'endpoint=playergamelogs'))
+
+    def test_other_params_kept_apart(self):
+        '''
+        exports which differ only in params that aren't partition keys
+        should be written to different files, and read back separately
+        '''
+        p = wnbAPI.Player(Season='2019', PlayerID='203399')
+        p.gamelogs(MeasureType='Base')
+        files = p.export(self.path)
+        p.gamelogs(MeasureType='Advanced', LastNGames='5')
+        files += p.export(self.path)
+        self.assertEqual(len(set(files)), 2)
+        self.assertEqual(os.path.dirname(files[0]), os.path.dirname(files[1]))
+        # the two searches' rows can't be read back together
+        with self.assertRaises(ValueError):
+            wnbAPI.readExport('playergamelogs', self.path)
+
+        # writing the same search again replaces its own file
+        p.gamelogs(MeasureType='Base', LastNGames='0')
+        self.assertEqual(p.export(self.path), files[:1])
+        table = wnbAPI.readExport('playergamelogs', self.path,
+                                  params=p.getPointerParams())
+        self.assertEqual(table.num_rows, 2)
+        with self.assertRaises(KeyError):
+            wnbAPI.readExport('playergamelogs', self.path,
+                              params={'PlayerID': '1'})
+
+    def test_export_pbp_and_schedule(self):
+        '''
+        pbp results and schedules should be flattened and written
+        '''
+        wnbAPI.exportPbp(pbp, '2019', '1041900405', self.path)
+        plays = wnbAPI.readExport('pbp', self.path).to_pandas()
+        self.assertEqual(len(plays), 3)
+        self.assertEqual(str(plays['locY'].dtype), 'int16')
+
+        games = {'gscd': {'g': [{'gid': '1021900001', 'st': '3',
+                                 'h': {'tid': 1611661322, 's': '89'},
+                                 'v': {'tid': 1611661323, 's': '78'}}]}}
+        wnbAPI.exportSchedule(CannedResponse(games), '2019', '1611661322', self.path)
+        table = wnbAPI.readExport('schedule', self.path, TeamID=1611661322)
+        self.assertEqual(table.column('h.tid').to_pylist(), [1611661322])
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:30:02 2026
+
+Basic tests for the fingerprint module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+from .fakes import RecordingTransport
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                  fingerprint module tests                  ####
+####                                                            ####
+####################################################################
+
+class TestFingerprintFunctions(unittest.TestCase):
+    '''
+    Test normalizing params and building canonical keys
+    '''
+    def test_normalize_params(self):
+        '''
+        values should be converted to the strings the API receives
+        '''
+        self.assertEqual(wnbAPI.normalizeParams({'Season': 2019, 'Rank': True,
+                                                 'PlusMinus': False, 'Month': 3.0,
+                                                 'DateTo': None, 'TeamID': '1'}),
+                         {'Season': '2019', 'Rank': 'Y', 'PlusMinus': 'N',
+                          'Month': '3', 'TeamID': '1'})
+
+    def test_order_and_type_independent(self):
+        '''
+        insertion order and value types shouldn't change the key
+        '''
+        a = {'Season': 2019, 'TeamID': '1611661322'}
+        b = {'TeamID': 1611661322, 'Season': '2019'}
+        self.assertEqual(wnbAPI.canonicalParams('endpoint', a),
+                         wnbAPI.canonicalParams('endpoint', b))
+        self.assertEqual(wnbAPI.fingerprint('endpoint', a),
+                         wnbAPI.fingerprint('endpoint', b))
+        self.assertNotEqual(wnbAPI.fingerprint('endpoint', a),
+                            wnbAPI.fingerprint('other', a))
+
+    def test_accepted_params(self):
+        '''
+        params an endpoint doesn't accept should be left out of the key
+        '''
+        endpoint = 'https://stats.wnba.com/stats/teamdetails'
+        self.assertEqual(wnbAPI.canonicalParams(endpoint, {'TeamID': 1, 'Season': 2019}),
+                         'TeamID=1')
+        self.assertEqual(wnbAPI.canonicalParams('endpoint', {'TeamID': 1, 'Season': 2019}),
+                         'Season=2019&TeamID=1')
+
+class TestSearchKeys(unittest.TestCase):
+    '''
+    Test that Search dedupes searches on canonical keys
+    '''
+    def setUp(self):
+        self.fake = RecordingTransport({'resource': 'teamdetails'})
+        self.previous = wnbAPI.setTransport(self.fake)
+
+    def tearDown(self):
+        wnbAPI.setTransport(self.previous)
+
+    def test_repeat_search_skips_request(self):
+        '''
+        the same search with reordered, retyped params should be
+        served from session data
+        '''
+        s = wnbAPI.Search()
+        s.search('endpoint', {}, {'Season': 2019, 'TeamID': '1'})
+        s.clearParams()
+        s.search('endpoint', {}, {'TeamID': 1, 'Season': '2019'})
+        self.assertEqual(len(self.fake.calls), 1)
+        self.assertEqual(s.history[0], s.history[1])
+        self.assertEqual(self.fake.calls[0][1], {'Season': '2019', 'TeamID': '1'})
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:52:40 2026
+
+Basic tests for the functional module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+from .fakes import RecordingTransport
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                   functional module tests                  ####
+####                                                            ####
+####################################################################
+
+class TestFetch(unittest.TestCase):
+    '''
+    Test calling endpoint methods without objects
+    '''
+    def setUp(self):
+        self.fake = RecordingTransport({'resource': 'test'})
+        self.previous = wnbAPI.setTransport(self.fake)
+
+    def tearDown(self):
+        wnbAPI.setTransport(self.previous)
+
+    def test_same_request_as_method(self):
+        '''
+        fetch should send the same request as the endpoint method
+        '''
+        data = wnbAPI.fetch('player.gamelogs', PlayerID='1628276', Season='2019')
+        wnbAPI.Player().gamelogs(PlayerID='1628276', Season='2019')
+        self.assertEqual(data, {'resource': 'test'})
+        self.assertEqual(self.fake.calls[0], self.fake.calls[1])
+
+    def test_method_defaults(self):
+        '''
+        method level defaults, and params a method always sends, should
+        be read from the registry
+        '''
+        wnbAPI.fetch('League.statLeaders', PerMode='PerGame')
+        url, params = self.fake.calls[0]
+        self.assertEqual(url, 'https://stats.wnba.com/stats/leagueLeaders')
+        self.assertEqual(params['PerMode'], 'Totals')
+        self.assertEqual(params['StatCategory'], 'FT_PCT')
+        spec = wnbAPI.functional.endpoint('team.lineups')
+        self.assertEqual(spec.requiredParams['GroupQuantity'], '5')
+
+    def test_names(self):
+        '''
+        every endpoint method should be listed, and methods which don't
+        search shouldn't
+        '''
+        names = wnbAPI.endpointNames()
+        self.assertIn('game.scoreboardv2', names)
+        self.assertIn('team.shotchartDetail', names)
+        self.assertNotIn('game.pbp', names)
+        self.assertNotIn('team.logo', names)
+        with self.assertRaises(KeyError):
+            wnbAPI.fetch('player.nothing')
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:03:51 2026
+
+Basic tests for the hooks module. These tests only talk to a StubServer
+on localhost.
+"""
+from .context import wnbAPI
+from .fakes import RecordingTransport
+from wnbAPI.stubserver import StubServer
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                      hooks module tests                    ####
+####                                                            ####
+####################################################################
+
+class TestHooks(unittest.TestCase):
+    '''
+    Test the request events
+    '''
+    def setUp(self):
+        self.events = []
+        for event in wnbAPI.hooks.events:
+            wnbAPI.addHook(event, self.events.append)
+        self.addCleanup(wnbAPI.clearHooks)
+
+    def serve(self, **options):
+        '''
+        starts a StubServer and sets the shared transport to send to it
+        '''
+        server = StubServer(**options).start()
+        self.addCleanup(server.stop)
+        previous = wnbAPI.setTransport(server.transport(backoff=0.001))
+        self.addCleanup(wnbAPI.setTransport, previous)
+        return server
+
+    def names(self):
+        return [event['event'] for event in self.events]
+
+    def test_request_events(self):
+        '''
+        a search should raise start, response and parse events carrying
+        the endpoint, canonical params, bytes and timings
+        '''
+        self.serve(rows=3)
+        wnbAPI.Team().details(TeamID='1611661313', Season='2019')
+        self.assertEqual(self.names(), ['on_request_start', 'on_response',
+                                        'on_parse_done'])
+        response = self.events[1]
+        self.assertEqual(response['endpoint'], 'teamdetails')
+        self.assertEqual(response['params'], 'TeamID=1611661313')
+        self.assertEqual(response['status'], 200)
+        self.assertGreater(response['bytes'], 0)
+        timings = response['timings']
+        self.assertGreater(timings['firstByte'], 0)
+        self.assertGreater(timings['total'], timings['firstByte'])
+        self.assertEqual(self.events[2]['stage'], 'json')
+
+    def test_retry_events(self):
+        '''
+        every retried try should raise on_retry with its reason
+        '''
+        server = self.serve(errorRate=1.0)
+        wnbAPI.getTransport().retries = 2
+        wnbAPI.getTransport().get('https://stats.wnba.com/stats/teamdetails')
+        self.assertEqual(self.names(), ['on_request_start', 'on_retry'] * 2
+                                       + ['on_request_start', 'on_response'])
+        self.assertEqual(self.events[1]['reason'], 500)
+        self.assertEqual(self.events[-1]['attempts'], 3)
+        self.assertGreater(self.events[-1]['timings']['backoff'], 0)
+
+    def test_cache_and_dataframe_events(self):
+        '''
+        stored searches should raise on_cache_hit, and dataFrame should
+        raise on_parse_done
+        '''
+        previous = wnbAPI.setTransport(RecordingTransport(
+                {'resultSets': [{'name': 'A', 'headers': ['PTS'],
+                                 'rowSet': [[1]]}]}))
+        self.addCleanup(wnbAPI.setTransport, previous)
+        player = wnbAPI.Player()
+        player.gamelogs()
+        player.gamelogs()
+        player.dataFrame()
+        self.assertEqual(self.names(), ['on_parse_done', 'on_cache_hit',
+                                        'on_parse_done'])
+        self.assertEqual(self.events[1]['source'], 'data')
+        self.assertEqual(self.events[2]['stage'], 'dataFrame')
+        self.assertEqual(self.events[2]['endpoint'], 'playergamelogs')
+
+    def test_bad_hook(self):
+        '''
+        errors raised by hooks shouldn't stop the request, and unknown
+        events should be refused
+        '''
+        def broken(event):
+            raise RuntimeError('broken hook')
+        wnbAPI.addHook('on_response', broken)
+        self.serve()
+        self.assertEqual(wnbAPI.teamLogo().status_code, 200)
+        self.assertEqual(self.events[1]['endpoint'], 'logo')
+        with self.assertRaises(ValueError):
+            wnbAPI.addHook('on_nothing', broken)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:58:12 2026
+
+Basic tests for the lazy module, and for the lazy names of the package.
+None of these tests touch the network.
+"""
+from .context import wnbAPI
+from wnbAPI.lazy import LazyModule
+import os         # import os to find the package
+import subprocess # import subprocess to import the package in a fresh process
+import sys        # import sys to find the interpreter
+import unittest   # import unittest module
+                  #    - see docs.python.org/3/library/unittest.html
+
+# directory holding the package
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+def loadedAfter(code):
+    '''
+    runs code in a new interpreter after importing the package, and
+    returns the heavy modules it had imported by the end
+    '''
+    script = ('import sys, wnbAPI\n' + code + '\n'
+              'print(" ".join(m for m in ["numpy", "pandas", "aiohttp", '
+              '"wnbAPI.player", "wnbAPI.asyncsearch"] if m in sys.modules))')
+    output = subprocess.check_output([sys.executable, '-c', script], cwd=root)
+    return output.decode('utf-8').split()
+
+####################################################################
+####                                                            ####
+####                      lazy module tests                     ####
+####                                                            ####
+####################################################################
+
+class TestLazyImports(unittest.TestCase):
+    '''
+    Test that importing the package loads nothing heavy until it is used
+    '''
+    def test_import(self):
+        '''
+        import wnbAPI shouldn't load numpy, pandas, aiohttp or the
+        endpoint classes
+        '''
+        self.assertEqual(loadedAfter(''), [])
+
+    def test_endpoint_classes(self):
+        '''
+        the endpoint classes should be loaded on first use, still without
+        pandas
+        '''
+        self.assertEqual(loadedAfter('wnbAPI.Player'), ['wnbAPI.player'])
+        self.assertIn('wnbAPI.asyncsearch', loadedAfter('wnbAPI.AsyncPlayer'))
+
+    def test_dataframe(self):
+        '''
+        building a DataFrame should load numpy and pandas
+        '''
+        loaded = loadedAfter("wnbAPI.frame({'name': 'A', 'headers': ['PTS'], "
+                             "'rowSet': [[1]]})")
+        self.assertIn('numpy', loaded)
+        self.assertIn('pandas', loaded)
+
+    def test_result_sets(self):
+        '''
+        the registry's result sets should be read in a fresh process, so
+        the stub server still serves the documented headers
+        '''
+        script = ('from wnbAPI.stubserver import syntheticStats\n'
+                  'data = syntheticStats("https://stats.wnba.com/stats/'
+                  'playercareerstats", 1)\n'
+                  'print(data["resultSets"][0]["headers"][0])')
+        output = subprocess.check_output([sys.executable, '-c', script],
+                                         cwd=root)
+        self.assertEqual(output.decode('utf-8').strip(), 'PLAYER_ID')
+
+    def test_names(self):
+        '''
+        lazy names should be listed and exported like the rest
+        '''
+        for name in ['Player', 'AsyncGame', 'fetch', 'syncGamelogs']:
+            self.assertIn(name, dir(wnbAPI))
+            self.assertIn(name, wnbAPI.__all__)
+        self.assertIs(wnbAPI.Team, wnbAPI.team.Team)
+        with self.assertRaises(AttributeError):
+            wnbAPI.NoSuchName
+
+class TestLazyModule(unittest.TestCase):
+    '''
+    Test the module proxy
+    '''
+    def test_load(self):
+        '''
+        attributes should be read from the module once it is loaded
+        '''
+        proxy = LazyModule('json')
+        self.assertIn('not loaded', repr(proxy))
+        self.assertEqual(proxy.dumps([1]), '[1]')
+        self.assertIn('dumps', vars(proxy))
+
+    def test_missing(self):
+        '''
+        a missing module should raise an ImportError carrying the hint
+        '''
+        proxy = LazyModule('wnbAPI_no_such_module', hint='pip install it')
+        with self.assertRaises(ImportError) as e:
+            proxy.anything
+        self.assertIn('pip install it', str(e.exception))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:26:07 2026
+
+Basic tests for the metrics module. These tests only talk to a
+StubServer on localhost.
+"""
+from .context import wnbAPI
+from wnbAPI.stubserver import StubServer
+import asyncio  # import asyncio to run async requests
+import os       # import os to build file paths
+import shutil   # import shutil to remove temporary directories
+import socket   # import socket to receive sent metrics
+import tempfile # import tempfile to hold metric files
+import threading # import threading to receive sent metrics
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                     metrics module tests                   ####
+####                                                            ####
+####################################################################
+
+class TestMetricsAggregator(unittest.TestCase):
+    '''
+    Test counting requests and exporting them
+    '''
+    def setUp(self):
+        self.metrics = wnbAPI.MetricsAggregator().attach()
+        self.addCleanup(self.metrics.detach)
+        server = StubServer(errorRate=0.5, seed=1).start()
+        self.addCleanup(server.stop)
+        previous = wnbAPI.setTransport(server.transport(backoff=0.001,
+                                                        retries=10))
+        self.addCleanup(wnbAPI.setTransport, previous)
+        for teamID in ['1611661313', '1611661322', '1611661313']:
+            wnbAPI.Team().details(TeamID=teamID)
+        self.server = server
+
+    def test_render(self):
+        '''
+        totals should be rendered per endpoint in Prometheus text format
+        '''
+        text = self.metrics.render()
+        self.assertIn('# TYPE wnbapi_requests_total counter', text)
+        self.assertIn('wnbapi_requests_total{endpoint="teamdetails",'
+                      'status="200"} 3', text)
+        self.assertIn('wnbapi_request_seconds_count{endpoint="teamdetails",'
+                      'phase="total"} 3', text)
+        self.assertIn('wnbapi_request_seconds_bucket{endpoint="teamdetails",'
+                      'phase="total",le="+Inf"} 3', text)
+        self.assertIn('wnbapi_parse_seconds_count{endpoint="teamdetails",'
+                      'stage="json"} 3', text)
+        self.assertIn('wnbapi_retries_total{endpoint="teamdetails"}', text)
+
+    @unittest.skipUnless(wnbAPI.asyncsearch.aiohttp, 'aiohttp is not installed')
+    def test_async_requests(self):
+        '''
+        requests sent with aiohttp should be counted and timed too
+        '''
+        wnbAPI.setTransport(wnbAPI.Transport())
+        transport = wnbAPI.AsyncTransport(backoff=0.001, retries=10)
+        url = self.server.localURL(
+                'https://stats.wnba.com/stats/playercareerstats')
+        async def run():
+            try:
+                for playerID in ['1', '2']:
+                    await transport.get(url, {'PlayerID': playerID})
+            finally:
+                await transport.close()
+        asyncio.run(run())
+        text = self.metrics.render()
+        self.assertIn('wnbapi_requests_total{endpoint="playercareerstats",'
+                      'status="200"} 2', text)
+        for phase in ['firstByte', 'download', 'total']:
+            self.assertIn('wnbapi_request_seconds_count{endpoint='
+                          '"playercareerstats",phase="%s"} 2' % phase, text)
+        self.assertIn('wnbapi_retries_total{endpoint="playercareerstats"}',
+                      text)
+
+    def test_write_file(self):
+        '''
+        metrics should be written to a file
+        '''
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        filename = os.path.join(path, 'wnbapi.prom')
+        self.metrics.writeFile(filename)
+        with open(filename) as f:
+            self.assertEqual(f.read(), self.metrics.render())
+        self.assertEqual(os.listdir(path), ['wnbapi.prom'])
+
+    def test_send(self):
+        '''
+        metrics should be sent to a TCP socket
+        '''
+        listener = socket.socket()
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(1)
+        self.addCleanup(listener.close)
+        received = []
+        def receive():
+            connection, address = listener.accept()
+            with connection:
+                chunks = iter(lambda: connection.recv(65536), b'')
+                received.append(b''.join(chunks))
+        thread = threading.Thread(target=receive)
+        thread.start()
+        self.metrics.send(listener.getsockname())
+        thread.join(5)
+        self.assertEqual(received[0].decode('utf-8'), self.metrics.render())
+
+    def test_reset(self):
+        '''
+        reset should clear every total
+        '''
+        self.metrics.reset()
+        self.assertNotIn('teamdetails', self.metrics.render())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:54:12 2026
+
+Basic tests for the pipeline module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+from .fakes import CannedResponse
+from .tests_decode_module_basic import pbp
+import json
+import os
+import shutil
+import tempfile
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                   pipeline module tests                    ####
+####                                                            ####
+####################################################################
+
+class SeasonTransport(object):
+    '''
+    Stand-in transport which serves team schedules and play-by-play for
+    a small fake season. Games in missing get a 404.
+    '''
+    def __init__(self, missing=()):
+        self.missing = set(missing)
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        self.calls.append(url)
+        if url.endswith('_schedule.json'):
+            if '/mystics_' in url:
+                games = [{'gid': '1021900001', 'st': '3'},
+                         {'gid': '1021900002', 'st': '3'},
+                         {'gid': '1021900003', 'st': '1'}]
+            elif '/sun_' in url:
+                games = [{'gid': '1021900002', 'st': '3'}]
+            else:
+                return NotFound()
+            return CannedResponse({'gscd': {'g': games}})
+        gameID = url.rsplit('/', 1)[1].split('_')[0]
+        if gameID in self.missing:
+            return NotFound()
+        return CannedResponse(pbp)
+
+class NotFound(CannedResponse):
+    '''
+    Stand-in 404 response
+    '''
+    status_code = 404
+
+    def __init__(self):
+        pass
+
+    def json(self):
+        raise ValueError('No JSON object could be decoded')
+
+class TestSeasonPipeline(unittest.TestCase):
+    '''
+    Test downloading and storing a season of play-by-play
+    '''
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.fake = SeasonTransport(missing=['1021900002'])
+        self.previous = wnbAPI.setTransport(self.fake)
+
+    def tearDown(self):
+        wnbAPI.setTransport(self.previous)
+        shutil.rmtree(self.path)
+
+    def test_season_game_ids(self):
+        '''
+        every completed game should be listed once
+        '''
+        self.assertEqual(wnbAPI.seasonGameIDs('2019'),
+                         ['1021900001', '1021900002'])
+
+    def test_download_and_resume(self):
+        '''
+        games should be stored, failures recorded, and a second run
+        should skip stored games and retry failed ones
+        '''
+        first = wnbAPI.downloadSeasonPbp('2019', path=self.path)
+        self.assertEqual(first.downloaded, ['1021900001'])
+        self.assertEqual(list(first.failed), ['1021900002'])
+        self.assertTrue(os.path.exists(os.path.join(
+                first.path, 'GameID=1021900001.npz')))
+
+        self.fake.missing = set()
+        self.fake.calls = []
+        second = wnbAPI.downloadSeasonPbp('2019', path=self.path)
+        self.assertEqual(second.skipped, ['1021900001'])
+        self.assertEqual(second.downloaded, ['1021900002'])
+        self.assertEqual(second.failed, {})
+        self.assertFalse(any('1021900001_full' in url for url in self.fake.calls))
+
+        df = wnbAPI.loadSeasonPbp('2019', path=self.path)
+        self.assertEqual(len(df), 6)
+        self.assertEqual(sorted(set(df['GAME_ID'])), ['1021900001', '1021900002'])
+        self.assertEqual(str(df['locX'].dtype), 'int16')
+        self.assertEqual(df['de'][0], 'Jump Shot')
+
+    def test_missing_file_downloaded_once(self):
+        '''
+        a game listed as done whose file went missing should be downloaded
+        again, and still be listed once in the checkpoint
+        '''
+        self.fake.missing = set()
+        first = wnbAPI.downloadSeasonPbp('2019', path=self.path)
+        os.remove(os.path.join(first.path, 'GameID=1021900001.npz'))
+        second = wnbAPI.downloadSeasonPbp('2019', path=self.path)
+        self.assertEqual(second.downloaded, ['1021900001'])
+        with open(os.path.join(first.path, '_checkpoint.json')) as f:
+            self.assertEqual(json.load(f)['done'], ['1021900001', '1021900002'])
+
+    def test_int_game_ids(self):
+        '''
+        game ids passed as ints should be resumed like strings
+        '''
+        self.fake.missing = set()
+        first = wnbAPI.downloadSeasonPbp('2019', path=self.path,
+                                         gameIDs=[1021900001])
+        self.assertEqual(first.downloaded, ['1021900001'])
+        second = wnbAPI.downloadSeasonPbp('2019', path=self.path,
+                                          gameIDs=[1021900001])
+        self.assertEqual(second.skipped, ['1021900001'])
+        self.assertEqual(second.downloaded, [])
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:59:02 2026
+
+Basic tests for the replay module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+from .fakes import RecordingTransport, CannedResponse
+import shutil   # import shutil to remove temporary stores
+import tempfile # import tempfile to hold fixture stores
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                      replay module tests                   ####
+####                                                            ####
+####################################################################
+
+body = {'resource': 'playergamelogs',
+        'resultSets': [{'name': 'PlayerGameLogs',
+                        'headers': ['GAME_ID', 'PTS'],
+                        'rowSet': [['1021900201', 20],
+                                   ['1021900177', 31]]}]}
+
+class ErrorResponse(CannedResponse):
+    '''
+    Stand-in throttled response
+    '''
+    status_code = 429
+    headers = {}
+
+class TestReplayTransport(unittest.TestCase):
+    '''
+    Test recording responses and playing them back
+    '''
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.fake = RecordingTransport(body)
+        self.recorder = wnbAPI.ReplayTransport(self.path, mode='record',
+                                               transport=self.fake)
+        self.previous = wnbAPI.setTransport(self.recorder)
+
+    def tearDown(self):
+        wnbAPI.setTransport(self.previous)
+        shutil.rmtree(self.path)
+
+    def replay(self):
+        '''
+        switches the shared transport to replaying the store
+        '''
+        replayer = wnbAPI.ReplayTransport(self.path)
+        wnbAPI.setTransport(replayer)
+        return replayer
+
+    def test_record_and_replay(self):
+        '''
+        a recorded search should be played back without a request, even
+        with its params in another order or of other types
+        '''
+        recorded = wnbAPI.Player().gamelogs(PlayerID='203399', Season='2019')
+        self.assertEqual(len(self.fake.calls), 1)
+        self.assertEqual(len(self.recorder.store), 1)
+
+        replayer = self.replay()
+        replayed = wnbAPI.Player().gamelogs(Season=2019, PlayerID=203399)
+        self.assertEqual(replayed, recorded)
+        self.assertEqual(len(self.fake.calls), 1)
+        self.assertEqual(replayer.stats['replayed'], 1)
+
+    def test_errors_not_recorded(self):
+        '''
+        error responses should be returned but not recorded, unless
+        recordErrors is set
+        '''
+        self.fake.get = lambda url, params=None, timeout=None, **kwargs: \
+                ErrorResponse(body)
+        response = self.recorder.get('https://stats.wnba.com/stats/teamdetails',
+                                     {'TeamID': '1611661313'})
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(len(self.recorder.store), 0)
+        self.assertEqual(self.recorder.stats['unrecorded'], 1)
+
+        self.recorder.recordErrors = True
+        self.recorder.get('https://stats.wnba.com/stats/teamdetails',
+                          {'TeamID': '1611661313'})
+        self.assertEqual(len(self.recorder.store), 1)
+
+    def test_missing_fixture(self):
+        '''
+        replaying a request that wasn't recorded should raise KeyError
+        '''
+        self.replay()
+        with self.assertRaises(KeyError):
+            wnbAPI.Team().details(TeamID='1611661313')
+
+    def test_static_requests(self):
+        '''
+        pbp, schedule and logo requests should be replayed too
+        '''
+        game = wnbAPI.Game()
+        game.pbp(GameID='1041900405', Period='1')
+        wnbAPI.schedule('1611661324', '2019')
+        wnbAPI.teamLogo('1611661321')
+        self.assertEqual(len(self.recorder.store), 3)
+
+        self.replay()
+        self.assertEqual(game.pbp(GameID='1041900405', Period='1'), body)
+        self.assertEqual(wnbAPI.schedule('1611661324', '2019').json(), body)
+        self.assertEqual(wnbAPI.teamLogo('1611661321').status_code, 200)
+        self.assertEqual(len(self.fake.calls), 3)
+
+    def test_streamed_replay(self):
+        '''
+        streamed searches should read replayed responses in chunks
+        '''
+        wnbAPI.Player().gamelogs()
+        self.replay()
+        rows = list(wnbAPI.Player().stream('gamelogs'))
+        self.assertEqual(rows, [['1021900201', 20], ['1021900177', 31]])
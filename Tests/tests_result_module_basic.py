@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:31:20 2026
+
+Basic tests for the result module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+from .fakes import RecordingTransport
+import json
+import numpy as np
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+####################################################################
+####                                                            ####
+####                    result module tests                     ####
+####                                                            ####
+####################################################################
+
+scoreboard = {
+    'resource': 'scoreboardV2',
+    'parameters': {'GameDate': '07/27/2019', 'LeagueID': '10'},
+    'resultSets': [
+        {'name': 'GameHeader',
+         'headers': ['GAME_ID', 'GAME_STATUS_TEXT'],
+         'rowSet': [['1021900405', 'Final'], ['1021900406', 'Final']]},
+        {'name': 'LineScore',
+         'headers': ['GAME_ID', 'TEAM_ID', 'PTS', 'FG_PCT'],
+         'rowSet': [['1021900405', 1611661322, 79, 0.41],
+                    ['1021900405', 1611661323, 88, None]]}]}
+
+class TestResult(unittest.TestCase):
+    '''
+    Test lazily parsed results
+    '''
+    def setUp(self):
+        self.r = wnbAPI.Result(json.dumps(scoreboard).encode('utf-8'))
+
+    def test_result_set_without_parsing(self):
+        '''
+        a single result set should be decoded without parsing the body
+        '''
+        lineScore = self.r.resultSet('LineScore')
+        self.assertEqual(lineScore, scoreboard['resultSets'][1])
+        self.assertEqual(self.r.resultSet()['name'], 'GameHeader')
+        self.assertIsNone(self.r.parsed)
+        with self.assertRaises(KeyError):
+            self.r.resultSet('Nope')
+
+    def test_mapping(self):
+        '''
+        the result should behave like the parsed dictionary
+        '''
+        self.assertTrue(self.r)
+        self.assertEqual(self.r['parameters']['LeagueID'], '10')
+        self.assertEqual(dict(self.r), scoreboard)
+        self.assertEqual(self.r.resultSet('LineScore'), scoreboard['resultSets'][1])
+        self.assertFalse(wnbAPI.Result(b'{}'))
+
+    def test_to_frame(self):
+        '''
+        toFrame should build a typed DataFrame of one result set
+        '''
+        df = self.r.toFrame('LineScore')
+        self.assertEqual(list(df.columns), ['GAME_ID', 'TEAM_ID', 'PTS', 'FG_PCT'])
+        self.assertEqual(df['PTS'].dtype, np.int64)
+        self.assertIsNone(self.r.parsed)
+
+    @unittest.skipUnless(pyarrow, 'pyarrow is not installed')
+    def test_to_arrow(self):
+        '''
+        toArrow should build a typed pyarrow Table of one result set
+        '''
+        table = self.r.toArrow('LineScore')
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(str(table.schema.field('PTS').type), 'int64')
+        self.assertEqual(table.column('FG_PCT').null_count, 1)
+
+class TestLazySearch(unittest.TestCase):
+    '''
+    Test searches with lazy results turned on
+    '''
+    def setUp(self):
+        self.fake = RecordingTransport(scoreboard)
+        self.previous = wnbAPI.setTransport(self.fake)
+
+    def tearDown(self):
+        wnbAPI.setTransport(self.previous)
+
+    def test_lazy_search(self):
+        '''
+        searches should return, store and point to Results
+        '''
+        g = wnbAPI.Game()
+        g.setLazy()
+        r = g.search('https://stats.wnba.com/stats/scoreboardv2', {}, {})
+        self.assertIsInstance(r, wnbAPI.Result)
+        self.assertIs(g.pointer, r)
+        self.assertEqual(r.toFrame('LineScore').shape, (2, 4))
+        self.assertEqual(list(g.dataFrame()), ['GameHeader', 'LineScore'])
@@ -9,6 +9,11 @@ up.
 """
 from .context import wnbAPI
 #from context import wnbAPI
+from .fakes import CannedResponse
+import copy
+import pickle
+import threading
+import time
 import unittest # import unittest module
                 #    - see docs.python.org/3/library/unittest.html
 
@@ -381,4 +386,72 @@ class TestSearchObjectMethods(unittest.TestCase):
         self.assertEqual(type(t), dict)
         self.assertEqual(self.session.params, {'TeamID': '1611661322', 'paramsdict3':''})
         self.assertEqual(self.session.pointer, t)
-        
\ No newline at end of file
+        
+
+class EchoTransport(object):
+    '''
+    Stand-in transport which slowly answers with the params it was sent,
+    so calls made at the same time overlap
+    '''
+    def get(self, url, params=None, timeout=None, **kwargs):
+        time.sleep(0.01)
+        return CannedResponse({'parameters': dict(params or {})})
+
+class TestThreadSafeSearch(unittest.TestCase):
+    '''
+    Test sharing one thread-safe object between many threads
+    '''
+    def setUp(self):
+        self.player = wnbAPI.Player(Season='2019')
+        self.player.setTransport(EchoTransport())
+        self.player.setThreadSafe()
+
+    def test_call_params(self):
+        '''
+        every call should search with its own params, and leave the
+        object's params alone
+        '''
+        results = {}
+
+        def call(n):
+            data = self.player.gamelogs(PlayerID=str(n))
+            results[n] = data['parameters']
+        threads = [threading.Thread(target=call, args=(n,)) for n in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for n in range(20):
+            self.assertEqual(results[n]['PlayerID'], str(n))
+            self.assertEqual(results[n]['Season'], '2019')
+        self.assertEqual(self.player.params, {'Season': '2019'})
+        # every call is in history, and the index and pointer agree
+        self.assertEqual(len(self.player.history), 20)
+        key = self.player.history[self.player.index]
+        self.assertIs(self.player.data[key][1], self.player.pointer)
+
+    def test_snapshot_read_only(self):
+        '''
+        the params stored with a search shouldn't be changeable
+        '''
+        self.player.gamelogs(PlayerID='203399')
+        stored = self.player.data[self.player.history[-1]][0]
+        with self.assertRaises(TypeError):
+            stored['PlayerID'] = '1'
+        self.assertEqual(self.player.getPointerParams()['PlayerID'], '203399')
+
+    def test_copy_and_pickle(self):
+        '''
+        thread-safe objects, and their stored searches, should survive
+        deepcopy and pickle, each copy with its own lock
+        '''
+        self.player.gamelogs(PlayerID='203399')
+        for clone in [copy.deepcopy(self.player),
+                      pickle.loads(pickle.dumps(self.player))]:
+            self.assertIsNot(clone.lock, self.player.lock)
+            self.assertEqual(clone.history, self.player.history)
+            self.assertEqual(clone.getPointerParams()['PlayerID'], '203399')
+            self.assertEqual(clone.pointer, self.player.pointer)
+            clone.setTransport(EchoTransport())
+            self.assertEqual(clone.gamelogs(PlayerID='1')['parameters']
+                             ['PlayerID'], '1')
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:58:37 2026
+
+Basic tests for the store module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+from .fakes import RecordingTransport
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                     store module tests                     ####
+####                                                            ####
+####################################################################
+
+class TestResultStore(unittest.TestCase):
+    '''
+    Test the ResultStore on its own
+    '''
+    def test_unlimited(self):
+        '''
+        without limits the store should behave like a plain dict
+        '''
+        r = wnbAPI.ResultStore()
+        self.assertEqual(r, {})
+        for n in range(100):
+            r[('Test', n)] = ({}, n)
+        self.assertEqual(len(r), 100)
+        self.assertEqual(r.evictions, 0)
+
+    def test_max_entries(self):
+        '''
+        the least recently used entries should be evicted first
+        '''
+        r = wnbAPI.ResultStore(maxEntries=2)
+        r[('Test', 1)] = ({}, 1)
+        r[('Test', 2)] = ({}, 2)
+        r.get(('Test', 1))          # use 1, so 2 is evicted instead
+        r[('Test', 3)] = ({}, 3)
+        self.assertEqual(list(r), [('Test', 1), ('Test', 3)])
+        self.assertEqual(r.evictions, 1)
+
+    def test_max_bytes(self):
+        '''
+        the total size of the stored results should be kept under maxBytes,
+        but the newest result should always be kept
+        '''
+        r = wnbAPI.ResultStore(maxBytes=100)
+        r.put(('Test', 1), ({}, 1), size=60)
+        r.put(('Test', 2), ({}, 2), size=30)
+        self.assertEqual(r.bytes, 90)
+        r.put(('Test', 3), ({}, 3), size=500)
+        self.assertEqual(list(r), [('Test', 3)])
+        self.assertEqual(r.bytes, 500)
+        # unsized values are measured as JSON
+        r.setLimits(maxBytes=10)
+        r[('Test', 4)] = ({}, 'x' * 4)
+        self.assertEqual(r.bytes, 6)
+
+class TestSearchLimits(unittest.TestCase):
+    '''
+    Test bounded data and history on a Search object
+    '''
+    def setUp(self):
+        self.fake = RecordingTransport({'resource': 'teamdetails'})
+        self.previous = wnbAPI.setTransport(self.fake)
+        self.session = wnbAPI.Search()
+        self.url = 'https://stats.wnba.com/stats/teamdetails'
+
+    def tearDown(self):
+        wnbAPI.setTransport(self.previous)
+
+    def test_evicted_search_is_sent_again(self):
+        '''
+        a search whose result was evicted should be sent again
+        '''
+        self.session.setLimits(maxEntries=2)
+        for team in ['1', '2', '3', '1']:
+            self.session.search(self.url, {}, {'TeamID': team})
+        self.assertEqual(len(self.session.data), 2)
+        self.assertEqual(len(self.fake.calls), 4)
+
+    def test_history_ring_buffer(self):
+        '''
+        maxHistory should keep only the most recent searches
+        '''
+        self.session.setLimits(maxHistory=3)
+        for team in range(10):
+            self.session.search(self.url, {}, {'TeamID': team})
+        self.assertEqual(len(self.session.history), 3)
+        self.assertEqual(self.session.index, 2)
+        self.assertEqual(self.session.getPointerParams(), {'TeamID': 9})
+
+    def test_back_and_forw_skip_evicted(self):
+        '''
+        back() and forw() should skip searches whose results were evicted,
+        and getPointerParams() should still work for them
+        '''
+        self.session.setLimits(maxEntries=2)
+        for team in ['1', '2', '3']:
+            self.fake.body = {'TeamID': team}
+            self.session.search(self.url, {}, {'TeamID': team})
+        # history is [1, 2, 3], and the result of 1 was evicted
+        self.assertEqual(self.session.back(), {'TeamID': '2'})
+        self.assertEqual(self.session.back(), {'TeamID': '3'})
+        self.assertEqual(self.session.forw(), {'TeamID': '2'})
+        self.session.index = 0
+        self.assertEqual(self.session.getPointerParams(), {'TeamID': '1'})
+
+    def test_evicted_params_keep_blanks(self):
+        '''
+        params rebuilt for an evicted search should keep empty values
+        '''
+        self.session.setLimits(maxEntries=1)
+        url = 'https://stats.wnba.com/stats/playergamelogs'
+        params = {'PlayerID': '1', 'DateFrom': '', 'DateTo': ''}
+        self.session.search(url, {}, params)
+        self.session.search(url, {}, {'PlayerID': '2'})
+        self.session.index = 0
+        self.assertNotIn(self.session.history[0], self.session.data)
+        self.assertEqual(self.session.getPointerParams(), params)
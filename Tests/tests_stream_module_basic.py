@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:40:55 2026
+
+Basic tests for the stream module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+import io
+import json
+import requests # import requests to build an error response
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                    stream module tests                     ####
+####                                                            ####
+####################################################################
+
+body = json.dumps({
+    'resource': 'shotchartdetail',
+    'parameters': {'name': 'not a result set'},
+    'resultSets': [
+        {'name': 'Shot_Chart_Detail',
+         'headers': ['GAME_ID', 'LOC_X', 'LOC_Y', 'SHOT_MADE_FLAG'],
+         'rowSet': [['1021900405', -120, 35, 1],
+                    ['1021900405', 12345, 250, 0],
+                    ['1021900406', 0, 0, None]]},
+        {'name': 'LeagueAverages',
+         'headers': ['GRID_TYPE', 'FG_PCT'],
+         'rowSet': [['Shot Zone Basic', 0.4125]]}]}, indent=1)
+
+pbp = json.dumps({'g': {'gid': '1041900405',
+                        'pd': [{'p': 1, 'pla': [{'evt': 1}, {'evt': 2}]},
+                               {'p': 2, 'pla': [{'evt': 30}]}]}})
+
+def split(text, size):
+    '''
+    splits text into byte chunks of size, to test values split across
+    chunks
+    '''
+    data = text.encode('utf-8')
+    return [data[n:n + size] for n in range(0, len(data), size)]
+
+class StreamedResponse(object):
+    '''
+    Stand-in for a response requested with stream=True
+    '''
+    status_code = 200
+
+    def __init__(self, body):
+        self.body = body
+        self.closed = False
+
+    def iter_content(self, chunkSize):
+        return iter(split(self.body, 5))
+
+    def close(self):
+        self.closed = True
+
+class StreamingTransport(object):
+    '''
+    Stand-in transport which returns StreamedResponses
+    '''
+    def __init__(self, body):
+        self.body = body
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        self.calls.append((url, kwargs))
+        return StreamedResponse(self.body)
+
+class TestRowStream(unittest.TestCase):
+    '''
+    Test reading rows out of chunked bodies
+    '''
+    def test_first_result_set(self):
+        '''
+        with no name, the first result set should be streamed, whatever
+        size the chunks are
+        '''
+        for size in [1, 3, 64, 100000]:
+            rows = wnbAPI.RowStream(split(body, size))
+            self.assertEqual(list(rows), json.loads(body)['resultSets'][0]['rowSet'])
+            self.assertEqual(rows.name, 'Shot_Chart_Detail')
+            self.assertEqual(rows.headers[1], 'LOC_X')
+
+    def test_named_result_set(self):
+        '''
+        a result set should be found by name, and read as dicts
+        '''
+        rows = wnbAPI.RowStream(io.StringIO(body), name='LeagueAverages')
+        self.assertEqual(list(rows.dicts()),
+                         [{'GRID_TYPE': 'Shot Zone Basic', 'FG_PCT': 0.4125}])
+
+    def test_missing_result_set(self):
+        '''
+        a result set that isn't in the response should raise KeyError
+        '''
+        with self.assertRaises(KeyError):
+            list(wnbAPI.RowStream(body, name='Nope'))
+
+    def test_close(self):
+        '''
+        a stream used as a context manager should close its response,
+        even if it isn't read to the end
+        '''
+        response = StreamedResponse(body)
+        with wnbAPI.RowStream(response) as rows:
+            self.assertEqual(next(iter(rows))[0], '1021900405')
+        self.assertTrue(response.closed)
+
+    def test_error_status(self):
+        '''
+        an error response should raise its HTTP error, not KeyError
+        '''
+        response = requests.Response()
+        response.status_code = 404
+        response.url = 'https://stats.wnba.com/stats/shotchartdetail'
+        response.raw = io.BytesIO(b'Not Found')
+        with self.assertRaises(requests.HTTPError):
+            list(wnbAPI.RowStream(response))
+
+    def test_iter_array(self):
+        '''
+        iterArray should read the items of every array under a key
+        '''
+        plays = wnbAPI.iterArray(split(pbp, 4), 'pla')
+        self.assertEqual([p['evt'] for p in plays], [1, 2, 30])
+
+class TestSearchStream(unittest.TestCase):
+    '''
+    Test streaming endpoint methods
+    '''
+    def setUp(self):
+        self.fake = StreamingTransport(body)
+        self.previous = wnbAPI.setTransport(self.fake)
+
+    def tearDown(self):
+        wnbAPI.setTransport(self.previous)
+
+    def test_stream_method(self):
+        '''
+        s.stream() should send a streamed request, return its rows, and
+        not store the result
+        '''
+        p = wnbAPI.Player()
+        rows = p.stream('shotchartDetail', name='Shot_Chart_Detail', PlayerID='0')
+        self.assertEqual(len(list(rows)), 3)
+        self.assertTrue(self.fake.calls[0][1]['stream'])
+        self.assertEqual(len(p.history), 1)
+        self.assertEqual(p.data, {})
+        self.assertIsNone(p.streaming)
+
+    def test_stream_pbp(self):
+        '''
+        Game.pbp should be streamed play by play
+        '''
+        self.fake.body = pbp
+        plays = wnbAPI.Game().stream('pbp', GameID='1041900405')
+        self.assertEqual([p['evt'] for p in plays], [1, 2, 30])
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:59:58 2026
+
+Basic tests for the stubserver module. These tests only talk to a
+StubServer on localhost.
+"""
+from .context import wnbAPI
+from wnbAPI.stubserver import StubServer
+import shutil   # import shutil to remove temporary stores
+import tempfile # import tempfile to hold fixture stores
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                    stubserver module tests                 ####
+####                                                            ####
+####################################################################
+
+class TestStubServer(unittest.TestCase):
+    '''
+    Test searching against a local stand-in server
+    '''
+    def serve(self, **options):
+        '''
+        starts a StubServer and sets the shared transport to send to it
+        '''
+        server = StubServer(seed=0, **options).start()
+        self.addCleanup(server.stop)
+        transport = server.transport(retries=2, backoff=0.001)
+        previous = wnbAPI.setTransport(transport)
+        self.addCleanup(wnbAPI.setTransport, previous)
+        return server, transport
+
+    def test_synthetic_stats(self):
+        '''
+        stats routes should answer with the documented result sets
+        '''
+        server, transport = self.serve(rows=7)
+        data = wnbAPI.Player().gamelogs()
+        resultSet = data['resultSets'][0]
+        self.assertEqual(resultSet['name'], 'PlayerGameLogs')
+        self.assertEqual(resultSet['headers'],
+                wnbAPI.Player.gamelogs.endpoint.resultSets['PlayerGameLogs'])
+        self.assertEqual(len(resultSet['rowSet']), 7)
+        self.assertEqual(server.stats['requests'], 1)
+
+    def test_data_routes(self):
+        '''
+        pbp, schedule and logo routes should answer too
+        '''
+        self.serve(rows=3)
+        plays = wnbAPI.Game().pbpFrame(GameID='1041900405', Period='')
+        self.assertEqual(len(plays), 12)
+        games = wnbAPI.schedule('1611661324', '2019').json()['gscd']['g']
+        self.assertEqual(len(games), 3)
+        self.assertEqual(wnbAPI.teamLogo('1611661321').status_code, 200)
+
+    def test_errors_and_throttling(self):
+        '''
+        errors and 429s should be answered at the set rates, and retried
+        by the transport
+        '''
+        server, transport = self.serve(errorRate=1.0)
+        response = transport.get('https://stats.wnba.com/stats/teamdetails')
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(server.stats['errors'], 3)
+        self.assertEqual(transport.stats['retries'], 2)
+
+        server.errorRate, server.throttleRate = 0.0, 1.0
+        server.retryAfter = 0
+        response = transport.get('https://stats.wnba.com/stats/teamroster')
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers['Retry-After'], '0')
+        self.assertEqual(server.stats['throttled'], 3)
+
+    def test_fixture_store(self):
+        '''
+        recorded responses should be served instead of synthetic ones
+        '''
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        store = wnbAPI.FixtureStore(path)
+        url = 'https://stats.wnba.com/stats/teamdetails'
+        store.save(url, {'TeamID': '1611661313'},
+                   wnbAPI.FixtureResponse(url, 200, {}, b'{"recorded": 1}'))
+        self.serve(store=store)
+        self.assertEqual(wnbAPI.Team().details(TeamID='1611661313'),
+                         {'recorded': 1})
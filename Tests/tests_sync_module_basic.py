@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:41:09 2026
+
+Basic tests for the sync module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+from .fakes import CannedResponse
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                     sync module tests                      ####
+####                                                            ####
+####################################################################
+
+headers = ['PLAYER_ID', 'GAME_ID', 'GAME_DATE', 'PTS']
+
+class LogTransport(object):
+    '''
+    Stand-in gamelogs endpoint. Serves every game in self.games.
+    '''
+    def __init__(self, games):
+        self.games = games
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        params = dict(params or {})
+        self.calls.append(params)
+        rows = [[int(params['PlayerID'])] + game for game in self.games]
+        return CannedResponse({'resultSets': [{'name': 'PlayerGameLogs',
+                                               'headers': headers,
+                                               'rowSet': rows}]})
+
+class TestSync(unittest.TestCase):
+    '''
+    Test game log syncs
+    '''
+    def setUp(self):
+        self.fake = LogTransport([['1021900001', '2019-05-25T00:00:00', 10],
+                                  ['1021900002', '2019-05-28T00:00:00', 12]])
+        self.previous = wnbAPI.setTransport(self.fake)
+        self.store = wnbAPI.GamelogStore(':memory:')
+
+    def tearDown(self):
+        wnbAPI.setTransport(self.previous)
+        self.store.close()
+
+    def test_sync(self):
+        '''
+        the first sync should store the whole season, and later syncs
+        should only add new games
+        '''
+        first = wnbAPI.syncGamelogs('player', ['203399', '1628276'], '2019',
+                                    store=self.store)
+        self.assertEqual([r.new for r in first], [2, 2])
+        self.assertEqual(self.store.latest('player', '203399', '2019'),
+                         ('2019-05-28T00:00:00', '1021900002'))
+
+        self.fake.games.append(['1021900003', '2019-05-30T00:00:00', 25])
+        second = wnbAPI.syncGamelogs('player', ['203399'], '2019',
+                                     store=self.store)
+        self.assertEqual(second, [wnbAPI.SyncResult('203399', 1, None)])
+
+        df = self.store.frame('player', '203399', '2019')
+        self.assertEqual(list(df['PTS']), [25, 12, 10])
+
+    def test_store_required(self):
+        '''
+        syncing without a store should fail rather than keep the logs in
+        a file nobody asked for
+        '''
+        with self.assertRaises(TypeError):
+            wnbAPI.syncGamelogs('player', ['203399'], '2019')
+        self.assertEqual(self.fake.calls, [])
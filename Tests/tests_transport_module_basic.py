@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:40:12 2026
+
+Basic tests for the transport module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+from .fakes import RecordingTransport, CannedResponse
+#from context import wnbAPI
+import threading
+import time
+import requests # import requests to pass a session
+from http.server import HTTPServer, BaseHTTPRequestHandler
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                   transport module tests                   ####
+####                                                            ####
+####################################################################
+
+class TestTransportObject(unittest.TestCase):
+    '''
+    Test creation and configuration of Transport objects
+    '''
+    def test_default_headers(self):
+        '''
+        the transport should carry the package's default headers,
+        without sharing the resources module's dictionary
+        '''
+        t = wnbAPI.Transport()
+        self.assertEqual(t.session.headers['user-agent'],
+                         wnbAPI.headers['user-agent'])
+        t.session.headers['dnt'] = '0'
+        self.assertEqual(wnbAPI.headers['dnt'], '1')
+        t.close()
+
+    def test_session_headers(self):
+        '''
+        a session passed in should keep its own headers, with the
+        defaults added only where it sets none
+        '''
+        session = requests.Session()
+        session.headers['User-Agent'] = 'my-agent'
+        session.headers['X-Token'] = 'abc'
+        t = wnbAPI.Transport(session=session)
+        self.assertIs(t.session, session)
+        self.assertEqual(session.headers['user-agent'], 'my-agent')
+        self.assertEqual(session.headers['x-token'], 'abc')
+        self.assertEqual(session.headers['dnt'], wnbAPI.headers['dnt'])
+        t.close()
+
+    def test_pool_sizes(self):
+        '''
+        the default pool size should be mounted for every host, and
+        per-host pool sizes should take priority for their hosts
+        '''
+        t = wnbAPI.Transport(poolSize=4, hostPoolSizes={'stats.wnba.com': 32})
+        default = t.session.get_adapter('https://data.wnba.com/data')
+        stats = t.session.get_adapter('https://stats.wnba.com/stats/teamdetails')
+        self.assertEqual(default._pool_maxsize, 4)
+        self.assertEqual(stats._pool_maxsize, 32)
+        t.close()
+
+class TestSharedTransport(unittest.TestCase):
+    '''
+    Test that searches and convenience functions share the
+    module level transport, and that it can be replaced.
+    '''
+    def setUp(self):
+        self.fake = RecordingTransport({'resource': 'teamdetails'})
+        self.previous = wnbAPI.setTransport(self.fake)
+
+    def tearDown(self):
+        wnbAPI.setTransport(self.previous)
+
+    def test_get_transport(self):
+        '''
+        getTransport() should return the transport set by setTransport()
+        '''
+        self.assertIs(wnbAPI.getTransport(), self.fake)
+        self.assertIs(wnbAPI.Search().getTransport(), self.fake)
+
+    def test_created_once(self):
+        '''
+        threads asking for the shared transport before it exists should
+        all get the same one
+        '''
+        wnbAPI.setTransport(None)
+        barrier = threading.Barrier(8)
+        transports = []
+        def ask():
+            barrier.wait()
+            transports.append(wnbAPI.getTransport())
+        threads = [threading.Thread(target=ask) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(map(id, transports))), 1)
+        transports[0].close()
+
+    def test_search_uses_shared_transport(self):
+        '''
+        Search.search() should send its request through the shared transport
+        '''
+        s = wnbAPI.Search()
+        t = s.search('https://stats.wnba.com/stats/teamdetails', {}, {'TeamID':'1611661322'})
+        self.assertEqual(t, {'resource': 'teamdetails'})
+        self.assertEqual(self.fake.calls, [('https://stats.wnba.com/stats/teamdetails',
+                                            {'TeamID': '1611661322'})])
+
+    def test_logo_uses_shared_transport(self):
+        '''
+        the logo functions should send their request through the shared
+        transport
+        '''
+        wnbAPI.teamLogo()
+        self.assertEqual(self.fake.calls[0][0], 'https://stats.wnba.com/media/img/teams/logos/DAL.svg')
+
+    def test_object_transport(self):
+        '''
+        a transport handed to a single object should be used instead
+        of the shared one
+        '''
+        own = RecordingTransport({'g': {'gid': '1041900405'}})
+        g = wnbAPI.Game()
+        g.setTransport(own)
+        self.assertEqual(g.pbp()['g']['gid'], '1041900405')
+        self.assertEqual(len(own.calls), 1)
+        self.assertEqual(self.fake.calls, [])
+
+class ScriptedHandler(BaseHTTPRequestHandler):
+    '''
+    Local request handler which answers with the next status code in the
+    server's script, then 200 once the script runs out.
+    '''
+    def do_GET(self):
+        status = self.server.script.pop(0) if self.server.script else 200
+        self.send_response(status)
+        if status == 429:
+            self.send_header('Retry-After', '0')
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(b'{"status": %d}' % status)
+
+    def log_message(self, *args):
+        pass
+
+class TestRetriesAndRateLimits(unittest.TestCase):
+    '''
+    Test backoff, Retry-After and rate limiting against a local server
+    '''
+    def setUp(self):
+        self.server = HTTPServer(('127.0.0.1', 0), ScriptedHandler)
+        self.server.script = []
+        self.url = 'http://127.0.0.1:%d/stats/test' % self.server.server_port
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_retry_status_codes(self):
+        '''
+        retryable status codes should be retried until they succeed,
+        and counted
+        '''
+        self.server.script = [429, 503]
+        t = wnbAPI.Transport(backoff=0.01)
+        self.assertEqual(t.get(self.url).json(), {'status': 200})
+        self.assertEqual(t.stats['requests'], 3)
+        self.assertEqual(t.stats['retries'], 2)
+        self.assertEqual(t.stats['throttled'], 1)
+        t.close()
+
+    def test_retried_streams_closed(self):
+        '''
+        streamed responses which are retried should be closed, so their
+        connections go back to the pool
+        '''
+        self.server.script = [503, 503]
+        responses = []
+        class KeepingTransport(wnbAPI.Transport):
+            def request(self, *args, **kwargs):
+                responses.append(super().request(*args, **kwargs))
+                return responses[-1]
+        t = KeepingTransport(backoff=0.01)
+        self.assertEqual(t.get(self.url, stream=True).status_code, 200)
+        self.assertEqual([r.raw.closed for r in responses], [True, True, False])
+        t.close()
+
+    def test_retries_exhausted(self):
+        '''
+        the last response should be returned once retries run out
+        '''
+        self.server.script = [503, 503, 503]
+        t = wnbAPI.Transport(retries=2, backoff=0.01)
+        self.assertEqual(t.get(self.url).status_code, 503)
+        self.assertEqual(t.stats['requests'], 3)
+        t.close()
+
+    def test_retry_after(self):
+        '''
+        Retry-After should be read as seconds or as an HTTP date
+        '''
+        res = CannedResponse({})
+        res.headers = {'Retry-After': '3'}
+        self.assertEqual(wnbAPI.transport.retryAfter(res), 3.0)
+        res.headers = {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        self.assertEqual(wnbAPI.transport.retryAfter(res), 0.0)
+        res.headers = {}
+        self.assertIsNone(wnbAPI.transport.retryAfter(res))
+
+    def test_rate_limiter(self):
+        '''
+        the rate limiter should space requests to a host at its rate,
+        and record the time spent waiting
+        '''
+        limiter = wnbAPI.RateLimiter(hostRates={'127.0.0.1': 20})
+        t = wnbAPI.Transport(rateLimiter=limiter)
+        start = time.monotonic()
+        for n in range(5):
+            t.get(self.url)
+        self.assertGreaterEqual(time.monotonic() - start, 0.18)
+        self.assertGreater(t.stats['rateLimitWait'], 0.1)
+        # other hosts are unlimited
+        self.assertEqual(limiter.reserve('stats.wnba.com'), 0.0)
+        t.close()
+
+class SlowHandler(BaseHTTPRequestHandler):
+    '''
+    Local request handler which counts requests and answers slowly
+    '''
+    def do_GET(self):
+        self.server.count += 1
+        time.sleep(0.2)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(b'{"path": "%s"}' % self.path.encode('utf-8'))
+
+    def log_message(self, *args):
+        pass
+
+class TestSingleFlight(unittest.TestCase):
+    '''
+    Test sharing one fetch between identical concurrent requests
+    '''
+    def setUp(self):
+        self.server = HTTPServer(('127.0.0.1', 0), SlowHandler)
+        self.server.count = 0
+        self.url = 'http://127.0.0.1:%d/stats/test' % self.server.server_port
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def fetchAll(self, transports, params):
+        '''
+        gets self.url from every transport at once, with params[n] for
+        the nth, and returns the responses
+        '''
+        responses = [None] * len(transports)
+
+        def fetch(n):
+            responses[n] = transports[n].get(self.url, params[n])
+        threads = [threading.Thread(target=fetch, args=(n,))
+                   for n in range(len(transports))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return responses
+
+    def test_shared_fetch(self):
+        '''
+        identical requests in flight at once on one Transport should be
+        sent once and all get its response
+        '''
+        t = wnbAPI.Transport()
+        responses = self.fetchAll([t] * 6, [{'TeamID': '1611661322'}] * 6)
+        self.assertEqual(self.server.count, 1)
+        self.assertTrue(all(r is responses[0] for r in responses))
+        self.assertEqual(t.stats['shared'], 5)
+        # once it's finished, the same request is sent again
+        t.get(self.url, {'TeamID': '1611661322'})
+        self.assertEqual(self.server.count, 2)
+        t.close()
+
+    def test_separate_transports(self):
+        '''
+        different Transports, which may have different sessions, should
+        never share a response
+        '''
+        other = wnbAPI.Transport()
+        other.session.headers['X-Token'] = 'abc'
+        transports = [wnbAPI.Transport(), other]
+        responses = self.fetchAll(transports, [{'TeamID': '1611661322'}] * 2)
+        self.assertEqual(self.server.count, 2)
+        self.assertIsNot(responses[0], responses[1])
+        for t in transports:
+            t.close()
+
+    def test_different_requests(self):
+        '''
+        requests with different params, and Transports with single-flight
+        off, should each send their own request
+        '''
+        t = wnbAPI.Transport()
+        self.fetchAll([t, t], [{'TeamID': '1'}, {'TeamID': '2'}])
+        self.assertEqual(self.server.count, 2)
+        alone = wnbAPI.Transport(singleFlight=False)
+        self.fetchAll([alone, alone], [{'TeamID': '1'}] * 2)
+        self.assertEqual(self.server.count, 4)
+        t.close()
+        alone.close()
+
+    def test_shared_errors(self):
+        '''
+        callers sharing a call should all get its exception
+        '''
+        flight = wnbAPI.SingleFlight()
+        started = threading.Event()
+        errors = []
+
+        def fail():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError('failed')
+
+        def call():
+            try:
+                flight.do('key', fail)
+            except ValueError as e:
+                errors.append(e)
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=call)
+        follower.start()
+        leader.join()
+        follower.join()
+        self.assertEqual(len(errors), 2)
+        self.assertIs(errors[0], errors[1])
+        self.assertEqual(flight.calls, {})
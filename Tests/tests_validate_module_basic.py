@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:41:05 2026
+
+Basic tests for the validate module. None of these tests touch the
+network.
+"""
+from .context import wnbAPI
+from .fakes import RecordingTransport
+import unittest # import unittest module
+                #    - see docs.python.org/3/library/unittest.html
+
+####################################################################
+####                                                            ####
+####                    validate module tests                   ####
+####                                                            ####
+####################################################################
+
+class TestValidateParams(unittest.TestCase):
+    '''
+    Test that bad params fail before a request is sent
+    '''
+    def setUp(self):
+        self.fake = RecordingTransport({'resource': 'test'})
+        self.previous = wnbAPI.setTransport(self.fake)
+
+    def tearDown(self):
+        wnbAPI.setTransport(self.previous)
+
+    def test_param_list_examples(self):
+        '''
+        every example value in param_list should pass its check
+        '''
+        for param, check in wnbAPI.validate.checks.items():
+            examples = wnbAPI.param_list[param]
+            if isinstance(examples, str):   # LastNGames is a description
+                continue
+            for value in examples:
+                self.assertEqual(wnbAPI.validate.problems('', {param: value}),
+                                 [], param)
+
+    def test_defaults(self):
+        '''
+        every endpoint method's default params should pass
+        '''
+        for name in wnbAPI.endpointNames():
+            spec = wnbAPI.functional.endpoint(name)
+            self.assertEqual(wnbAPI.validate.problems(spec.url,
+                                                      spec.requiredParams),
+                             [], name)
+
+    def test_bad_value(self):
+        '''
+        a bad value should raise ValueError without sending a request, and
+        shouldn't be kept in params
+        '''
+        player = wnbAPI.Player()
+        with self.assertRaises(ValueError) as raised:
+            player.gamelogs(MeasureType='Basic', Season='19')
+        self.assertIn("MeasureType='Basic'", str(raised.exception))
+        self.assertIn("Season='19'", str(raised.exception))
+        self.assertEqual(self.fake.calls, [])
+        self.assertNotIn('MeasureType', player.params)
+        self.assertEqual(player.history, [])
+        with self.assertRaises(ValueError):
+            wnbAPI.fetch('team.clutch', PerMode='PerGames')
+        self.assertEqual(self.fake.calls, [])
+
+    def test_endpoint_rejects(self):
+        '''
+        values an endpoint is known to reject should fail, and values for
+        params an endpoint never sees shouldn't
+        '''
+        with self.assertRaises(ValueError):
+            wnbAPI.Player().gamelogs(MeasureType='Usage')
+        wnbAPI.Player().splits(MeasureType='Usage')
+        wnbAPI.Team().details(MeasureType='Basic')
+        self.assertEqual(len(self.fake.calls), 2)
+
+    def test_batch_fails_fast(self):
+        '''
+        bad searches in a batch should fail without being sent
+        '''
+        results = wnbAPI.Player.batch('gamelogs', [{'PlayerID': '203399'},
+                                                   {'PlayerID': 'Delle Donne'}])
+        self.assertIsNone(results[0].error)
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertEqual(len(self.fake.calls), 1)
+
+    def test_set_validation(self):
+        '''
+        turning validation off should let any value through
+        '''
+        previous = wnbAPI.setValidation(False)
+        try:
+            wnbAPI.Player().gamelogs(MeasureType='Basic')
+        finally:
+            wnbAPI.setValidation(previous)
+        self.assertEqual(self.fake.calls[0][1]['MeasureType'], 'Basic')
@@ -114,6 +114,14 @@ There are two ways to use the search objects.
            PlayerStats = Player().careerStats()
            or
            PlayerStats = Player(**params).careerStats()
+           
+  3.   Finally, any endpoint method can be called without an object at all, 
+       by name:
+           
+           PlayerStats = fetch('player.career', **params)
+           
+       This keeps no history, and is the cheapest way to make many calls. 
+       endpointNames() lists the names (see the functional module). 
             
 
 
@@ -210,7 +218,45 @@ def main(*args):
 
 '''
 from wnbAPI.search import *
-from wnbAPI.team import Team
-from wnbAPI.league import League
-from wnbAPI.game import Game
-from wnbAPI.player import Player
+
+import importlib
+
+# names loaded from their modules the first time they are used, so that
+# importing the package doesn't pay for the endpoint classes, aiohttp, or
+# (see the lazy module) numpy and pandas until something needs them
+lazyNames = {'Team': 'team', 'League': 'league', 'Game': 'game',
+             'Player': 'player'}
+lazyNames.update(dict.fromkeys(['AsyncSearch', 'AsyncPlayer', 'AsyncTeam',
+                                'AsyncLeague', 'AsyncGame', 'AsyncTransport',
+                                'getAsyncTransport', 'setAsyncTransport'],
+                               'asyncsearch'))
+lazyNames.update(dict.fromkeys(['downloadSeasonPbp', 'seasonGameIDs',
+                                'scoreboardGameIDs', 'loadGamePbp',
+                                'loadSeasonPbp', 'SeasonDownload'],
+                               'pipeline'))
+lazyNames.update(dict.fromkeys(['syncGamelogs', 'GamelogStore', 'SyncResult'],
+                               'sync'))
+lazyNames.update(dict.fromkeys(['fetch', 'endpointNames'], 'functional'))
+
+# submodules which aren't imported until they are used
+lazyModules = ['team', 'league', 'game', 'player', 'asyncsearch', 'pipeline',
+               'sync', 'functional']
+
+def __getattr__(name):
+    if name in lazyNames:
+        value = getattr(importlib.import_module('wnbAPI.' + lazyNames[name]),
+                        name)
+    elif name in lazyModules:
+        value = importlib.import_module('wnbAPI.' + name)
+    else:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    globals()[name] = value     # later reads don't come back here
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(lazyNames) | set(lazyModules))
+
+# from wnbAPI import * still gets every name, loading the lazy ones
+__all__ = sorted(set(name for name in globals() if not name.startswith('_'))
+                 - set(['importlib', 'lazyNames', 'lazyModules'])
+                 | set(lazyNames) | set(lazyModules))
@@ -0,0 +1,590 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 12:14:09 2026
+
+########################################################################
+####                                                                ####
+####                      asyncsearch module                        ####
+####                                                                ####
+########################################################################
+
+This module holds asyncio counterparts of the Search class hierarchy:
+
+    AsyncSearch()
+    AsyncPlayer()
+    AsyncTeam()
+    AsyncLeague()
+    AsyncGame()
+
+Each async class has the same methods, parameter handling and session
+history as its blocking counterpart. The difference is that every method
+which sends a request returns a coroutine, which has to be awaited: the
+endpoint methods, Game.pbp and pbpFrame, Team.logo and schedule, stream
+and batch.
+
+    p = AsyncPlayer(Season='2019')
+
+    career = await p.career(PlayerID='203399')
+
+    results = await AsyncPlayer.batch('gamelogs', [{'PlayerID': '203399'},
+                                                   {'PlayerID': '1628276'}])
+
+AsyncSearch.batch runs the calls concurrently on the event loop, no more
+than max_workers at once, instead of on a thread pool. stream returns the
+same RowStream as the blocking stream. When requests are sent with
+aiohttp, the body has already been read by the time it is returned, so
+only the parsing is done row by row.
+
+Because each search takes its own snapshot of the params before it starts
+waiting on the network, many searches can run concurrently, even on the
+same object:
+
+    logs = await asyncio.gather(*[AsyncPlayer().gamelogs(PlayerID=pid)
+                                  for pid in playerIDs])
+
+An object handed its own blocking Transport with s.setTransport() sends
+its async requests through it, in a thread pool, like its blocking
+searches. Otherwise requests are sent through an AsyncTransport, which holds a shared pool
+of keep-alive connections and a limit on the number of requests in
+flight at once (concurrency). If aiohttp is installed, the AsyncTransport
+uses it. Otherwise it runs the blocking requests of the package's shared
+Transport (see the transport module) in a thread pool, which still shares
+one connection pool.
+
+Either way, requests wait on the rate limiter shared by the process and
+failed requests are retried with backoff, exactly as they are by the
+blocking Transport. Identical requests in flight at once in the same
+event loop are sent once and share the response, like the blocking
+Transport's single-flight. Async and blocking requests don't share
+in-flight requests with each other.
+
+aiohttp is only used while the package's shared transport is a plain
+Transport. Once anything else is installed with setTransport() (i.e. a
+ReplayTransport, a StubServer's LocalTransport, or a test's stand-in),
+async requests are run on it in the thread pool instead, so they go
+wherever blocking requests go.
+
+    setAsyncTransport(AsyncTransport(concurrency=50))
+
+replaces the AsyncTransport shared by all async objects, and
+getAsyncTransport() returns it. A single object can be handed its own
+with s.setAsyncTransport(transport).
+"""
+import asyncio             # import asyncio to run searches concurrently
+import contextvars         # import contextvars to mark streamed calls
+import functools           # import functools to wrap blocking requests
+import json                # import json to decode aiohttp responses
+import time                # import time to time requests for the hooks
+from urllib.parse import urlsplit # import urlsplit to find hosts
+
+import requests            # import requests to raise its HTTPError
+
+try:                       # aiohttp is optional. without it, blocking
+    import aiohttp         # requests are run in a thread pool.
+except ImportError:
+    aiohttp = None
+
+from .search import (Search, DEBUG, headers, getTransport, sentParams,
+                     teamLogoURL, scheduleURL, pbpFrame, iterArray,
+                     RowStream, BatchResult, cachedSearch, parseSearch)
+from .batch import uniqueCalls
+from .transport import (Transport, Counters, Timings, getRateLimiter,
+                        retryStatuses, backoffDelay, retryAfter, flightKey)
+from .hooks import hooked, emit
+from .player import Player
+from .team import Team
+from .league import League
+from .game import Game
+
+# errors which cause an aiohttp request to be retried
+if aiohttp is not None:
+    retryErrors = (aiohttp.ClientError, asyncio.TimeoutError)
+else:
+    retryErrors = (asyncio.TimeoutError,)
+
+class AsyncResponse(object):
+    '''
+    Response returned by an AsyncTransport using aiohttp. Mirrors the
+    parts of requests.Response used by the package.
+    '''
+    def __init__(self, url, status_code, headers, content):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content.decode('utf-8'))
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        '''
+        returns an iterator over the body in chunks of chunk_size bytes,
+        so the response can be read by a RowStream
+        '''
+        content = self.content
+        step = chunk_size or len(content) or 1
+        for start in range(0, len(content), step):
+            chunk = content[start:start + step]
+            yield chunk.decode('utf-8') if decode_unicode else chunk
+
+    def raise_for_status(self):
+        '''
+        raises a requests.HTTPError if the status code is an error, like
+        requests.Response does
+        '''
+        if self.status_code >= 400:
+            raise requests.HTTPError('%s Error for url: %s'
+                                     % (self.status_code, self.url),
+                                     response=self)
+
+    def close(self):
+        pass
+
+    def __bool__(self):
+        # like requests.Response, responses are truthy unless they
+        # carry an error status code
+        return self.status_code < 400
+
+class AsyncTransport(object):
+    '''
+    Asyncio HTTP transport shared by all async searches.
+
+    await t.get(url, params) sends a GET request and returns the response.
+
+    No more than concurrency requests are in flight at once. Further
+    requests wait for a free slot.
+
+    await t.close() closes the pooled connections.
+    '''
+    def __init__(self, poolSize=10, concurrency=10, timeout=(4, 100),
+                 transport=None, retries=4, backoff=0.5, maxBackoff=30.0,
+                 rateLimiter=None):
+        '''
+        poolSize sets the number of keep-alive connections kept per host.
+
+        concurrency limits the number of requests in flight at once.
+
+        timeout is the default (connect, read) timeout.
+
+        transport is an optional blocking transport to run in a thread
+        pool. If it is passed, or aiohttp isn't installed, or the package's
+        shared transport isn't a plain Transport, requests are sent by it
+        (or by the shared transport) instead of by aiohttp, and the
+        blocking transport's retry settings are used. 
+
+        retries, backoff, maxBackoff and rateLimiter work as they do for
+        the blocking Transport (see the transport module).
+        '''
+        self.poolSize = poolSize
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.transport = transport
+        self.useAiohttp = aiohttp is not None and transport is None
+        self.retries = retries
+        self.backoff = backoff
+        self.maxBackoff = maxBackoff
+        self.rateLimiter = rateLimiter
+        self.counters = Counters('requests', 'retries', 'throttled',
+                                 'rateLimitWait', 'backoffWait', 'shared')
+
+        # the semaphore, aiohttp session and in-flight requests belong to
+        # an event loop, so they are created on the first request made in
+        # each loop.
+        self.loop = None
+        self.semaphore = None
+        self.session = None
+        self.flights = {}
+
+    def bind(self):
+        '''
+        creates the semaphore (and drops any aiohttp session) when the
+        transport is first used in a new event loop.
+        '''
+        loop = asyncio.get_running_loop()
+        if loop is not self.loop:
+            self.loop = loop
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+            self.session = None
+            self.flights = {}
+        return loop
+
+    def blockingTransport(self):
+        '''
+        returns the blocking transport requests are run on in the thread
+        pool, or None if they are sent with aiohttp
+        '''
+        if self.transport is not None:
+            return self.transport
+        transport = getTransport()
+        if not self.useAiohttp or type(transport) is not Transport:
+            # whatever setTransport() installed answers async requests too
+            return transport
+        return None
+
+    async def get(self, url, params=None, timeout=None, **kwargs):
+        '''
+        sends a GET request to url with params and returns the response.
+
+        if an identical request is already in flight in this event loop,
+        waits for it and returns its response instead.
+
+        other keyword arguments (i.e. stream=True) are passed to a
+        blocking transport. aiohttp requests always read the whole body.
+        '''
+        if timeout is None:
+            timeout = self.timeout
+        loop = self.bind()
+        transport = self.blockingTransport()
+        if transport is not None:
+            # the blocking transport does its own single-flight
+            async with self.semaphore:
+                return await loop.run_in_executor(
+                        None, functools.partial(transport.get, url,
+                                                params=params, timeout=timeout,
+                                                **kwargs))
+
+        if not getTransport().singleFlight:
+            return await self.limitedGet(url, params, timeout)
+        key = flightKey(url, params)
+        flight = self.flights.get(key)
+        if flight is None:
+            flight = self.flights[key] = loop.create_task(
+                    self.limitedGet(url, params, timeout))
+            flight.add_done_callback(lambda done: self.land(key, done))
+        else:
+            self.counters.add('shared')
+        # shielded, so one caller being cancelled doesn't cancel the
+        # request for everyone waiting on it
+        return await asyncio.shield(flight)
+
+    def land(self, key, flight):
+        '''
+        forgets a finished in-flight request, so later callers send it
+        again
+        '''
+        if self.flights.get(key) is flight:
+            del self.flights[key]
+
+    async def limitedGet(self, url, params, timeout):
+        '''
+        sends a GET request with aiohttp once one of the concurrency
+        slots is free
+        '''
+        async with self.semaphore:
+            return await self.aiohttpGet(url, params, timeout)
+
+    async def aiohttpGet(self, url, params, timeout):
+        '''
+        sends a GET request with aiohttp, waiting on the rate limiter and
+        retrying failed requests with backoff like Transport.get does. 
+
+        while hooks are added, raises the same request events, with the
+        same timings, as Transport.send (see the hooks module).
+        '''
+        limiter = self.rateLimiter if self.rateLimiter is not None \
+                  else getRateLimiter()
+        host = urlsplit(url).hostname
+        # only measure requests while someone is listening
+        timings = Timings() if hooked() else None
+
+        errors = []       # collect request errors to print on failure
+        attempt = 0       # count retries
+        while True:
+            await self.wait('rateLimitWait', limiter.reserve(host), timings,
+                            'rateLimit')
+            self.counters.add('requests')
+            if timings is not None:
+                emit('on_request_start', url, params, attempt=attempt)
+            try:
+                response = await self.aiohttpSend(url, params, timeout,
+                                                  timings)
+            except retryErrors as e:
+                errors.append({url: e})
+                if attempt >= self.retries:   # out of retries, give up
+                    print(errors)
+                    raise e
+                delay = None
+                reason = e
+            else:
+                if response.status_code not in retryStatuses \
+                        or attempt >= self.retries:
+                    if timings is not None:
+                        timings.bytes = len(response.content)
+                        emit('on_response', url, params,
+                             status=response.status_code,
+                             bytes=timings.bytes, attempts=attempt + 1,
+                             timings=timings.done())
+                    return response
+                if response.status_code == 429:
+                    self.counters.add('throttled')
+                delay = retryAfter(response)
+                reason = response.status_code
+
+            if delay is None:
+                delay = backoffDelay(attempt, self.backoff, self.maxBackoff)
+            self.counters.add('retries')
+            if timings is not None:
+                emit('on_retry', url, params, attempt=attempt, delay=delay,
+                     reason=reason)
+            await self.wait('backoffWait', delay, timings, 'backoff')
+            attempt += 1
+
+    async def wait(self, counter, delay, timings=None, phase=None):
+        '''
+        sleeps for delay seconds without blocking the event loop, and adds
+        the time to counter, and to phase of timings if timings are passed
+        '''
+        if delay > 0:
+            await asyncio.sleep(delay)
+            self.counters.add(counter, delay)
+            if timings is not None:
+                timings.add(phase, delay)
+
+    @property
+    def stats(self):
+        '''
+        returns a dictionary of the AsyncTransport's counters
+        '''
+        return self.counters.snapshot()
+
+    async def aiohttpSend(self, url, params, timeout, timings=None):
+        '''
+        sends one GET request with aiohttp and reads the whole response.
+        if timings is passed, the time until the headers arrive and the
+        time reading the body are added to it.
+        '''
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.poolSize,
+                                             limit_per_host=self.poolSize)
+            self.session = aiohttp.ClientSession(headers=dict(headers),
+                                                 connector=connector)
+        clientTimeout = aiohttp.ClientTimeout(sock_connect=timeout[0],
+                                              sock_read=timeout[1])
+        start = time.perf_counter()
+        async with self.session.get(url, params=params,
+                                    timeout=clientTimeout) as res:
+            if timings is not None:
+                timings.add('firstByte', time.perf_counter() - start)
+                start = time.perf_counter()
+            content = await res.read()
+            if timings is not None:
+                timings.add('download', time.perf_counter() - start)
+            return AsyncResponse(str(res.url), res.status,
+                                 dict(res.headers), content)
+
+    async def close(self):
+        '''
+        closes the aiohttp session, if one is open
+        '''
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+# the shared async transport. created on first use.
+_asyncTransport = None
+
+def getAsyncTransport():
+    '''
+    returns the AsyncTransport shared by async searches, creating it if
+    needed.
+    '''
+    global _asyncTransport
+    if _asyncTransport is None:
+        _asyncTransport = AsyncTransport()
+    return _asyncTransport
+
+def setAsyncTransport(transport):
+    '''
+    replaces the AsyncTransport shared by async searches and returns the
+    previous one (or None).
+    '''
+    global _asyncTransport
+    previous = _asyncTransport
+    _asyncTransport = transport
+    return previous
+
+# the object streaming a call in the current task, and the name of the
+# result set it streams. a context variable rather than the thread-local
+# Search uses, since many tasks share one thread.
+_streaming = contextvars.ContextVar('streaming', default=(None, None))
+
+class AsyncSearch(Search):
+    '''
+    Search with coroutine search, stream and batch methods. All other
+    methods behave the same as Search's.
+    '''
+    def __init__(self, **params):
+        # super() rather than Search.__init__, so that AsyncPlayer and
+        # friends run their blocking counterpart's __init__ as well.
+        super().__init__(**params)
+        self.asyncTransport = None # use the shared AsyncTransport unless
+                                   # one is set with setAsyncTransport()
+        self.wrappedTransport = None # AsyncTransport around the object's
+                                     # own Transport, if it has one
+
+    @property
+    def streaming(self):
+        obj, name = _streaming.get()
+        return name if obj is self else None
+
+    @streaming.setter
+    def streaming(self, value):
+        _streaming.set((self, value) if value is not None else (None, None))
+
+    def setAsyncTransport(self, transport):
+        '''
+        hands the object its own AsyncTransport. pass None to go back to
+        the shared AsyncTransport.
+        '''
+        self.asyncTransport = transport
+
+    def getAsyncTransport(self):
+        '''
+        returns the AsyncTransport the object sends its requests through:
+        its own AsyncTransport, or one running its own Transport (see
+        setTransport) in a thread pool, or the shared AsyncTransport.
+        '''
+        if self.asyncTransport is not None:
+            return self.asyncTransport
+        if self.transport is not None:
+            if self.wrappedTransport is None \
+                    or self.wrappedTransport.transport is not self.transport:
+                self.wrappedTransport = AsyncTransport(transport=self.transport)
+            return self.wrappedTransport
+        return getAsyncTransport()
+
+    async def search(self, endpoint, requiredParams, params, forcedParams=None):
+        '''
+        coroutine version of Search.search. accepts the same arguments
+        and returns the same data.
+        '''
+        key, searchParams = self._prepare(endpoint, requiredParams, params,
+                                          forcedParams)
+
+        # streamed searches return a RowStream, like Search.stream
+        if self.streaming is not None:
+            name = self.streaming if self.streaming is not True else None
+            datum = await self.getAsyncTransport().get(
+                    endpoint, params=sentParams(endpoint, searchParams),
+                    timeout=(4,100), stream=True)
+            return RowStream(datum, name)
+
+        stored = self._lookup(endpoint, key, searchParams)
+        if stored is not None:
+            return stored
+        cached = cachedSearch(endpoint, searchParams, self.lazy)
+        if cached is not None:
+            return self._store(key, searchParams, cached)
+
+        # the transport retries failed requests, like the blocking one
+        datum = await self.getAsyncTransport().get(
+                endpoint, params=sentParams(endpoint, searchParams), timeout=(4,100))
+        result, size = parseSearch(endpoint, searchParams, datum, self.lazy)
+        return self._store(key, searchParams, result, size)
+
+    async def stream(self, method, name=None, **params):
+        '''
+        coroutine version of Search.stream. returns a RowStream over the
+        rows of the result set called name.
+        '''
+        self.streaming = name if name is not None else True
+        try:
+            return await getattr(self, method)(**params)
+        finally:
+            self.streaming = None
+
+    @classmethod
+    async def batch(cls, method, paramSets, max_workers=8, **params):
+        '''
+        coroutine version of Search.batch. the calls run concurrently on
+        the event loop, no more than max_workers at once. returns a list
+        of BatchResults in the same order as paramSets.
+        '''
+        keys, unique = uniqueCalls(cls, method, paramSets)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def run(paramSet):
+            # each call gets its own object so params are never shared
+            async with semaphore:
+                return await getattr(cls(**params), method)(**paramSet)
+
+        outcomes = await asyncio.gather(*[run(paramSet)
+                                          for paramSet in unique.values()],
+                                        return_exceptions=True)
+        byKey = dict(zip(unique, outcomes))
+        results = []
+        for key, paramSet in zip(keys, paramSets):
+            outcome = byKey[key]
+            if isinstance(outcome, Exception):
+                results.append(BatchResult(paramSet, None, outcome))
+            elif isinstance(outcome, BaseException):
+                raise outcome          # i.e. the batch was cancelled
+            else:
+                results.append(BatchResult(paramSet, outcome, None))
+        return results
+
+class AsyncPlayer(AsyncSearch, Player):
+    '''
+    asyncio counterpart of Player. see the player module.
+    '''
+
+class AsyncTeam(AsyncSearch, Team):
+    '''
+    asyncio counterpart of Team. see the team module.
+    '''
+    async def logo(self, **params):
+        '''
+        coroutine version of Team.logo. returns a response object.
+        '''
+        params = self._callParams(params)
+
+        url = teamLogoURL(TeamID=params.get('TeamID','1611661328'))
+        return await self.getAsyncTransport().get(url)
+
+    async def schedule(self, **params):
+        '''
+        coroutine version of Team.schedule. returns a response object.
+        '''
+        params = self._callParams(params)
+
+        url = scheduleURL(TeamID=params.get('TeamID','1611661322'),
+                          Season=params.get('Season', '2019'))
+        return await self.getAsyncTransport().get(url)
+
+class AsyncLeague(AsyncSearch, League):
+    '''
+    asyncio counterpart of League. see the league module.
+    '''
+
+class AsyncGame(AsyncSearch, Game):
+    '''
+    asyncio counterpart of Game. see the game module.
+    '''
+    async def pbp(self, **params):
+        '''
+        coroutine version of Game.pbp. see Game.pbp for the format of
+        the returned data.
+        '''
+        url = self.pbpURL(**params)
+        if self.streaming is not None and DEBUG != True:
+            datum = await self.getAsyncTransport().get(url, stream=True)
+            return iterArray(datum, 'pla')
+        datum = await self.getAsyncTransport().get(url)
+        if DEBUG == True:
+            return datum
+        return datum.json()
+
+    async def pbpFrame(self, spatialOnly=False, **params):
+        '''
+        coroutine version of Game.pbpFrame
+        '''
+        data = await self.pbp(**params)
+        # DEBUG searches return the response object
+        if DEBUG == True:
+            data = data.json()
+        return pbpFrame(data, spatialOnly)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:20:44 2026
+
+########################################################################
+####                                                                ####
+####                         batch module                           ####
+####                                                                ####
+########################################################################
+
+This module runs one endpoint method over many sets of params at once.
+It is normally used through the batch class method that every Search
+subclass inherits:
+
+    results = Player.batch('gamelogs',
+                           [{'PlayerID': '203399'}, {'PlayerID': '1628276'}],
+                           max_workers=8, Season='2019')
+
+    - the first argument is the name of the endpoint method to call.
+    - the second is a list of param dictionaries, one per call.
+    - max_workers is the number of calls run at the same time on a
+      thread pool.
+    - any other keyword arguments are params shared by every call.
+
+Every call is made on its own new object, so the calls never see each
+other's params. Param sets which make identical requests are only sent
+once, and share the result.
+
+batch returns a list with one BatchResult per param set, in the same order
+as the param sets. A BatchResult is a named tuple of:
+    - params: the param set
+    - data: the data returned by the method, or None if it failed
+    - error: the exception raised by the method, or None if it worked
+
+A failing call never stops the rest of the batch:
+
+    for result in results:
+        if result.error:
+            print(result.params, result.error)
+"""
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .fingerprint import canonicalParams
+
+BatchResult = namedtuple('BatchResult', ['params', 'data', 'error'])
+
+def uniqueCalls(cls, method, paramSets):
+    '''
+    returns (keys, unique): the key of every param set in paramSets, and
+    an OrderedDict of {key: param set} with one param set per distinct
+    request. shared by batch and the async batch (see the asyncsearch
+    module).
+    '''
+    # raise AttributeError before anything is sent if there is no such
+    # method. methods built from the endpoint registry carry their URL,
+    # which the param filters are keyed by. 
+    spec = getattr(getattr(cls, method), 'endpoint', None)
+    endpoint = spec.url if spec is not None else method
+
+    # dedupe identical requests. canonicalParams ignores order, value
+    # types and params the endpoint ignores, so {'PlayerID': 1} and 
+    # {'PlayerID': '1'} are sent once.
+    keys = [canonicalParams(endpoint, paramSet) for paramSet in paramSets]
+    unique = OrderedDict()
+    for key, paramSet in zip(keys, paramSets):
+        unique.setdefault(key, paramSet)
+    return keys, unique
+
+def batch(cls, method, paramSets, max_workers=8, **params):
+    '''
+    calls cls(**params).method(**paramSet) for every param set in
+    paramSets, on a thread pool of max_workers threads, and returns a list
+    of BatchResults in the same order as paramSets.
+    '''
+    keys, unique = uniqueCalls(cls, method, paramSets)
+
+    def run(paramSet):
+        # each call gets its own object so params are never shared
+        return getattr(cls(**params), method)(**paramSet)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {key: pool.submit(run, paramSet)
+                   for key, paramSet in unique.items()}
+
+        results = []
+        for key, paramSet in zip(keys, paramSets):
+            try:
+                results.append(BatchResult(paramSet, futures[key].result(), None))
+            except Exception as e:
+                results.append(BatchResult(paramSet, None, e))
+    return results
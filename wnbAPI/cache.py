@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:05:51 2026
+
+########################################################################
+####                                                                ####
+####                         cache module                           ####
+####                                                                ####
+########################################################################
+
+This module holds the optional persistent response cache used by
+Search.search.
+
+    Search.data only lives as long as the Search object that holds it, so
+    every new process downloads the same historical seasons again even
+    though those results never change. A SQLiteCache stores the parsed
+    results of stats.wnba.com searches in a local SQLite file, compressed,
+    so later processes can read them back instead of touching the network.
+
+    No cache is used unless one is set:
+
+          setCache(SQLiteCache('wnba.sqlite'))
+
+          or
+
+          setCache(SQLiteCache('wnba.sqlite', maxBytes=50 * 2**20))
+
+    getCache() returns the cache currently in use (or None), and
+    setCache(None) turns caching off again.
+
+    Search.search looks in the cache after checking the object's own
+    session data, and before sending a request. Results are stored under
+    the search's fingerprint (see the fingerprint module).
+
+    How long an entry stays fresh is decided by TTL (time to live) rules:
+        - ttl is the default rule. it can be a number of seconds, None
+          to keep entries forever, or a function accepting
+          (endpoint, params) and returning either of those.
+        - endpointTTL is an optional dictionary of rules of the same kinds
+          keyed by endpoint URL, which take priority over ttl.
+        - a rule returning 0 means the result is never cached.
+
+    The default rule, seasonTTL, keeps results for past seasons forever and
+    results for the current season (or with no Season param at all) for
+    10 minutes.
+
+    When the stored results grow beyond maxBytes (compressed size), the
+    least recently used entries are evicted until the cache fits again.
+"""
+import json                # import json to serialize results
+import sqlite3             # import sqlite3 for the storage backend
+import threading           # import threading to lock the connection
+import time                # import time to timestamp entries
+import zlib                # import zlib to compress stored results
+
+from .resources import currentSeason
+from .fingerprint import fingerprint
+
+# current season results change as games are played, so they are only
+# kept for a short time by default.
+CURRENT_SEASON_TTL = 600
+
+def seasonTTL(endpoint, params):
+    '''
+    default TTL rule.
+
+    returns None (keep forever) for searches with a Season param earlier
+    than currentSeason, and CURRENT_SEASON_TTL seconds for everything else.
+    '''
+    season = str(params.get('Season', ''))
+    # seasons are usually '2019' but may be passed as '2019-20' or an int,
+    # so only compare the leading year.
+    if season[:4].isdigit() and int(season[:4]) < int(currentSeason):
+        return None
+    return CURRENT_SEASON_TTL
+
+class SQLiteCache(object):
+    '''
+    Persistent, size-bounded response cache stored in a SQLite file.
+
+    c.get(endpoint, params) returns the stored result, or None if nothing
+    fresh is stored.
+
+    c.set(endpoint, params, data) stores a result.
+
+    c.size() returns the total compressed size of stored results in bytes.
+
+    c.clear() deletes every stored result. c.close() closes the file.
+    '''
+    def __init__(self, path='wnbAPI_cache.sqlite', maxBytes=256 * 2**20,
+                 ttl=seasonTTL, endpointTTL=None):
+        '''
+        path is the SQLite file to use. It is created if it doesn't exist.
+        ':memory:' may be used for a cache which isn't persisted.
+
+        maxBytes is the maximum total compressed size of stored results.
+        None means unbounded.
+
+        ttl and endpointTTL are the TTL rules described in the module
+        documentation.
+        '''
+        self.path = path
+        self.maxBytes = maxBytes
+        self.ttl = ttl
+        self.endpointTTL = dict(endpointTTL or {})
+
+        # one connection is shared by all threads, guarded by a lock.
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('''CREATE TABLE IF NOT EXISTS responses (
+                                       key TEXT PRIMARY KEY,
+                                       endpoint TEXT,
+                                       expires REAL,
+                                       accessed REAL,
+                                       size INTEGER,
+                                       body BLOB)''')
+        self.connection.execute('''CREATE INDEX IF NOT EXISTS responses_accessed
+                                   ON responses (accessed)''')
+        self.connection.commit()
+
+    def getTTL(self, endpoint, params):
+        '''
+        returns the TTL for a search: a number of seconds, or None for
+        forever. endpointTTL rules take priority over the default rule.
+        '''
+        rule = self.endpointTTL.get(endpoint, self.ttl)
+        if callable(rule):
+            return rule(endpoint, params)
+        return rule
+
+    def get(self, endpoint, params, raw=False):
+        '''
+        returns the stored result for the endpoint/params combination, or
+        None if there is no fresh result stored.
+        
+        if raw is True, the result is returned as a JSON encoded bytes
+        body instead of being parsed. 
+        '''
+        key = fingerprint(endpoint, params)
+        now = time.time()
+        with self.lock:
+            row = self.connection.execute(
+                    'SELECT expires, body FROM responses WHERE key = ?',
+                    (key,)).fetchone()
+            if row is None:
+                return None
+            expires, body = row
+            # expired entries are deleted as soon as they are found
+            if expires is not None and expires <= now:
+                self.connection.execute('DELETE FROM responses WHERE key = ?',
+                                        (key,))
+                self.connection.commit()
+                return None
+            # mark the entry as recently used so eviction skips it
+            self.connection.execute(
+                    'UPDATE responses SET accessed = ? WHERE key = ?',
+                    (now, key))
+            self.connection.commit()
+        body = zlib.decompress(body)
+        if raw:
+            return body
+        return json.loads(body.decode('utf-8'))
+
+    def set(self, endpoint, params, data):
+        '''
+        stores the result of a search, unless the TTL rules say it
+        shouldn't be cached. 
+        
+        data can also be an already JSON encoded bytes body. 
+        '''
+        ttl = self.getTTL(endpoint, params)
+        if ttl is not None and ttl <= 0:
+            return
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        if not isinstance(data, bytes):
+            data = json.dumps(data).encode('utf-8')
+        body = zlib.compress(data)
+        with self.lock:
+            self.connection.execute(
+                    'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                    (fingerprint(endpoint, params), endpoint, expires, now,
+                     len(body), sqlite3.Binary(body)))
+            self.evict()
+            self.connection.commit()
+
+    def evict(self):
+        '''
+        deletes expired entries, then the least recently used entries
+        until the total size fits in maxBytes. called by set() while the
+        lock is held.
+        '''
+        self.connection.execute('DELETE FROM responses WHERE expires <= ?',
+                                (time.time(),))
+        if self.maxBytes is None:
+            return
+        total = self.connection.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.maxBytes:
+            return
+        rows = self.connection.execute(
+                'SELECT key, size FROM responses ORDER BY accessed').fetchall()
+        for key, size in rows:
+            if total <= self.maxBytes:
+                break
+            self.connection.execute('DELETE FROM responses WHERE key = ?',
+                                    (key,))
+            total -= size
+
+    def size(self):
+        '''
+        returns the total compressed size of stored results in bytes
+        '''
+        with self.lock:
+            return self.connection.execute(
+                    'SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def clear(self):
+        '''
+        deletes every stored result
+        '''
+        with self.lock:
+            self.connection.execute('DELETE FROM responses')
+            self.connection.commit()
+
+    def close(self):
+        '''
+        closes the SQLite file
+        '''
+        with self.lock:
+            self.connection.close()
+
+# the cache used by Search.search. None means no persistent caching.
+_cache = None
+
+def getCache():
+    '''
+    returns the cache used by Search.search, or None if caching is off.
+    '''
+    return _cache
+
+def setCache(cache):
+    '''
+    sets the cache used by Search.search and returns the previous one.
+    pass None to turn persistent caching off.
+    '''
+    global _cache
+    previous = _cache
+    _cache = cache
+    return previous
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:26:12 2026
+
+########################################################################
+####                                                                ####
+####                         decode module                          ####
+####                                                                ####
+########################################################################
+
+This module turns the result sets returned by stats.wnba.com into typed
+columns and pandas DataFrames.
+
+    Every stats endpoint returns its data as one or more result sets:
+
+        {'name': 'PlayerGameLogs',
+         'headers': ['PLAYER_ID', 'GAME_ID', 'PTS', 'FG_PCT', ...],
+         'rowSet': [[203399, '1021900405', 21, 0.5, ...], ...]}
+
+    pd.DataFrame(rowSet, columns=headers) reads that row by row. It first
+    copies the whole rowSet into one two dimensional array of python
+    objects, then works out a type for every column and copies again.
+    For large result sets (i.e. League.players for every season, or a
+    league-wide shot chart) that doubles peak memory and is slow.
+
+    columns(resultSet) instead reads the rowSet one column at a time,
+    straight into a numpy array of the right type:
+
+        - columns whose header names them as text (names, dates, codes,
+          and ids such as GAME_ID which can have leading zeros) are kept
+          as python strings in object arrays.
+        - columns whose header names them as rates (i.e. FG_PCT,
+          OFF_RATING) are read as float64.
+        - all other columns are read as int64 if every value is an int,
+          as float64 if every value is a number or null (nulls become
+          NaN), and otherwise as objects.
+
+    The header only picks the first type tried, so a column is never
+    forced into a type its values don't fit. Per game averages, for
+    example, are read as floats even though PTS is normally an int.
+
+    frame(resultSet) builds a DataFrame from those arrays without copying
+    them again, and frames(data) does that for every result set in a
+    search result, returning a dictionary of DataFrames keyed by result
+    set name. Search.dataFrame() uses frames().
+
+    League.shotLocations returns headers with two levels: a row of shot
+    zones, each spanning three columns, over a row of FGM/FGA/FG_PCT
+    names which repeat for every zone. columns(), frame() and frames()
+    flatten those into one name per column, 'Restricted Area.FGM', or
+    with multiIndex=True, keep them as a pandas MultiIndex. longFrame()
+    returns the same data in long (tidy) form instead, with one row per
+    team and zone, and a SHOT_CATEGORY column naming the zone. 
+
+    Game.pbp results don't use result sets at all. They nest a list of
+    plays inside a list of periods (see Game.pbp). pbpArray(data) flattens
+    the plays of every period into one typed numpy structured array in a
+    single pass, with the period number, the clock as seconds left in the
+    period, and locX and locY as int16, and pbpFrame(data) returns the same
+    table as a DataFrame. Both take spatialOnly=True to leave out events
+    with no location on the court (locY == -80), so shot locations across
+    a whole season can be worked on with vectorized numpy operations:
+
+        plays = pbpArray(g.pbp(GameID='1041900405'), spatialOnly=True)
+        shots = plays[plays['etype'] <= 2]
+"""
+from collections import OrderedDict
+
+from .lazy import LazyModule
+
+np = LazyModule('numpy')   # numpy to build columns, and pandas to build
+pd = LazyModule('pandas')  # DataFrames. both are imported on first use.
+
+# header names (or endings) of columns which hold text
+textNames = frozenset(['GAME_ID', 'SEASON_ID', 'SEASON', 'SEASON_YEAR',
+                       'GAME_DATE', 'MATCHUP', 'WL', 'POSITION',
+                       'HEIGHT', 'BIRTHDATE', 'JERSEY', 'ABBREVIATION',
+                       'GROUP_VALUE', 'GROUP_SET', 'LEAGUE_ID', 'GRID_TYPE',
+                       'EVENT_TYPE', 'ACTION_TYPE', 'SHOT_TYPE',
+                       'SHOT_ZONE_BASIC', 'SHOT_ZONE_AREA', 'SHOT_ZONE_RANGE',
+                       'HTM', 'VTM', 'COLLEGE', 'COUNTRY', 'SCHOOL',
+                       'NICKNAME', 'CONFERENCE', 'DIVISION', 'RECORD'])
+textEndings = ('_NAME', '_ABBREVIATION', '_CITY', '_CODE', '_SLUG', '_TYPE',
+               '_DESCRIPTION', '_RECORD', '_DATE', '_STRING')
+
+# header names (or endings) of columns which hold fractional numbers
+floatNames = frozenset(['PIE', 'PACE', 'PACE_PER40', 'POSS_PCT', 'AGE'])
+floatEndings = ('_PCT', '_RATING', '_RATIO', '_AVG', '_PERCENTAGE', '_PER40')
+
+def columnType(header):
+    '''
+    returns the type (str, float or int) a column should be read as
+    first, judging by its header name.
+    '''
+    name = str(header).upper()
+    if name in textNames or name.endswith(textEndings):
+        return str
+    if name in floatNames or name.endswith(floatEndings):
+        return float
+    return int
+
+def column(values, kind=int):
+    '''
+    returns a numpy array holding values (a list), read as kind if they
+    fit it, or as the next most general type that they fit.
+    '''
+    if kind is not str and values:
+        # let numpy work out the narrowest type of the values in one pass
+        try:
+            array = np.array(values)
+        except (TypeError, ValueError, OverflowError):
+            array = None
+        if array is not None and array.ndim == 1:
+            if array.dtype.kind == 'i':
+                if kind is int:
+                    return array.astype(np.int64, copy=False)
+                return array.astype(np.float64)
+            if array.dtype.kind == 'f':
+                return array.astype(np.float64, copy=False)
+            if array.dtype.kind == 'O' and all(v is None or type(v) in (int, float)
+                                                for v in values):
+                # numbers with nulls. nulls become NaN.
+                return np.fromiter((np.nan if v is None else v for v in values),
+                                   np.float64, len(values))
+    elif kind is not str:
+        # an empty column, typed by its header
+        return np.empty(0, dtype=np.int64 if kind is int else np.float64)
+    # text, or values that don't fit a number type
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+def isMultiLevel(headers):
+    '''
+    returns True if a result set's headers have more than one level
+    (i.e. League.shotLocations), in which case they are a list of
+    dictionaries rather than a list of names.
+    '''
+    return bool(headers) and isinstance(headers[0], dict)
+
+def headerLevels(headers):
+    '''
+    returns a list with one list of labels per header level, each with
+    one label per column, from the top level down. single level headers
+    are returned as one level.
+
+    upper levels label groups of columns. a level's first columnsToSkip
+    columns get the label '', then each of its columnNames labels the
+    next columnSpan columns.
+    '''
+    if not isMultiLevel(headers):
+        return [list(headers)]
+    width = len(headers[-1]['columnNames'])
+    levels = []
+    for level in headers:
+        span = level.get('columnSpan', 1)
+        labels = [''] * level.get('columnsToSkip', 0)
+        for name in level['columnNames']:
+            labels.extend([name] * span)
+        labels.extend([''] * (width - len(labels)))
+        levels.append(labels[:width])
+    return levels
+
+def columnNames(headers, sep='.'):
+    '''
+    returns one flat name per column, joining the labels of every header
+    level with sep: i.e. 'Restricted Area.FGM'. columns without a group
+    label keep their plain name: i.e. 'TEAM_ID'.
+    '''
+    levels = headerLevels(headers)
+    return [sep.join(label for label in labels if label != '')
+            for labels in zip(*levels)]
+
+def columns(resultSet, sep='.'):
+    '''
+    returns a list of (header, numpy array) tuples, one per column of a
+    result set, in header order. multi-level headers are flattened with
+    columnNames().
+    '''
+    headers = resultSet['headers']
+    # the bottom level names the statistic, which decides the type
+    bottom = headerLevels(headers)[-1]
+    names = columnNames(headers, sep)
+    rows = resultSet['rowSet']
+    if rows:
+        values = zip(*rows)   # read the rowSet one column at a time
+    else:
+        values = ([] for header in bottom)
+    return [(name, column(list(vals), columnType(stat)))
+            for name, stat, vals in zip(names, bottom, values)]
+
+def frame(resultSet, multiIndex=False, sep='.'):
+    '''
+    returns a pandas DataFrame of a result set, built from the typed
+    columns returned by columns().
+
+    multi-level headers are flattened into 'group.stat' column names, or,
+    if multiIndex is True, kept as a pandas MultiIndex.
+    '''
+    cols = columns(resultSet, sep)
+    # build on column positions rather than names, because a few endpoints
+    # repeat a header, then label the columns.
+    df = pd.DataFrame({n: array for n, (header, array) in enumerate(cols)},
+                      copy=False)
+    if multiIndex and isMultiLevel(resultSet['headers']):
+        df.columns = pd.MultiIndex.from_arrays(headerLevels(resultSet['headers']))
+    else:
+        df.columns = [header for header, array in cols]
+    return df
+
+def longFrame(resultSet):
+    '''
+    returns a result set with two level headers (i.e. shotLocations) as
+    a long (tidy) DataFrame, with one row per row and column group:
+
+        TEAM_ID  TEAM_NAME  SHOT_CATEGORY    FGM  FGA  FG_PCT
+        ...      ...        Restricted Area  ...  ...  ...
+        ...      ...        Mid-Range        ...  ...  ...
+
+    the columns outside any group are repeated for every group, and the
+    group labels go in a column named after the top header level. stats
+    missing from a group are NaN. single level result sets are returned
+    as they are by frame().
+    '''
+    headers = resultSet['headers']
+    if not isMultiLevel(headers):
+        return frame(resultSet)
+    groups, stats = headerLevels(headers)[0], headerLevels(headers)[-1]
+    cols = [array for name, array in columns(resultSet)]
+    rows = len(resultSet['rowSet'])
+
+    # columns outside any group, and the columns of each group by stat
+    ids = [(stat, array) for group, stat, array in zip(groups, stats, cols)
+           if group == '']
+    grouped = OrderedDict()
+    for group, stat, array in zip(groups, stats, cols):
+        if group != '':
+            grouped.setdefault(group, OrderedDict())[stat] = array
+    statNames = []
+    for groupStats in grouped.values():
+        statNames.extend(s for s in groupStats if s not in statNames)
+
+    # stack the groups on top of each other one column at a time
+    table = OrderedDict()
+    for stat, array in ids:
+        table[stat] = np.tile(array, len(grouped))
+    table[headers[0].get('name', 'GROUP')] = np.repeat(
+            np.array(list(grouped), dtype=object), rows)
+    for stat in statNames:
+        parts = [groupStats.get(stat, np.full(rows, np.nan))
+                 for groupStats in grouped.values()]
+        table[stat] = np.concatenate(parts) if parts else np.empty(0)
+    return pd.DataFrame(table, copy=False)
+
+def frames(data, multiIndex=False):
+    '''
+    returns a dictionary of DataFrames keyed by result set name, for every
+    result set in a search result (with either a 'resultSet' or a
+    'resultSets' key). returns None if the search result has neither.
+    multiIndex is passed on to frame().
+    '''
+    if data.get('resultSet', False):
+        resultSets = data['resultSet']
+    elif data.get('resultSets', False):
+        resultSets = data['resultSets']
+    else:
+        return None
+    # either key can hold a single result set (i.e. shotLocations)
+    if isinstance(resultSets, dict):
+        resultSets = [resultSets]
+    return {resultSet['name']: frame(resultSet, multiIndex)
+            for resultSet in resultSets}
+
+# columns of the play-by-play table built by pbpArray(), and their types.
+# clock is the time left in the period, in whole seconds. the types are
+# numpy type codes, so numpy isn't imported until the first table is built.
+pbpFields = [('period', 'i1'), ('evt', 'i4'), ('clock', 'i2'),
+             ('etype', 'i1'), ('mtype', 'i2'), ('opt1', 'i4'),
+             ('opt2', 'i4'), ('locX', 'i2'), ('locY', 'i2'),
+             ('tid', 'i8'), ('oftid', 'i8'), ('pid', 'i8'),
+             ('epid', 'i8'), ('opid', 'i8'), ('hs', 'i2'),
+             ('vs', 'i2'), ('ord', 'i8'), ('de', object)]
+_pbpDtype = None
+
+def pbpType():
+    '''
+    returns the numpy type of a row of the play-by-play table, built from
+    pbpFields the first time it is needed
+    '''
+    global _pbpDtype
+    if _pbpDtype is None:
+        _pbpDtype = np.dtype(pbpFields)
+    return _pbpDtype
+
+def __getattr__(name):
+    # decode.pbpDtype still works, built on first use like the rest
+    if name == 'pbpDtype':
+        return pbpType()
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+# locY of events which don't have a place on the court (i.e. timeouts)
+NO_LOCATION = -80
+
+def clockSeconds(clock):
+    '''
+    returns a 'MM:SS' (or 'MM:SS.s') clock string as whole seconds
+    '''
+    if not clock:
+        return 0
+    minutes, _, seconds = clock.partition(':')
+    return int(minutes or 0) * 60 + int(float(seconds or 0))
+
+def number(value):
+    '''
+    returns value as an int, reading the blanks pbp uses for missing
+    ids as 0
+    '''
+    if value == '' or value is None:
+        return 0
+    return int(value)
+
+def pbpPlays(data):
+    '''
+    iterates over (period, play) tuples for every play in a Game.pbp
+    result, for either a full game or a single period.
+    '''
+    game = data['g']
+    if 'pd' in game:
+        for period in game['pd']:
+            for play in period.get('pla', []):
+                yield period['p'], play
+    else:
+        for play in game.get('pla', []):
+            yield game.get('p', 0), play
+
+def pbpArray(data, spatialOnly=False):
+    '''
+    returns the plays of every period of a Game.pbp result as one numpy
+    structured array, with the fields in pbpFields.
+
+    if spatialOnly is True, events without a location on the court
+    (locY == -80) are left out.
+    '''
+    get = dict.get
+    rows = [(period, get(p, 'evt', 0), clockSeconds(get(p, 'cl')),
+             get(p, 'etype', 0), get(p, 'mtype', 0), number(get(p, 'opt1')),
+             number(get(p, 'opt2')), get(p, 'locX', 0),
+             get(p, 'locY', NO_LOCATION), number(get(p, 'tid')),
+             number(get(p, 'oftid')), number(get(p, 'pid')),
+             number(get(p, 'epid')), number(get(p, 'opid')), get(p, 'hs', 0),
+             get(p, 'vs', 0), get(p, 'ord', 0), get(p, 'de', ''))
+            for period, p in pbpPlays(data)]
+    plays = np.array(rows, dtype=pbpType())
+    if spatialOnly:
+        plays = plays[plays['locY'] != NO_LOCATION]
+    return plays
+
+def pbpFrame(data, spatialOnly=False):
+    '''
+    returns the plays of every period of a Game.pbp result as one pandas
+    DataFrame, with the columns in pbpFields. see pbpArray().
+    '''
+    plays = pbpArray(data, spatialOnly)
+    return pd.DataFrame({name: plays[name] for name in plays.dtype.names})
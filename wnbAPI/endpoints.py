@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:31:17 2026
+
+########################################################################
+####                                                                ####
+####                        endpoints module                        ####
+####                                                                ####
+########################################################################
+
+This module is the registry of every stats.wnba.com endpoint the package
+knows about. The Player, Team, League and Game classes (and fetch(), see
+the functional module) are built from it, so an endpoint's URL and
+params are written down in one place.
+
+    Each endpoint is one Endpoint in the endpoints list, named
+    'class.method':
+
+          Endpoint('team.lineups',
+                   'https://stats.wnba.com/stats/teamdashlineups',
+                   params={'GroupQuantity': '5', 'GameID': ''},
+                   ignores=['Rank', 'TopX', ...],
+                   rejects={'MeasureType': ['Usage', 'Defense']})
+
+        - url: the endpoint URL
+        - key: the endpoint's key in the object's endpoints dictionary,
+          if it isn't the method name
+        - params: defaults for the method, on top of the class's own
+          default required params (in classParams)
+        - forcedParams: params the method always sends, whatever is
+          passed
+        - accepts: the only params the endpoint accepts, where the method
+          notes say so ('ACCEPTS ONLY' or 'AFFECTED ONLY BY'). None means
+          the endpoint accepts anything.
+        - ignores: params the method notes say the endpoint ignores
+        - rejects: {param: values} the method notes say break the
+          endpoint. None instead of values means any value does.
+
+    The method itself is declared on its class with the endpointMethod
+    decorator, which keeps the method's docstring and writes its body:
+
+          @endpointMethod('team.lineups')
+          def lineups(self, **params):
+              '''
+              ...docstring...
+              '''
+
+    The decorator also reads the 'TABLES AND HEADERS' section of the
+    docstring into the Endpoint's resultSets, a dictionary of
+    {result set name: headers}. The docstring is only read when the
+    class's module is imported, so reading an Endpoint's resultSets
+    imports the module first if it hasn't been (the package loads the
+    endpoint classes lazily, see __init__.py).
+
+    The registry also decides which params are sent. Params outside an
+    endpoint's accepts, and ignored params which aren't among its default
+    required params, are left out of the request (and out of its cache
+    key, see the fingerprint module). So teamdetails is sent only TeamID
+    instead of the twenty-odd Team defaults, and searches which differ
+    only in ignored params share one stored result.
+
+    registry is a dictionary of every Endpoint keyed by lowercase name,
+    and byURL a dictionary of lists of Endpoints keyed by URL.
+"""
+import functools           # import functools to copy method docstrings
+import importlib           # import importlib to load the class modules
+import re                  # import re to read headers from docstrings
+
+from .resources import currentSeason
+
+# default required params of each class. These parameters are required
+# for the majority of the methods in the class. When not required, they
+# can be overridden at the method level. But most of these params can be
+# passed without affecting return for the methods where they are not
+# required.
+classParams = {
+    'search': {},
+    'player': {
+        'DateFrom': '',   # Required but empty string accepted
+        'DateTo':'',      # Required but empty string accepted
+        'GameSegment': '',# Required but empty string accepted
+        'LastNGames':'0', # 0 stands for all games
+        'LeagueID':'10',  # 10 is WNBA. 00 is NBA and 30 is G-League
+        'Location':'',    # Required but empty string accepted
+        'MeasureType': 'Base',#Required and needs string.
+        'Month':'0',      # 0 stands for all months
+        'Outcome':'',     # Required but empty string accepted
+        'OpponentTeamID': '0',# 0 stands for all opponents
+        'PaceAdjust':'N', # Requires Y or N
+        'PerMode': 'PerGame',# Requires string input
+        'Period': '0',    # 0 stands for all periods
+        'PlusMinus':'N',  # Requires Y or N
+        'Rank': 'N',      # Requires Y or N
+        'SeasonSegment':'',# Required but empty string accepted
+        'SeasonType':'Regular Season', # Requires string input
+        'VsConference': '',# Required but empty string accepted
+        'VsDivision':'',  # Required but empty string accepted
+        'Season': currentSeason, # Requires string or integer year.
+        'PlayerID': '203399', # 2019 WNBA MVP Elena Delle Donne
+        },
+    'team': {
+        'DateFrom': '',   # Required but empty string accepted
+        'DateTo':'',      # Required but empty string accepted
+        'GameSegment': '',# Required but empty string accepted
+        'LastNGames':'0', # 0 stands for all games
+        'LeagueID':'10',  # 10 is WNBA. 00 is NBA and 30 is G-League
+        'Location':'',    # Required but empty string accepted
+        'MeasureType': 'Base',#Required and needs string.
+        'Month':'0',      # 0 stands for all months
+        'Outcome':'',     # Required but empty string accepted
+        'OpponentTeamID': '0',# 0 stands for all opponents
+        'PaceAdjust':'N',
+        'PerMode': 'PerGame',# Requires string input
+        'Period': '0',    # 0 stands for all periods
+        'PlusMinus':'N',  # Requires Y or N
+        'Rank': 'N',      # Requires Y or N
+        'SeasonSegment':'',# Required but empty string accepted
+        'SeasonType':'Regular Season', # Requires string input
+        'TeamID':'1611661322', # 2019 World Champion Washington Mystics
+        'VsConference': '',# Required but empty string accepted
+        'VsDivision':'',  # Required but empty string accepted
+        'Season': str(currentSeason) # Requires string or integer year.
+        },
+    'league': {
+        'DateFrom': '',    # Required but empty string accepted
+        'DateTo':'',       # Required but empty string accepted
+        'GameSegment': '', # Required but empty string accepted
+        'LastNGames':'0',  # 0 stands for all games
+        'LeagueID':'10',   # 10 is WNBA. 00 is NBA and 30 is G-League
+        'Location':'',     # Required but empty string accepted
+        'MeasureType': 'Base',#Required and needs string.
+        'Month':'0',       # 0 stands for all months
+        'Outcome':'',      # Required but empty string accepted
+        'OpponentTeamID': '0',# 0 stands for all opponents
+        'PaceAdjust':'N',  # Requires Y or N
+        'PerMode': 'PerGame',# Requires string input
+        'Period': '0',     # 0 stands for all periods
+        'PlusMinus':'N',   # Requires Y or N
+        'Rank': 'N',       # Requires Y or N
+        'SeasonSegment':'',# Required but empty string accepted
+        'SeasonType':'Regular Season', # Requires string input
+        'VsConference': '',# Required but empty string accepted
+        'VsDivision':'',   # Required but empty string accepted
+        'Season': currentSeason, # Requires string or integer year.
+        'GameScope': '',   # Required but empty string accepted
+        'PlayerExperience': '',# Required but empty string accepted
+        'PlayerPosition': '',# Required but empty string accepted
+        'StarterBench':''  # Required but empty string accepted
+        },
+    'game': {
+        'GameID': '1041900405',
+        'LeagueID': '10'
+        },
+    }
+
+# the params most dashboards were noted to ignore
+dashboardIgnores = ['Rank', 'GameScope', 'PlayerExperience', 'PlayerPosition',
+                    'StarterBench', 'TopX', 'Conference', 'Division',
+                    'GroupQuantity', 'StatCategory', 'TwoWay', 'Scope',
+                    'PORound', 'PointDiff', 'Country', 'ActiveFlag',
+                    'AheadBehind', 'ClutchTime', 'DraftPick', 'DraftYear',
+                    'GameID', 'DistanceRange']
+
+# the MeasureType values most dashboards were noted to reject
+dashboardRejects = {'MeasureType': ['Four Factors', 'Opponent', 'Defense']}
+
+class Endpoint(object):
+    '''
+    One endpoint method and what is known about its params. see the
+    endpoints module.
+    '''
+    def __init__(self, name, url, key=None, params=None, forcedParams=None,
+                 accepts=None, ignores=(), rejects=None):
+        self.name = name
+        self.kind, self.method = name.split('.')
+        self.url = url
+        self.key = key or self.method
+        self.params = dict(params or {})
+        self.forcedParams = dict(forcedParams or {})
+        self.accepts = frozenset(accepts) if accepts is not None else None
+        self.ignores = frozenset(ignores)
+        self.rejects = dict((param, None if values is None else frozenset(values))
+                            for param, values in (rejects or {}).items())
+        self.source = name     # the method's name on its own class
+        self._resultSets = None   # read from the method's docstring
+
+    @property
+    def resultSets(self):
+        '''
+        {result set name: headers} read from the method's docstring. the
+        method's class module is imported if it hasn't been yet, since the
+        docstring is read when the method is declared.
+        '''
+        spec = registry[self.source.lower()]
+        if spec._resultSets is None:
+            importlib.import_module('wnbAPI.' + spec.kind)
+            if spec._resultSets is None:    # the method was never declared
+                spec._resultSets = {}
+        return spec._resultSets
+
+    @property
+    def requiredParams(self):
+        '''
+        the params the method fills in when they aren't passed: its
+        class's defaults updated with its own
+        '''
+        requiredParams = dict(classParams[self.kind])
+        requiredParams.update(self.params)
+        return requiredParams
+
+    def forKind(self, kind):
+        '''
+        returns a copy of the Endpoint as a method of the class kind,
+        i.e. 'player' for the inherited 'search.shotchartDetail'
+        '''
+        other = Endpoint.__new__(Endpoint)
+        other.__dict__.update(self.__dict__)
+        other.kind = kind
+        other.name = kind + '.' + self.method
+        return other
+
+    def __repr__(self):
+        return '<Endpoint %s %s>' % (self.name, self.url)
+
+endpoints = [
+    # Search
+    Endpoint('search.shotchartDetail',
+             'https://stats.wnba.com/stats/shotchartdetail',
+             params={'PlayerID': 0,
+                     'RookieYear': '',
+                     'ContextMeasure': 'PTS',
+                     'GameID': '',
+                     'PlayerPosition': '',
+                     'TeamID': '0',
+                     'DateFrom': '',
+                     'DateTo':'',
+                     'GameSegment': '',
+                     'LastNGames':'0',
+                     'LeagueID':'10',
+                     'Location':'',
+                     'MeasureType': 'Base',
+                     'Month':'0',
+                     'Period':'0',
+                     'Outcome':'',
+                     'OpponentTeamID': '0',
+                     'VsConference': '',
+                     'VsDivision':'',
+                     'SeasonSegment':'',
+                     'SeasonType':'Regular Season'}),
+
+    # Player
+    Endpoint('player.awards', 'https://stats.wnba.com/stats/playerawards',
+             accepts=['PlayerID', 'TeamID']),
+    Endpoint('player.career', 'https://stats.wnba.com/stats/playercareerstats',
+             rejects={'PerMode': ['MinutesPer', 'Per48', 'Per40', 'Per36',
+                                  'PerMinute', 'PerPossession', 'PerPlay',
+                                  'Per100Possessions', 'Per100Plays']}),
+    Endpoint('player.gamelogs', 'https://stats.wnba.com/stats/playergamelogs',
+             ignores=['PaceAdjust', 'PlusMinus', 'Rank', 'GameScope',
+                      'PlayerExperience', 'PlayerPosition', 'StarterBench',
+                      'TopX', 'Conference', 'Division', 'GroupQuantity',
+                      'StatCategory', 'TwoWay', 'Scope', 'PORound',
+                      'PointDiff', 'ActiveFlag', 'AheadBehind', 'ClutchTime',
+                      'DraftPick', 'DraftYear', 'DistanceRange'],
+             rejects={'MeasureType': ['Usage', 'Defense']}),
+    Endpoint('player.shooting',
+             'https://stats.wnba.com/stats/playerdashboardbyshootingsplits'),
+    Endpoint('player.clutch', 'https://stats.wnba.com/stats/playerdashboardbyclutch',
+             ignores=dashboardIgnores, rejects=dashboardRejects),
+    Endpoint('player.splits',
+             'https://stats.wnba.com/stats/playerdashboardbygeneralsplits',
+             ignores=dashboardIgnores, rejects=dashboardRejects),
+    Endpoint('player.lastNGames',
+             'https://stats.wnba.com/stats/playerdashboardbylastngames',
+             ignores=dashboardIgnores, rejects=dashboardRejects),
+    Endpoint('player.opponentSplits',
+             'https://stats.wnba.com/stats/playerdashboardbyopponent',
+             ignores=dashboardIgnores, rejects=dashboardRejects),
+    Endpoint('player.teamPerformance',
+             'https://stats.wnba.com/stats/playerdashboardbyteamperformance',
+             ignores=dashboardIgnores, rejects=dashboardRejects),
+    Endpoint('player.yearOverYear',
+             'https://stats.wnba.com/stats/playerdashboardbyyearoveryear',
+             ignores=dashboardIgnores, rejects=dashboardRejects),
+
+    # Team
+    Endpoint('team.details', 'https://stats.wnba.com/stats/teamdetails',
+             accepts=['TeamID']),
+    # LeagueID and Season are kept where the notes are ambiguous
+    Endpoint('team.roster', 'https://stats.wnba.com/stats/commonteamroster',
+             accepts=['TeamID', 'Season', 'LeagueID']),
+    Endpoint('team.gamelogs', 'https://stats.wnba.com/stats/teamgamelogs',
+             ignores=['PaceAdjust', 'PlusMinus', 'Rank', 'GameScope',
+                      'PlayerExperience', 'PlayerPosition', 'StarterBench',
+                      'TopX', 'Conference', 'Division', 'GroupQuantity',
+                      'StatCategory', 'TwoWay', 'Scope', 'PORound',
+                      'PointDiff', 'ActiveFlag', 'AheadBehind', 'ClutchTime',
+                      'DraftPick', 'DraftYear', 'DistanceRange'],
+             rejects={'MeasureType': ['Usage', 'Defense']}),
+    Endpoint('team.shooting',
+             'https://stats.wnba.com/stats/teamdashboardbyshootingsplits'),
+    Endpoint('team.clutch', 'https://stats.wnba.com/stats/leaguedashteamclutch',
+             params={'ClutchTime': 'Last 5 Minutes',
+                     'AheadBehind': 'Ahead or Behind',
+                     'PointDiff': '5',
+                     'GameScope': '',
+                     'PlayerExperience': '',
+                     'PlayerPosition': '',
+                     'StarterBench': ''},
+             ignores=['Rank', 'TopX', 'Split', 'Weight', 'GroupQuantity',
+                      'StatCategory', 'TwoWay', 'Scope', 'PORound', 'Country',
+                      'ActiveFlag', 'Height', 'DraftPick', 'DraftYear'],
+             rejects={'MeasureType': ['Defense', 'Usage']}),
+    Endpoint('team.lineups', 'https://stats.wnba.com/stats/teamdashlineups',
+             params={'GroupQuantity':'5',
+                     'GameID': ''},
+             ignores=['Rank', 'GameScope', 'PlayerExperience',
+                      'PlayerPosition', 'StarterBench', 'TopX', 'Conference',
+                      'Division', 'Split', 'StatCategory', 'TwoWay', 'Scope',
+                      'PORound', 'PointDiff', 'Country', 'ActiveFlag',
+                      'AheadBehind', 'ClutchTime', 'DraftPick', 'DraftYear',
+                      'DistanceRange'],
+             rejects={'MeasureType': ['Usage', 'Defense']}),
+    Endpoint('team.players', 'https://stats.wnba.com/stats/teamplayerdashboard',
+             key='playerDashboard',
+             ignores=['Rank', 'GameScope', 'PlayerExperience',
+                      'PlayerPosition', 'StarterBench', 'TopX', 'Conference',
+                      'Division', 'GroupQuantity', 'StatCategory', 'TwoWay',
+                      'Scope', 'PORound', 'PointDiff', 'ActiveFlag',
+                      'AheadBehind', 'ClutchTime', 'DraftPick'],
+             rejects=dashboardRejects),
+    Endpoint('team.splits',
+             'https://stats.wnba.com/stats/teamdashboardbygeneralsplits',
+             key='dashboardBySplits',
+             ignores=[p for p in dashboardIgnores if p != 'DraftYear'] + ['Split'],
+             rejects={'MeasureType': ['Usage', 'Defense']}),
+    Endpoint('team.onOff', 'https://stats.wnba.com/stats/teamplayeronoffdetails',
+             ignores=[p for p in dashboardIgnores if p != 'DraftYear']
+                     + ['Weight', 'ShotClockRange'],
+             rejects={'MeasureType': ['Usage', 'Defense']}),
+    Endpoint('team.onOffSummary',
+             'https://stats.wnba.com/stats/teamplayeronoffsummary',
+             ignores=dashboardIgnores + ['MeasureType', 'ShotClockRange']),
+    # LeagueID is kept, since the notes are ambiguous
+    Endpoint('team.yearByYear',
+             'https://stats.wnba.com/stats/teamyearbyyearstats',
+             key='yearByYearStats',
+             accepts=['TeamID', 'PerMode', 'LeagueID']),
+
+    # League
+    Endpoint('league.players',
+             'https://stats.wnba.com/stats/leaguedashplayerstats',
+             ignores=['Outcome', 'Rank', 'GameScope', 'TopX',
+                      'GroupQuantity', 'StatCategory', 'Scope', 'PORound',
+                      'PointDiff', 'ActiveFlag', 'AheadBehind', 'Height',
+                      'ClutchTime', 'DraftPick'],
+             rejects={'ShotClockRange': None,
+                      'MeasureType': ['Four Factors', 'Opponent']}),
+    # LeagueID is kept, since the notes are ambiguous
+    Endpoint('league.standings', 'https://stats.wnba.com/stats/leaguestandingsv3',
+             accepts=['SeasonType', 'Season', 'LeagueID']),
+    Endpoint('league.teams', 'https://stats.wnba.com/stats/leaguedashteamstats',
+             ignores=['Outcome', 'Rank', 'TopX', 'GroupQuantity',
+                      'StatCategory', 'Scope', 'PORound', 'PointDiff',
+                      'Country', 'ActiveFlag', 'AheadBehind', 'ClutchTime',
+                      'DraftPick', 'DraftYear'],
+             rejects={'ShotClockRange': None,
+                      'MeasureType': ['Usage']}),
+    Endpoint('league.shotLocations',
+             'https://stats.wnba.com/stats/leaguedashteamshotlocations',
+             params={'DistanceRange':'By Zone'},
+             ignores=['Outcome', 'Rank', 'TopX', 'GroupQuantity',
+                      'StatCategory', 'TwoWay', 'Scope', 'PORound',
+                      'PointDiff', 'Country', 'ActiveFlag', 'AheadBehind',
+                      'ClutchTime', 'DraftPick', 'DraftYear'],
+             rejects={'ShotClockRange': None,
+                      'MeasureType': ['Usage', 'Scoring', 'Four Factors',
+                                      'Misc', 'Advanced']}),
+    Endpoint('league.statLeaders', 'https://stats.wnba.com/stats/leagueLeaders',
+             params={'StatCategory':'FT_PCT',
+                     'Scope': 'RS',
+                     'PerMode': 'Totals'},
+             forcedParams={'PerMode': 'Totals'},
+             ignores=['DateFrom', 'DateTo', 'GameSegment', 'LastNGames',
+                      'Location', 'MeasureType', 'Month', 'Outcome',
+                      'OpponentTeamID', 'PaceAdjust', 'Period', 'PlusMinus',
+                      'Rank', 'SeasonSegment', 'VsConference', 'VsDivision',
+                      'GameScope', 'PlayerExperience', 'PlayerPosition',
+                      'StarterBench', 'PlayerID', 'TopX', 'Conference',
+                      'Division', 'GroupQuantity']),
+    Endpoint('league.alltimeLeaders',
+             'https://stats.wnba.com/stats/alltimeleadersgrids',
+             params={'TopX':'10'}),
+    Endpoint('league.lineups', 'https://stats.wnba.com/stats/leaguedashlineups',
+             params={'GroupQuantity': '5'},
+             ignores=['GameScope', 'PlayerExperience', 'PlayerPosition',
+                      'StarterBench', 'TopX', 'StatCategory', 'TwoWay',
+                      'PORound', 'PointDiff', 'Country', 'ActiveFlag',
+                      'AheadBehind', 'ClutchTime', 'DraftPick', 'GameID',
+                      'DraftYear', 'DistanceRange'],
+             rejects={'MeasureType': ['Usage', 'Defense']}),
+
+    # Game
+    Endpoint('game.scoreboard', 'https://stats.wnba.com/stats/scoreboard',
+             params={'GameDate': '10/10/2019',
+                     'DayOffset': '0'}),
+    Endpoint('game.scoreboardv2', 'https://stats.wnba.com/stats/scoreboardv2',
+             params={'GameDate': '10/10/2019',
+                     'DayOffset': '0'}),
+    Endpoint('game.playByPlay', 'https://stats.wnba.com/stats/playbyplay',
+             key='playbyplay',
+             params={'StartPeriod': '0',
+                     'EndPeriod': '0'}),
+    Endpoint('game.playByPlayv2', 'https://stats.wnba.com/stats/playbyplayv2',
+             key='playbyplayv2',
+             params={'StartPeriod': '0',
+                     'EndPeriod': '0'}),
+    ]
+
+# every Endpoint keyed by lowercase name
+registry = dict((e.name.lower(), e) for e in endpoints)
+
+# lists of Endpoints keyed by URL. shotchartdetail, for one, is shared
+byURL = {}
+for e in endpoints:
+    byURL.setdefault(e.url, []).append(e)
+
+def urlFilter(url):
+    '''
+    returns (accepted, dropped) for a URL: the only params sent to it (or
+    None for any), and the params never sent to it. built from every
+    Endpoint using the URL.
+    '''
+    shared = byURL[url]
+    if all(e.accepts is not None for e in shared):
+        accepted = frozenset().union(*[e.accepts for e in shared])
+    else:
+        accepted = None
+    # a param is only dropped if every method using the URL ignores it,
+    # and none of them fill it in by default, since the API may refuse
+    # requests missing a param it then ignores
+    required = set()
+    for e in shared:
+        required.update(e.requiredParams)
+        if e.kind == 'search':     # inherited by every class
+            for defaults in classParams.values():
+                required.update(defaults)
+    dropped = frozenset.intersection(*[e.ignores for e in shared]) - required
+    return accepted, dropped
+
+# (accepted, dropped) keyed by URL, worked out once
+paramFilters = dict((url, urlFilter(url)) for url in byURL)
+
+def classEndpoints(kind):
+    '''
+    returns the endpoints dictionary of the class kind: {key: URL} for
+    each of its own endpoint methods
+    '''
+    return dict((e.key, e.url) for e in endpoints if e.kind == kind)
+
+def kindEndpoints(kind):
+    '''
+    returns the Endpoints of every endpoint method of the class kind,
+    including those inherited from Search, as methods of kind
+    '''
+    return [e.forKind(kind) for e in endpoints if e.kind in ('search', kind)]
+
+# a quoted name or header in a docstring
+quoted = re.compile(r"'([^']*)'")
+
+def docResultSets(doc):
+    '''
+    returns {result set name: headers} read from the 'TABLES AND HEADERS'
+    section of an endpoint method's docstring. result set names are on
+    lines of their own, followed by the lines of their headers. names
+    listed one after another share the headers that follow.
+    '''
+    resultSets = {}
+    if not doc or 'TABLES AND HEADERS' not in doc:
+        return resultSets
+    names = []        # names waiting for headers
+    headers = None    # headers of the current names
+    for line in doc.split('TABLES AND HEADERS', 1)[1].splitlines()[1:]:
+        line = line.strip()
+        if not line:
+            continue
+        tokens = quoted.findall(line)
+        # notes after the tables, or a layout that isn't a simple list
+        # (i.e. League.shotLocations), end the section
+        if not tokens or '{' in line or ':' in line:
+            break
+        if len(tokens) == 1 and line == "'" + tokens[0] + "'":
+            if headers is not None:
+                names, headers = [], None
+            names.append(tokens[0])
+        elif names:
+            if headers is None:
+                headers = []
+                for name in names:
+                    resultSets[name] = headers
+            headers.extend(token.strip() for token in tokens)
+    return resultSets
+
+def endpointMethod(name):
+    '''
+    decorator which turns a method with only a docstring into the
+    endpoint method called name in the registry
+    '''
+    spec = registry[name.lower()]
+
+    def decorator(function):
+        spec._resultSets = docResultSets(function.__doc__)
+
+        @functools.wraps(function)
+        def method(self, **params):
+            # fill it with object's default required params, then the
+            # method's own defaults
+            requiredParams = dict(self.requiredParams)
+            requiredParams.update(spec.params)
+            # forced params are sent with this search only, and don't
+            # stay in the object's params
+            return self.search(spec.url, requiredParams, params,
+                               spec.forcedParams or None)
+        method.endpoint = spec
+        return method
+    return decorator
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:20:03 2026
+
+########################################################################
+####                                                                ####
+####                         export module                          ####
+####                                                                ####
+########################################################################
+
+This module writes search results to a local store of Parquet or Arrow
+IPC files, and reads them back, so jobs which read the same endpoints
+over and over don't have to fetch or parse JSON again.
+
+    pyarrow is needed for everything in this module, but it is an
+    optional dependency of the package. It is only imported when one of
+    these functions is called.
+
+    s.export(path='lake') writes every result set of the search currently
+    in the pointer. Any search result can also be written directly:
+
+          exportResult(data, 'playergamelogs', params, path='lake')
+
+    Game.pbp results and schedule() responses have their own exporters,
+    which flatten them into tables first:
+
+          exportPbp(g.pbp(GameID='1041900405'), Season='2019',
+                    GameID='1041900405', path='lake')
+          exportSchedule(schedule(TeamID='1611661322'), Season='2019',
+                         TeamID='1611661322', path='lake')
+
+    Files are laid out in hive style partitions, one directory level per
+    key:
+
+        lake/endpoint=playergamelogs/resultSet=PlayerGameLogs/
+             Season=2019/SeasonType=Regular Season/
+             TeamID=__HIVE_DEFAULT_PARTITION__/PlayerID=203399/part.parquet
+
+    Keys missing from the params get pyarrow's null partition. Every
+    column's type comes from its header name, exactly as for
+    DataFrames (see the decode module).
+
+    The file is named after a hash of every other param the endpoint is
+    sent (see the fingerprint module), i.e. part-3f0c9a1be2d45e67.parquet,
+    so results which differ only in MeasureType, PerMode, DateFrom and
+    so on are kept side by side instead of replacing each other. Writing
+    the same search again replaces its file. Results with no other params
+    (pbp and schedules) are written to part.parquet.
+
+    format='arrow' writes uncompressed Arrow IPC files instead of
+    Parquet. Those are memory-mapped when read, so reading them doesn't
+    copy the data at all.
+
+          readExport('playergamelogs', path='lake', Season=2019)
+
+    returns a pyarrow Table of one endpoint's result set (the first one
+    found, unless resultSet is passed), read from every partition which
+    matches the keyword filters, with the partition keys as text columns.
+    Call .to_pandas() on it for a DataFrame. Passing params reads only
+    the files written with those other params. It must be passed when the
+    result set has been written with more than one set of other params,
+    since their rows would otherwise be mixed together:
+
+          readExport('leaguedashplayerstats', path='lake', Season=2019,
+                     params={'MeasureType': 'Advanced', 'PerMode': 'Totals'})
+"""
+import os                    # import os to manage the store's files
+from hashlib import sha1     # import sha1 to name files by their params
+from urllib.parse import urlsplit
+
+from .decode import columns, pbpArray
+from .endpoints import byURL
+from .fingerprint import canonicalParams
+
+# partition keys, in directory order, after endpoint and resultSet
+partitionKeys = ['Season', 'SeasonType', 'TeamID', 'PlayerID']
+
+# directory value pyarrow reads as a null partition key
+NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+# file extension of each format
+extensions = {'parquet': '.parquet', 'arrow': '.arrow'}
+
+def importArrow():
+    '''
+    returns the pyarrow module, raising an ImportError which explains how
+    to install it if it is missing
+    '''
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError('exporting requires pyarrow. '
+                          'install it with: pip install pyarrow')
+    return pyarrow
+
+def arrowArray(pa, array):
+    '''
+    returns a numpy column as a pyarrow array. mixed values which arrow
+    can't type are stored as text.
+    '''
+    try:
+        return pa.array(array, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if v is None else str(v) for v in array])
+
+def arrowTable(resultSet):
+    '''
+    returns a result set as a pyarrow Table, with column types taken from
+    the headers (see columns in the decode module)
+    '''
+    pa = importArrow()
+    cols = columns(resultSet)
+    return pa.Table.from_arrays([arrowArray(pa, array) for name, array in cols],
+                                names=[name for name, array in cols])
+
+def endpointName(endpoint):
+    '''
+    returns the short name of an endpoint URL, i.e. 'playergamelogs'
+    '''
+    return urlsplit(endpoint).path.rstrip('/').rsplit('/', 1)[-1] or endpoint
+
+def partitionValue(value):
+    '''
+    returns a param value as a directory name
+    '''
+    if value is None or value == '':
+        return NULL_PARTITION
+    return str(value).replace('/', '-').replace(os.sep, '-')
+
+def endpointURL(endpoint):
+    '''
+    returns the registry URL of an endpoint given by its short name, or
+    endpoint itself if it is a URL or isn't in the registry
+    '''
+    if '/' in endpoint:
+        return endpoint
+    for url in byURL:
+        if endpointName(url) == endpoint:
+            return url
+    return endpoint
+
+def partName(endpoint, params):
+    '''
+    returns the file name, without extension, of a result set written
+    with params: 'part', followed by a hash of the params sent to the
+    endpoint which aren't partition keys
+    '''
+    others = dict((key, value) for key, value in params.items()
+                  if key not in partitionKeys)
+    canonical = canonicalParams(endpointURL(endpoint), others)
+    if not canonical:
+        return 'part'
+    return 'part-' + sha1(canonical.encode('utf-8')).hexdigest()[:16]
+
+def partitionPath(path, endpoint, resultSet, params):
+    '''
+    returns the directory a result set's file is written to
+    '''
+    parts = [path, 'endpoint=' + endpointName(endpoint),
+             'resultSet=' + partitionValue(resultSet)]
+    parts.extend(key + '=' + partitionValue(params.get(key))
+                 for key in partitionKeys)
+    return os.path.join(*parts)
+
+def writeTable(table, directory, format='parquet', name='part'):
+    '''
+    writes a pyarrow Table to directory as one file called name, replacing
+    any file of that name already there. returns the file's name.
+    '''
+    pa = importArrow()
+    if format not in extensions:
+        raise ValueError('format must be one of ' + ', '.join(extensions))
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    filename = os.path.join(directory, name + extensions[format])
+    # the leading underscore hides the temporary file from readers
+    temporary = os.path.join(directory, '_' + name + extensions[format] + '.tmp')
+    if format == 'parquet':
+        import pyarrow.parquet as pq
+        pq.write_table(table, temporary)
+    else:
+        with pa.OSFile(temporary, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    os.replace(temporary, filename)
+    return filename
+
+def exportResult(data, endpoint, params=None, path='lake', format='parquet'):
+    '''
+    writes every result set of a search result (the data returned by an
+    endpoint method) under path, partitioned by endpoint, result set name
+    and the params in partitionKeys, in a file named by the other params
+    (see partName). returns the list of files written.
+    '''
+    params = params or {}
+    resultSets = data.get('resultSets') or data.get('resultSet') or []
+    if isinstance(resultSets, dict):
+        resultSets = [resultSets]
+    name = partName(endpoint, params)
+    return [writeTable(arrowTable(resultSet),
+                       partitionPath(path, endpoint, resultSet['name'], params),
+                       format, name)
+            for resultSet in resultSets]
+
+def exportPbp(data, Season, GameID, path='lake', format='parquet'):
+    '''
+    writes the plays of a Game.pbp result, flattened by pbpArray, under
+    path as endpoint 'pbp', partitioned by Season, with a GAME_ID column.
+    returns the file written.
+    '''
+    pa = importArrow()
+    plays = pbpArray(data)
+    arrays = [pa.array([str(GameID)] * len(plays))]
+    arrays.extend(arrowArray(pa, plays[name]) for name in plays.dtype.names)
+    table = pa.Table.from_arrays(arrays, names=['GAME_ID'] + list(plays.dtype.names))
+    directory = partitionPath(path, 'pbp', 'Plays', {'Season': Season})
+    return writeTable(table, os.path.join(directory, 'GameID=' + str(GameID)),
+                      format)
+
+def exportSchedule(response, Season, TeamID, path='lake', format='parquet'):
+    '''
+    writes the games of a schedule() response under path as endpoint
+    'schedule', partitioned by Season and TeamID. nested team fields are
+    flattened into columns such as 'h.tid' and 'v.s'. returns the file
+    written.
+    '''
+    games = response.json()['gscd']['g']
+    rows = [flatten(game) for game in games]
+    headers = []
+    for row in rows:
+        headers.extend(h for h in row if h not in headers)
+    resultSet = {'name': 'Games', 'headers': headers,
+                 'rowSet': [[row.get(h) for h in headers] for row in rows]}
+    return writeTable(arrowTable(resultSet),
+                      partitionPath(path, 'schedule', 'Games',
+                                    {'Season': Season, 'TeamID': TeamID}),
+                      format)
+
+def flatten(record, prefix=''):
+    '''
+    returns a dictionary with nested dictionaries flattened into
+    'key.subkey' keys
+    '''
+    flat = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, prefix + key + '.'))
+        else:
+            flat[prefix + key] = value
+    return flat
+
+def readExport(endpoint, path='lake', resultSet=None, format='parquet',
+               params=None, **filters):
+    '''
+    returns a pyarrow Table of an endpoint's result set (the first found,
+    unless resultSet is passed) from every stored partition matching the
+    keyword filters, i.e. Season=2019. Arrow IPC files are memory-mapped.
+
+    if params is passed, only files written with those params (other than
+    the partition keys) are read, and a KeyError is raised if there are
+    none. see partName. params must be passed if the result set has files
+    written with more than one set of params, since their rows can't be
+    told apart once read; a ValueError listing the file names is raised
+    otherwise.
+    '''
+    pa = importArrow()
+    import pyarrow.dataset as ds
+    from pyarrow import fs
+
+    root = os.path.join(path, 'endpoint=' + endpointName(endpoint))
+    if resultSet is None:
+        names = sorted(d for d in os.listdir(root) if d.startswith('resultSet='))
+        if not names:
+            raise KeyError('no result sets stored for ' + endpointName(endpoint))
+        root = os.path.join(root, names[0])
+    else:
+        root = os.path.join(root, 'resultSet=' + partitionValue(resultSet))
+
+    # partition keys are read as text, like the params they came from, so
+    # ids keep their leading zeros
+    partitioning = ds.partitioning(
+            pa.schema([(key, pa.string()) for key in partitionKeys + ['GameID']]),
+            flavor='hive')
+    # the stored files, keyed by the name of the params they were written with
+    extension = extensions[format]
+    parts = {}
+    for directory, subdirectories, files in os.walk(root):
+        for filename in files:
+            if filename.endswith(extension):
+                parts.setdefault(filename[:-len(extension)], []).append(
+                        os.path.join(directory, filename))
+    if params is not None:
+        name = partName(endpoint, params)
+        if name not in parts:
+            raise KeyError('no %s files written with params %r under %s'
+                           % (name, params, root))
+    elif len(parts) > 1:
+        raise ValueError('%s holds files written with different params (%s). '
+                         'pass params to choose which to read.'
+                         % (root, ', '.join(sorted(parts))))
+    elif not parts:
+        raise KeyError('no %s files stored under %s' % (format, root))
+    else:
+        name = list(parts)[0]
+    source = parts[name]
+    dataset = ds.dataset(source, format='ipc' if format == 'arrow' else format,
+                         partitioning=partitioning, partition_base_dir=root,
+                         filesystem=fs.LocalFileSystem(use_mmap=True))
+    expression = None
+    for key, value in filters.items():
+        condition = ds.field(key) == str(value)
+        expression = condition if expression is None else expression & condition
+    return dataset.to_table(filter=expression)
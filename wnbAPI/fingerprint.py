@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:02:36 2026
+
+########################################################################
+####                                                                ####
+####                      fingerprint module                        ####
+####                                                                ####
+########################################################################
+
+This module holds the functions used to decide whether two searches are
+the same search. Everywhere the package dedupes or caches requests
+(Search.history and Search.data, and the persistent cache) it keys on
+these functions instead of on str(params).
+
+    str(params) depends on the order the keys were inserted and on the
+    types of the values, so {'Season': 2019, 'TeamID': '1611661322'} and
+    {'TeamID': '1611661322', 'Season': '2019'} looked like two different
+    searches even though the API receives exactly the same request.
+
+    normalizeParams(params) returns the params the way they are sent:
+        - None values are dropped (requests never sends them)
+        - True and False become 'Y' and 'N', the API's flag values
+        - whole number floats like 2019.0 become '2019'
+        - everything else is converted with str()
+
+    sentParams(endpoint, params) returns the normalized params which are
+    actually sent to the endpoint. Params outside the endpoint's accepted
+    params, and params the endpoint ignores, are left out. Both are read
+    from the endpoint registry (see the endpoints module). Any endpoint
+    the registry knows nothing about keeps all params, since unknown
+    params are usually ignored but not always.
+
+    canonicalParams(endpoint, params) returns a query string of the sent
+    params sorted by name.
+
+          canonicalParams('https://stats.wnba.com/stats/teamdetails',
+                          {'TeamID': 1611661322, 'Season': 2019})
+
+          returns 'TeamID=1611661322'
+
+    fingerprint(endpoint, params) returns a short hash of the endpoint and
+    its canonical params, for use as a storage key.
+"""
+from hashlib import sha1                # import sha1 to hash fingerprints
+from urllib.parse import urlencode      # import urlencode to join params
+
+from .endpoints import paramFilters    # import the registry's filters
+
+# params each endpoint is known to accept, keyed by endpoint URL. Taken
+# from the 'ACCEPTS ONLY' and 'AFFECTED ONLY BY' notes in the method
+# docstrings, through the endpoint registry. LeagueID and Season are kept
+# where the notes are ambiguous, since wrongly leaving a param out of the
+# fingerprint would serve one search's results for another.
+acceptedParams = dict((url, accepted)
+                      for url, (accepted, dropped) in paramFilters.items()
+                      if accepted is not None)
+
+# params each endpoint is known to ignore, keyed by endpoint URL
+droppedParams = dict((url, dropped)
+                     for url, (accepted, dropped) in paramFilters.items()
+                     if dropped)
+
+def normalizeValue(value):
+    '''
+    returns a param value as the string sent to the API, or None if the
+    param isn't sent at all.
+    '''
+    if value is None:
+        return None
+    if isinstance(value, bool):    # check bool before int, since bools
+        return 'Y' if value else 'N' # are ints too
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def normalizeParams(params):
+    '''
+    returns a new dictionary of the params with normalized values and
+    None values removed.
+    '''
+    normalized = {}
+    for key, value in params.items():
+        value = normalizeValue(value)
+        if value is not None:
+            normalized[str(key)] = value
+    return normalized
+
+def sentParams(endpoint, params):
+    '''
+    returns a new dictionary of the normalized params that are sent to
+    the endpoint: those it accepts, less those it ignores.
+    '''
+    accepted = acceptedParams.get(endpoint)
+    dropped = droppedParams.get(endpoint, ())
+    return dict((key, value) for key, value in normalizeParams(params).items()
+                if (accepted is None or key in accepted)
+                and key not in dropped)
+
+def canonicalParams(endpoint, params):
+    '''
+    returns a query string of the params sent to the endpoint, sorted by
+    name.
+    '''
+    return urlencode(sorted(sentParams(endpoint, params).items()))
+
+def fingerprint(endpoint, params):
+    '''
+    returns a hash identifying the endpoint/params combination
+    '''
+    canonical = endpoint + '?' + canonicalParams(endpoint, params)
+    return sha1(canonical.encode('utf-8')).hexdigest()
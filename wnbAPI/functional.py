@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:36:08 2026
+
+########################################################################
+####                                                                ####
+####                       functional module                        ####
+####                                                                ####
+########################################################################
+
+This module holds fetch(), a stateless way to call any endpoint method
+of the Player, Team, League and Game classes without creating an object.
+
+    fetch('player.gamelogs', PlayerID='203399', Season='2019')
+
+    returns the same data as
+
+    Player().gamelogs(PlayerID='203399', Season='2019')
+
+    but nothing is kept between calls: there are no params to merge, no
+    history, no pointer and no stored results, so callers making many
+    requests (i.e. a web service) skip that bookkeeping and the copying
+    that comes with it. Once its params are filled in, a fetch goes
+    through the same steps as a search (runSearch in the search module):
+    the params are checked, the persistent cache is used if one is set
+    (see the cache module), requests go through the shared Transport
+    (with its retries, rate limiting and single-flight, see the transport
+    module), and the same hooks are raised.
+
+    Names are 'class.method', in any case: 'league.shotLocations',
+    'team.gamelogs', 'game.scoreboardv2', and so on. endpointNames()
+    lists every name. Methods which don't use the core search method
+    (Game.pbp, Team.logo and Team.schedule) aren't available.
+
+    The endpoint URL and default params of every method come from the
+    endpoint registry the classes are built from (see the endpoints
+    module). endpoint(name) returns the registry's Endpoint for a method,
+    including:
+        - name: 'class.method'
+        - url: the endpoint URL
+        - requiredParams: the defaults used for params which aren't passed
+        - forcedParams: params the method always sends, whatever is
+          passed (i.e. PerMode for League.statLeaders)
+"""
+import threading           # import threading to lock the registry
+
+from .search import runSearch
+from .endpoints import kindEndpoints
+
+# the classes whose endpoint methods are available, named by the first
+# part of a name
+kinds = ['player', 'team', 'league', 'game']
+
+# the registry of Endpoints keyed by lowercase name. built on first use.
+_endpoints = None
+_lock = threading.Lock()
+
+def buildEndpoints():
+    '''
+    returns a dictionary of Endpoints for every endpoint method of the
+    classes in kinds, keyed by lowercase name
+    '''
+    endpoints = {}
+    for kind in kinds:
+        for spec in kindEndpoints(kind):
+            endpoints[spec.name.lower()] = spec
+    return endpoints
+
+def getEndpoints():
+    '''
+    returns the registry of Endpoints, building it if needed
+    '''
+    global _endpoints
+    if _endpoints is None:
+        with _lock:
+            if _endpoints is None:
+                _endpoints = buildEndpoints()
+    return _endpoints
+
+def endpoint(name):
+    '''
+    returns the Endpoint called name ('class.method', in any case).
+    raises KeyError if there is no such endpoint method.
+    '''
+    try:
+        return getEndpoints()[name.lower()]
+    except KeyError:
+        raise KeyError('unknown endpoint %r. see endpointNames()' % name)
+
+def endpointNames():
+    '''
+    returns a sorted list of the names accepted by fetch()
+    '''
+    return sorted(e.name for e in getEndpoints().values())
+
+def fetch(name, **params):
+    '''
+    calls the endpoint method called name ('class.method') with params,
+    without creating an object, and returns the parsed response (or the
+    response object, if DEBUG is set in the search module).
+    see the functional module.
+    '''
+    spec = endpoint(name)
+    # params are filled in exactly as Search.search fills them in
+    searchParams = dict(spec.requiredParams)
+    searchParams.update(params)
+    searchParams.update(spec.forcedParams)
+    return runSearch(spec.url, searchParams)[0]
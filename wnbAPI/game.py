@@ -38,7 +38,8 @@ For information on the search history capabilities inherited from the Search
 method, please see the search module documentation. 
 """
 
-from wnbAPI.search import Search, currentSeason, requests, headers, DEBUG
+from wnbAPI.search import Search, currentSeason, DEBUG, iterArray, pbpFrame
+from wnbAPI.endpoints import endpointMethod, classEndpoints, classParams
 
 class Game(Search):
     '''
@@ -70,14 +71,7 @@ class Game(Search):
         # and that might have been a better choice, but I like
         # having a list of the accessible endpoints built into the
         # object. 
-        self.endpoints = {
-                'scoreboard': 
-                    'https://stats.wnba.com/stats/scoreboard',
-                'scoreboardv2':
-                    'https://stats.wnba.com/stats/scoreboardv2',
-                'playbyplay':'https://stats.wnba.com/stats/playbyplay',
-                'playbyplayv2':'https://stats.wnba.com/stats/playbyplayv2',
-                }
+        self.endpoints = classEndpoints('game')
             
         # set default required Parameters. These parameters are required for the 
         # majority of the methods in the class. When not required, can 
@@ -85,10 +79,7 @@ class Game(Search):
         # can be passed without affecting return for the methods where they
         # are not required.         
 
-        self.requiredParams = {
-                'GameID': '1041900405',
-                'LeagueID': '10'
-                }
+        self.requiredParams = dict(classParams['game'])
         
     def pbp(self, **params):
         '''
@@ -107,10 +98,9 @@ class Game(Search):
                       
         **** THIS ENDPOINT RETURNS A COMPLETELY DIFFERENT FORMAT THAN    ****
         **** ANY OTHER ENDPOINT IN THE PACKAGE, BUT IS INDISPENSABLE     ****
-        **** BECAUSE OF THE UNIQUE INFORMATION IT INCLUDES. NO CHANGE TO ****
-        **** DATAFRAME HAS BEEN MADE TO ACCOMMODATE THE FORMATTING       ****
-        **** OF THESE RESULTS. UNTIL THAT IS FIXED THIS METHOD SHOULD NOT****
-        **** BE USED IN CONJUNCTION WITH THE DATAFRAME METHOD            ****
+        **** BECAUSE OF THE UNIQUE INFORMATION IT INCLUDES. IT CAN'T BE  ****
+        **** USED WITH THE DATAFRAME METHOD. USE g.pbpFrame() INSTEAD,   ****
+        **** WHICH FLATTENS THE PLAYS OF EVERY PERIOD INTO ONE TABLE.    ****
         
         SAMPLE DATA STRUCTURE:
             if 'full'
@@ -272,19 +262,44 @@ class Game(Search):
                 }
             }
         
+        '''
+        # get the URL for the current params. 
+        url = self.pbpURL(**params)
+        
+        # get the object's pooled Transport, which already carries the 
+        # default headers borrowed from the resources module. 
+        s = self.getTransport()
+                
+        # check the DEBUG flag in the search module
+        # if the flag is set to True, send get request and 
+        # return the full response object
+        if DEBUG == True:
+            return s.get(url)
+        # if the method is being streamed with Game.stream('pbp'), return
+        # an iterator over the plays of every period instead
+        if self.streaming is not None:
+            return iterArray(s.get(url, stream=True), 'pla')
+        # otherwise, send Get request to the URL and return data object
+        # generated by calling the json() method on the response object
+        return s.get(url).json()
+    
+    def pbpURL(self, **params):
+        '''
+        returns the URL the pbp method requests for the current params. 
+        
+        AFFECTED ONLY BY GameID, Period, and Season. 
         '''
         # Since this method doesn't use the core search method, 
         # set input parameters to self.params now
-        # instead of passing them to 
-
-        if params:
-            self.setParams(params)
+        # instead of passing them to search (thread-safe objects use a
+        # merged copy instead, see Search.setThreadSafe)
+        params = self._callParams(params)
         
         # Set accepted params for this method to strings to use
         # in URL string. 
-        gameID = self.params.get('GameID','1041900405')
-        season = self.params.get('Season', currentSeason)
-        period = self.params.get('Period', 'full')
+        gameID = str(params.get('GameID','1041900405'))
+        season = str(params.get('Season', currentSeason))
+        period = str(params.get('Period', 'full'))
                 
         # For most endpoints, period accepts '' to mean fullgame
         # But this endpoint is different, so if self.params
@@ -292,29 +307,32 @@ class Game(Search):
         if period == '':         
             period = 'full'
         
-        # create requests Session object and set the default headers,
-        # which are borrowed from the search module. 
-        s = requests.Session() # use requests from search to save import
-        s.headers = headers
-                
-        # check the DEBUG flag in the search module
-        # if the flag is set to True, send get request and 
-        # return the full response object
-        if DEBUG == True:
-            return s.get('http://data.wnba.com/data/5s/v2015/json/mobile_teams/' \
-                         'wnba/' + season + '/scores/pbp/' + gameID + '_' 
-                         + period + '_pbp.json')
-        # otherwise, send Get request to the URL and return data object
-        # generated by calling the json() method on the response object
-        return s.get('http://data.wnba.com/data/5s/v2015/json/mobile_teams/' \
-                     'wnba/' + season + '/scores/pbp/' + gameID + '_' 
-                     + period + '_pbp.json').json()
-        # For the get requests above, I debated using Python's String.format() 
+        return ('http://data.wnba.com/data/5s/v2015/json/mobile_teams/' \
+                'wnba/' + season + '/scores/pbp/' + gameID + '_' 
+                + period + '_pbp.json')
+        # For the URL above, I debated using Python's String.format() 
         # method to form the URL string because it is the current standard
         # for string substitution. In this case, because the inserted 
         # strings are already set to descriptive variables, I feel that 
         # plus-sign concatenation is the most readable implementation.     
+    
+    def pbpFrame(self, spatialOnly=False, **params):
+        '''
+        returns the plays of every period returned by pbp() as a single
+        pandas DataFrame, with one typed column per field. 
+        
+        if spatialOnly is True, events with no location on the court 
+        (locY == -80, i.e. substitutions and timeouts) are left out. 
+        
+        see pbpArray in the decode module for the columns. 
+        '''
+        data = self.pbp(**params)
+        # DEBUG searches return the response object
+        if DEBUG == True:
+            data = data.json()
+        return pbpFrame(data, spatialOnly)
                 
+    @endpointMethod('game.scoreboard')
     def scoreboard(self, **params):
         '''
         method to access scoreboard
@@ -389,16 +407,8 @@ class Game(Search):
                     returned an empty headers array and empty 
                     rowSet array for the 'Available' table. 
         '''
-        # create dictionary with methods unique params 
-        requiredParams = {
-                'GameDate': '10/10/2019',
-                'DayOffset': '0'
-                }
-        # update dictionary with class required parameters
-        requiredParams.update(self.requiredParams)
-        # call self.search
-        return self.search(self.endpoints['scoreboard'], requiredParams, params)
-    
+
+    @endpointMethod('game.scoreboardv2')
     def scoreboardv2(self, **params):
         '''
         method to access scoreboardv2 endpoint
@@ -484,16 +494,8 @@ class Game(Search):
                     active while the game is in progress. so 
                     we should find out in May. 
         '''
-        # set method's unique required params
-        requiredParams = {
-                'GameDate': '10/10/2019',
-                'DayOffset': '0'
-                }
-        # update requiredParams with class requiredParams
-        requiredParams.update(self.requiredParams)
-        #return search
-        return self.search(self.endpoints['scoreboardv2'], requiredParams, params)
-    
+
+    @endpointMethod('game.playByPlay')
     def playByPlay(self, **params):
         '''
         method to access playbyplay endpoint. This method has significant
@@ -528,16 +530,8 @@ class Game(Search):
                    not provide link to video
            
         '''
-        # set unique required params to dict
-        requiredParams = {
-                'EndPeriod': '0',
-                'StartPeriod': '0'
-                }
-        # update dict with class required params
-        requiredParams.update(self.requiredParams)
-        # return the search
-        return self.search(self.endpoints['playbyplay'], requiredParams, params)
-    
+
+    @endpointMethod('game.playByPlayv2')
     def playByPlayv2(self, **params):
         '''
         method to access playbyplayv2 endpoint
@@ -574,20 +568,7 @@ class Game(Search):
                 -- contains 1 if video available, 0 if not. Does
                    not provide link to video
         '''
-        # set unique required params to dict
-        requiredParams = {
-                'EndPeriod': '0',
-                'StartPeriod': '0'
-                }
-        # update dict with class required params
-        requiredParams.update(self.requiredParams)
-        # return the search
-        return self.search(self.endpoints['playbyplayv2'], requiredParams, params)
-    
-      
 
-
-        
 def __main__():
     pass
 
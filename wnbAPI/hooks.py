@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:48:15 2026
+
+########################################################################
+####                                                                ####
+####                          hooks module                          ####
+####                                                                ####
+########################################################################
+
+This module lets callers watch every request the package makes, and
+see where the time goes.
+
+    A hook is any function accepting one dictionary. Hooks are added for
+    an event name, and are called every time the event happens anywhere
+    in the process:
+
+          def slow(event):
+              if event['timings']['total'] > 2:
+                  print(event['endpoint'], event['params'], event['timings'])
+
+          addHook('on_response', slow)
+
+    removeHook(name, function) removes a hook, and clearHooks() removes
+    every hook.
+
+    The events are:
+        - on_request_start: a Transport is about to send a request (once
+          for every try). carries attempt, counting from 0.
+        - on_retry: a try failed and is going to be retried. carries
+          attempt, delay (the seconds waited before the next try) and
+          reason (the status code, or the exception raised).
+        - on_response: a Transport received the response it returns.
+          carries status, bytes, attempts and timings.
+        - on_cache_hit: a search was answered without a request. carries
+          source, 'data' for the object's own Search.data, or 'cache' for
+          the persistent cache (see the cache module).
+        - on_parse_done: a response was parsed. carries stage, 'json' for
+          the body of a search or 'dataFrame' for Search.dataFrame, bytes
+          (for 'json') and timings.
+
+    Every event also carries:
+        - event: the event name
+        - endpoint: the short name of the endpoint, i.e. 'playergamelogs',
+          or 'pbp', 'schedule' or 'logo' for the data.wnba.com requests
+        - url: the URL requested
+        - params: the canonical params of the request (see the fingerprint
+          module), as a query string
+        - time: the time of the event, as returned by time.time()
+
+    timings is a dictionary of seconds spent in each phase:
+        - rateLimit: waiting on the rate limiter (see the transport module)
+        - firstByte: from sending the request until the response headers
+          arrived. requests doesn't tell connecting apart from waiting on
+          the server, so both are counted here.
+        - download: reading the body. None for streamed requests, whose
+          bodies are read later by the caller.
+        - backoff: waiting between tries
+        - total: everything above, over every try
+        - parse: (on_parse_done only) parsing the body, or building the
+          DataFrames
+
+    Requests sent with aiohttp by an AsyncTransport (see the asyncsearch
+    module) raise the same events, with the same timings.
+
+    Nothing is measured while no hooks are added. A MetricsAggregator
+    (see the metrics module) adds hooks which count requests and time
+    them per endpoint, and exports the totals in Prometheus text format.
+"""
+import threading           # import threading to lock the hook lists
+import time                # import time to timestamp events
+from urllib.parse import urlsplit # import urlsplit to name endpoints
+
+from .fingerprint import canonicalParams
+
+# every event hooks can be added for
+events = ('on_request_start', 'on_response', 'on_retry', 'on_cache_hit',
+          'on_parse_done')
+
+# tuples of hooks keyed by event. tuples are replaced, never changed, so
+# they can be read without the lock.
+_hooks = dict((event, ()) for event in events)
+_lock = threading.Lock()
+
+def addHook(event, function):
+    '''
+    adds function as a hook for event. raises ValueError for an unknown
+    event name.
+    '''
+    if event not in _hooks:
+        raise ValueError('event must be one of ' + ', '.join(events))
+    with _lock:
+        _hooks[event] = _hooks[event] + (function,)
+
+def removeHook(event, function):
+    '''
+    removes function from the hooks for event, if it is one
+    '''
+    with _lock:
+        _hooks[event] = tuple(hook for hook in _hooks.get(event, ())
+                              if hook != function)
+
+def clearHooks():
+    '''
+    removes every hook
+    '''
+    with _lock:
+        for event in events:
+            _hooks[event] = ()
+
+def hooked(event=None):
+    '''
+    returns True if there are hooks for event, or for any event if event
+    is None
+    '''
+    if event is None:
+        return any(_hooks.values())
+    return bool(_hooks[event])
+
+def endpointLabel(url):
+    '''
+    returns the short name of the endpoint at url, i.e. 'playergamelogs'
+    '''
+    path = urlsplit(url).path
+    if '/scores/pbp/' in path:
+        return 'pbp'
+    if path.endswith('_schedule.json'):
+        return 'schedule'
+    if path.endswith('.svg'):
+        return 'logo'
+    return path.rstrip('/').rsplit('/', 1)[-1] or url
+
+def emit(event, url, params=None, **info):
+    '''
+    calls every hook for event with a dictionary of info, plus the event
+    name, endpoint, url, canonical params and time. errors raised by
+    hooks are printed, and don't stop the request.
+    '''
+    hooks = _hooks[event]
+    if not hooks:
+        return
+    info.update(event=event, endpoint=endpointLabel(url), url=url,
+                params=canonicalParams(url, params or {}), time=time.time())
+    for hook in hooks:
+        try:
+            hook(info)
+        except Exception as e:
+            print({event: e})
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:41:26 2026
+
+########################################################################
+####                                                                ####
+####                          lazy module                           ####
+####                                                                ####
+########################################################################
+
+This module holds LazyModule, which stands in for a module until the
+first time one of its attributes is used.
+
+    numpy and pandas take several hundred milliseconds to import, and
+    most uses of the package (a CLI call, a worker fetching a few
+    searches) never build a DataFrame. The modules which use them hold
+    LazyModules instead:
+
+          np = LazyModule('numpy')
+
+    and np.array(...) imports numpy the first time it is called. After
+    that every attribute is read straight from the proxy, so it costs
+    no more than the module itself.
+
+    The endpoint classes, the async classes, the pipeline, sync and
+    functional modules are loaded on first use in the same way, by the
+    package's __getattr__ (see __init__.py).
+"""
+import importlib           # import importlib to load modules by name
+import threading           # import threading to load each module once
+
+class LazyModule(object):
+    '''
+    Stands in for the module called name, and imports it the first time
+    one of its attributes is read. see the lazy module.
+    '''
+    def __init__(self, name, hint=None):
+        '''
+        name is the module's full name, i.e. 'pandas'.
+
+        hint is added to the ImportError raised if the module is missing,
+        i.e. how to install it.
+        '''
+        # set through __dict__ so nothing is looked up on the module yet
+        self.__dict__['_name'] = name
+        self.__dict__['_hint'] = hint
+        self.__dict__['_module'] = None
+        self.__dict__['_lock'] = threading.Lock()
+
+    def _load(self):
+        '''
+        imports the module, copies its attributes onto the proxy and
+        returns it
+        '''
+        with self._lock:
+            if self._module is None:
+                try:
+                    module = importlib.import_module(self._name)
+                except ImportError as e:
+                    if self._hint is None:
+                        raise
+                    raise ImportError('%s (%s)' % (e, self._hint)) from e
+                # later reads find the attribute on the proxy itself, and
+                # never reach __getattr__
+                for key, value in vars(module).items():
+                    self.__dict__.setdefault(key, value)
+                self.__dict__['_module'] = module
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+        self.__dict__[attr] = value
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        if self._module is None:
+            return '<lazy module %r (not loaded)>' % self._name
+        return repr(self._module)
@@ -38,6 +38,7 @@ method, please see the search module documentation.
 """
 
 from wnbAPI.search import Search, currentSeason
+from wnbAPI.endpoints import endpointMethod, classEndpoints, classParams
     
 class League(Search):
     '''
@@ -97,22 +98,7 @@ class League(Search):
         # and that might have been a better choice, but I like
         # having a list of the accessible endpoints built into the
         # object. 
-        self.endpoints = {
-                'players': 
-                    'https://stats.wnba.com/stats/leaguedashplayerstats',
-                'standings':
-                    'https://stats.wnba.com/stats/leaguestandingsv3',
-                'teams':
-                    'https://stats.wnba.com/stats/leaguedashteamstats',
-                'shotLocations':
-                    'https://stats.wnba.com/stats/leaguedashteamshotlocations',
-                'statLeaders':
-                    'https://stats.wnba.com/stats/leagueLeaders',
-                'alltimeLeaders':
-                    'https://stats.wnba.com/stats/alltimeleadersgrids',
-                'lineups':
-                    'https://stats.wnba.com/stats/leaguedashlineups'
-                }
+        self.endpoints = classEndpoints('league')
                
         # set default required Parameters. These parameters are required for the 
         # majority of the methods in the class. When not required, can 
@@ -120,33 +106,9 @@ class League(Search):
         # can be passed without affecting return for the methods where they
         # are not required.         
           
-        self.requiredParams = {
-                'DateFrom': '',    # Required but empty string accepted
-                'DateTo':'',       # Required but empty string accepted
-                'GameSegment': '', # Required but empty string accepted
-                'LastNGames':'0',  # 0 stands for all games
-                'LeagueID':'10',   # 10 is WNBA. 00 is NBA and 30 is G-League 
-                'Location':'',     # Required but empty string accepted
-                'MeasureType': 'Base',#Required and needs string. 
-                'Month':'0',       # 0 stands for all months 
-                'Outcome':'',      # Required but empty string accepted
-                'OpponentTeamID': '0',# 0 stands for all opponents
-                'PaceAdjust':'N',  # Requires Y or N 
-                'PerMode': 'PerGame',# Requires string input
-                'Period': '0',     # 0 stands for all periods
-                'PlusMinus':'N',   # Requires Y or N
-                'Rank': 'N',       # Requires Y or N
-                'SeasonSegment':'',# Required but empty string accepted
-                'SeasonType':'Regular Season', # Requires string input
-                'VsConference': '',# Required but empty string accepted 
-                'VsDivision':'',   # Required but empty string accepted
-                'Season': currentSeason, # Requires string or integer year.
-                'GameScope': '',   # Required but empty string accepted
-                'PlayerExperience': '',# Required but empty string accepted
-                'PlayerPosition': '',# Required but empty string accepted
-                'StarterBench':''  # Required but empty string accepted
-                }
+        self.requiredParams = dict(classParams['league'])
                                
+    @endpointMethod('league.players')
     def players(self, **params):
         '''
         method for getting stats for all players in league (historic or per year)
@@ -194,8 +156,8 @@ class League(Search):
         
         
         '''
-        return self.search(self.endpoints['players'], self.requiredParams, params)
-  
+
+    @endpointMethod('league.standings')
     def standings(self, **params):
         '''
         method for getting current league standings
@@ -237,8 +199,8 @@ class League(Search):
                 'Dec', 
         
         '''
-        return self.search(self.endpoints['standings'], self.requiredParams, params)
-    
+
+    @endpointMethod('league.teams')
     def teams(self, **params):
         '''
         method for getting team stats
@@ -290,8 +252,8 @@ class League(Search):
                 'PFD_RANK', 'PTS_RANK', 'PLUS_MINUS_RANK', 
                 'CFID', 'CFPARAMS', 
         '''
-        return self.search(self.endpoints['teams'], self.requiredParams, params)
-    
+
+    @endpointMethod('league.shotLocations')
     def shotLocations(self, **params):
         '''
         method for getting League shot location data.
@@ -301,11 +263,11 @@ class League(Search):
  
         
         **** THIS ENDPOINT RETURNS TWO ROWS OF HEADERS. IT IS CURRENTLY  ****
-        **** THE ONLY ENDPOINT DOCUMENTED WHICH DOES THIS. AS SUCH,      ****
-        **** THE SEARCH DATAFRAME METHOD HAS NOT BEEN ADJUSTE            ****
-        **** TO ACCOMDATE THE FORMATTING OF THESE RESULTS. UNTIL         ****
-        **** THAT IS FIXED THIS METHOD SHOULD NOT BE USED IN CONJUNCTION ****
-        **** WITH THE DATAFRAME METHOD                                   ****
+        **** THE ONLY ENDPOINT DOCUMENTED WHICH DOES THIS. THE DATAFRAME ****
+        **** METHOD FLATTENS THEM INTO 'Restricted Area.FGM' STYLE       ****
+        **** COLUMN NAMES, OR KEEPS THEM AS A MULTIINDEX WITH            ****
+        **** l.dataFrame(multiIndex=True). FOR ONE ROW PER TEAM AND ZONE ****
+        **** USE longFrame() FROM THE DECODE MODULE.                     ****
         
         
         IGNORES:
@@ -372,15 +334,8 @@ class League(Search):
                                          'FGA',
                                          'FG_PCT']}],
         '''
-        requiredParams = {}
-        
-        for key in self.requiredParams:
-            requiredParams[key] = self.requiredParams[key]
-            
-        requiredParams.update({'DistanceRange':'By Zone'})
-        
-        return self.search(self.endpoints['shotLocations'], requiredParams, params)
-    
+
+    @endpointMethod('league.statLeaders')
     def statLeaders(self, **params):
         '''
         method for getting statistical leader data
@@ -431,20 +386,8 @@ class League(Search):
                 'EFF', 'AST_TOV', 'STL_TOV', 
 
         '''
-        requiredParams = {}
-        
-        if self.params.get('PerMode',0) != 'Totals':
-            self.setParams({'PerMode':'Totals'})
-        
-        for key in self.requiredParams:
-            requiredParams[key] = self.requiredParams[key]
-            
-        requiredParams.update({'StatCategory':'FT_PCT',
-                               'Scope': 'RS',
-                               'PerMode': 'Totals'})
-            
-        return self.search(self.endpoints['statLeaders'], requiredParams, params)
-        
+
+    @endpointMethod('league.alltimeLeaders')
     def alltimeLeaders(self, **params):
         '''
         method for getting all time statistical leader data
@@ -561,15 +504,8 @@ class League(Search):
                 'PLAYER_ID', 'PLAYER_NAME', 'FT_PCT', 
                 'FT_PCT_RANK', 
         '''
-        requiredParams = {}
-        
-        for key in self.requiredParams:
-            requiredParams[key] = self.requiredParams[key]
-            
-        requiredParams.update({'TopX':'10'})
-        
-        return self.search(self.endpoints['alltimeLeaders'], requiredParams, params)
-    
+
+    @endpointMethod('league.lineups')
     def lineups(self, **params):
         '''
         method for getting league lineup data
@@ -619,14 +555,3 @@ class League(Search):
                 'PFD_RANK', 'PTS_RANK', 'PLUS_MINUS_RANK', 
 
         '''
-        requiredParams = {}
-        
-        for key in self.requiredParams:
-            requiredParams[key] = self.requiredParams[key]
-        
-        requiredParams.update({'GroupQuantity': '5'})
-        
-        return self.search(self.endpoints['lineups'], requiredParams, params)            
-           
-
-
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:14:39 2026
+
+########################################################################
+####                                                                ####
+####                         metrics module                         ####
+####                                                                ####
+########################################################################
+
+This module holds the MetricsAggregator, which counts and times every
+request the package makes, per endpoint, and exports the totals in the
+Prometheus text format.
+
+    m = MetricsAggregator().attach()
+
+    adds request hooks (see the hooks module) which keep:
+        - wnbapi_requests_total: responses received, by endpoint and
+          status code
+        - wnbapi_retries_total: retried tries, by endpoint
+        - wnbapi_cache_hits_total: searches answered without a request,
+          by endpoint and source ('data' or 'cache')
+        - wnbapi_response_bytes_total: bytes downloaded, by endpoint
+        - wnbapi_request_seconds: a histogram of request times, by
+          endpoint and phase ('rateLimit', 'firstByte', 'download',
+          'backoff' and 'total')
+        - wnbapi_parse_seconds: a histogram of parse times, by endpoint
+          and stage ('json' or 'dataFrame')
+
+    m.render() returns the metrics as Prometheus text. They can be
+    written to a file, i.e. for the node exporter's textfile collector:
+
+          m.writeFile('/var/lib/node_exporter/wnbapi.prom')
+
+    or sent to a socket, either a (host, port) tuple for TCP or the path
+    of a unix socket:
+
+          m.send(('localhost', 9400))
+
+    m.detach() removes the hooks again, and m.reset() clears the totals.
+    buckets sets the upper bounds, in seconds, of the histogram buckets.
+"""
+import os                  # import os to write files atomically
+import socket              # import socket to send metrics
+import tempfile            # import tempfile to write files atomically
+import threading           # import threading to lock the totals
+
+from .hooks import addHook, removeHook
+
+# default histogram buckets, in seconds
+defaultBuckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                  10.0, 30.0)
+
+# the help text and type of every metric, in the order they are written
+metricTypes = [
+    ('wnbapi_requests_total', 'counter',
+     'Responses received, by endpoint and status code.'),
+    ('wnbapi_retries_total', 'counter', 'Retried tries, by endpoint.'),
+    ('wnbapi_cache_hits_total', 'counter',
+     'Searches answered without a request, by endpoint and source.'),
+    ('wnbapi_response_bytes_total', 'counter',
+     'Bytes downloaded, by endpoint.'),
+    ('wnbapi_request_seconds', 'histogram',
+     'Seconds spent in each phase of a request, by endpoint and phase.'),
+    ('wnbapi_parse_seconds', 'histogram',
+     'Seconds spent parsing responses, by endpoint and stage.'),
+    ]
+
+def labelText(labels):
+    '''
+    returns a tuple of (name, value) labels in Prometheus syntax
+    '''
+    return ','.join('%s="%s"' % (name, str(value).replace('\\', '\\\\')
+                                 .replace('"', '\\"').replace('\n', '\\n'))
+                    for name, value in labels)
+
+class Histogram(object):
+    '''
+    Counts of observed values under each bucket's upper bound, with their
+    sum and count
+    '''
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+class MetricsAggregator(object):
+    '''
+    Per-endpoint request counters and latency histograms, fed by the
+    request hooks. see the metrics module.
+    '''
+    def __init__(self, buckets=defaultBuckets):
+        self.buckets = tuple(sorted(buckets))
+        self.lock = threading.Lock()
+        self.hooks = [('on_response', self.onResponse),
+                      ('on_retry', self.onRetry),
+                      ('on_cache_hit', self.onCacheHit),
+                      ('on_parse_done', self.onParseDone)]
+        self.reset()
+
+    def attach(self):
+        '''
+        adds the aggregator's hooks, and returns the aggregator
+        '''
+        for event, hook in self.hooks:
+            addHook(event, hook)
+        return self
+
+    def detach(self):
+        '''
+        removes the aggregator's hooks
+        '''
+        for event, hook in self.hooks:
+            removeHook(event, hook)
+
+    def reset(self):
+        '''
+        clears every total
+        '''
+        with self.lock:
+            # {metric name: {labels tuple: value or Histogram}}
+            self.metrics = dict((name, {}) for name, kind, text in metricTypes)
+
+    def count(self, name, labels, amount=1):
+        with self.lock:
+            values = self.metrics[name]
+            values[labels] = values.get(labels, 0) + amount
+
+    def observe(self, name, labels, value):
+        with self.lock:
+            values = self.metrics[name]
+            if labels not in values:
+                values[labels] = Histogram(self.buckets)
+            values[labels].observe(value)
+
+    def onResponse(self, event):
+        endpoint = event['endpoint']
+        self.count('wnbapi_requests_total',
+                   (('endpoint', endpoint), ('status', event['status'])))
+        if event['bytes']:
+            self.count('wnbapi_response_bytes_total',
+                       (('endpoint', endpoint),), event['bytes'])
+        for phase, seconds in event['timings'].items():
+            if seconds is not None:
+                self.observe('wnbapi_request_seconds',
+                             (('endpoint', endpoint), ('phase', phase)),
+                             seconds)
+
+    def onRetry(self, event):
+        self.count('wnbapi_retries_total', (('endpoint', event['endpoint']),))
+
+    def onCacheHit(self, event):
+        self.count('wnbapi_cache_hits_total',
+                   (('endpoint', event['endpoint']),
+                    ('source', event['source'])))
+
+    def onParseDone(self, event):
+        self.observe('wnbapi_parse_seconds',
+                     (('endpoint', event['endpoint']),
+                      ('stage', event['stage'])),
+                     event['timings']['parse'])
+
+    def render(self):
+        '''
+        returns every metric in Prometheus text format
+        '''
+        lines = []
+        with self.lock:
+            for name, kind, text in metricTypes:
+                values = self.metrics[name]
+                lines.append('# HELP %s %s' % (name, text))
+                lines.append('# TYPE %s %s' % (name, kind))
+                for labels in sorted(values, key=str):
+                    value = values[labels]
+                    if kind == 'counter':
+                        lines.append('%s{%s} %s' % (name, labelText(labels),
+                                                    value))
+                        continue
+                    for bound, count in zip(value.buckets, value.counts):
+                        lines.append('%s_bucket{%s} %d' % (
+                                name, labelText(labels + (('le', repr(bound)),)),
+                                count))
+                    lines.append('%s_bucket{%s} %d' % (
+                            name, labelText(labels + (('le', '+Inf'),)),
+                            value.count))
+                    lines.append('%s_sum{%s} %r' % (name, labelText(labels),
+                                                    value.sum))
+                    lines.append('%s_count{%s} %d' % (name, labelText(labels),
+                                                      value.count))
+        return '\n'.join(lines) + '\n'
+
+    def writeFile(self, path):
+        '''
+        writes the metrics to path. the file is written whole and then
+        moved into place, so readers never see half of it.
+        '''
+        directory = os.path.dirname(os.path.abspath(path))
+        handle, temp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(handle, 'w') as f:
+            f.write(self.render())
+        os.replace(temp, path)
+
+    def send(self, address, timeout=5):
+        '''
+        sends the metrics to a socket: a (host, port) tuple for TCP, or
+        the path of a unix socket
+        '''
+        if isinstance(address, str):
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(timeout)
+            connection.connect(address)
+        else:
+            connection = socket.create_connection(address, timeout)
+        with connection:
+            connection.sendall(self.render().encode('utf-8'))
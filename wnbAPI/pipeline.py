@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:22:40 2026
+
+########################################################################
+####                                                                ####
+####                        pipeline module                         ####
+####                                                                ####
+########################################################################
+
+This module downloads the play-by-play of a whole season in one call,
+and stores it on disk in a compact columnar form.
+
+    downloadSeasonPbp(Season='2019', path='pbp')
+
+        1. finds the season's game IDs with seasonGameIDs(), which reads
+           every team's schedule (see schedule() in the search module)
+           and keeps each completed game once.
+        2. downloads the full-game Game.pbp of every game through the
+           shared Transport, with no more than max_workers requests in
+           flight at once.
+        3. flattens each game's plays with pbpArray() (see the decode
+           module) and writes them, one compressed numpy .npz file of
+           typed columns per game, into a directory per season:
+
+               pbp/Season=2019/GameID=1021900405.npz
+
+    Progress is checkpointed after every game in a _checkpoint.json file
+    next to the game files, and every file is written under a temporary
+    name and then renamed, so an interrupted download leaves no half
+    written games behind. Running downloadSeasonPbp again with the same
+    path resumes where it stopped: games already stored are skipped, and
+    games which failed are tried again.
+
+    It returns a SeasonDownload named tuple of:
+        - path: the season's directory
+        - downloaded: the game IDs downloaded by this call
+        - skipped: the game IDs which were already stored
+        - failed: a dictionary of {game ID: error} for games which failed
+
+    The game IDs can also be passed in directly, i.e. if they were found
+    with scoreboardGameIDs(dates), which reads Game.scoreboardv2 for each
+    date instead of the team schedules.
+
+    loadGamePbp(Season, GameID, path) reads one stored game back as a
+    pandas DataFrame, and loadSeasonPbp(Season, path) reads every stored
+    game of a season into one DataFrame with a GAME_ID column.
+"""
+import json                # import json to read and write checkpoints
+import os                  # import os to manage the store's files
+import threading           # import threading to lock the checkpoint
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from .lazy import LazyModule
+from .resources import currentSeason, teams
+from .search import schedule
+from .decode import pbpArray
+from .game import Game
+
+np = LazyModule('numpy')   # numpy to store columns, and pandas to load
+pd = LazyModule('pandas')  # stored games. both are imported on first use.
+
+SeasonDownload = namedtuple('SeasonDownload',
+                            ['path', 'downloaded', 'skipped', 'failed'])
+
+# name of the checkpoint file in each season's directory
+CHECKPOINT = '_checkpoint.json'
+
+def seasonGameIDs(Season=currentSeason, TeamIDs=None, completedOnly=True,
+                  max_workers=4):
+    '''
+    returns a sorted list of the game IDs of a season, read from the
+    schedule of every team in TeamIDs (all teams by default). Each game
+    appears once, though it is on two schedules.
+
+    if completedOnly is True, games which haven't finished are left out.
+    '''
+    if TeamIDs is None:
+        TeamIDs = list(teams)
+
+    def teamGames(TeamID):
+        res = schedule(TeamID=TeamID, Season=Season)
+        if res.status_code != 200:   # i.e. teams which didn't exist yet
+            return []
+        return res.json()['gscd']['g']
+
+    gameIDs = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for games in pool.map(teamGames, TeamIDs):
+            for game in games:
+                # st '3' marks a game that is over
+                if not completedOnly or str(game.get('st')) == '3':
+                    gameIDs.add(game['gid'])
+    return sorted(gameIDs)
+
+def scoreboardGameIDs(dates, max_workers=4):
+    '''
+    returns a sorted list of the game IDs played on dates (a list of
+    'MM/DD/YYYY' strings), read from Game.scoreboardv2.
+    '''
+    def dayGames(date):
+        data = Game().scoreboardv2(GameDate=date)
+        header = [r for r in data['resultSets'] if r['name'] == 'GameHeader'][0]
+        column = header['headers'].index('GAME_ID')
+        return [row[column] for row in header['rowSet']]
+
+    gameIDs = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for games in pool.map(dayGames, dates):
+            gameIDs.update(games)
+    return sorted(gameIDs)
+
+def seasonPath(path, Season):
+    '''
+    returns the directory a season's games are stored in
+    '''
+    return os.path.join(path, 'Season=' + str(Season))
+
+def gamePath(path, Season, GameID):
+    '''
+    returns the file a game's plays are stored in
+    '''
+    return os.path.join(seasonPath(path, Season), 'GameID=' + str(GameID) + '.npz')
+
+def writeAtomic(filename, write):
+    '''
+    calls write(file) on a temporary file, then renames it to filename,
+    so filename is never left half written
+    '''
+    temporary = filename + '.tmp'
+    with open(temporary, 'wb') as f:
+        write(f)
+    os.replace(temporary, filename)
+
+def readCheckpoint(directory):
+    '''
+    returns the checkpoint of a season's directory as a dictionary with
+    the keys 'done' (a set of game IDs) and 'failed' (a dictionary of
+    {game ID: error}).
+    '''
+    try:
+        with open(os.path.join(directory, CHECKPOINT)) as f:
+            checkpoint = json.load(f)
+    except (IOError, ValueError):
+        checkpoint = {'done': [], 'failed': {}}
+    # a set, so games downloaded again (i.e. after their file went
+    # missing) are only listed once
+    checkpoint['done'] = set(checkpoint['done'])
+    return checkpoint
+
+def writeCheckpoint(directory, checkpoint):
+    '''
+    writes the checkpoint of a season's directory
+    '''
+    checkpoint = dict(checkpoint, done=sorted(checkpoint['done']))
+    body = json.dumps(checkpoint, sort_keys=True).encode('utf-8')
+    writeAtomic(os.path.join(directory, CHECKPOINT), lambda f: f.write(body))
+
+def savePlays(filename, plays):
+    '''
+    writes a pbpArray() table to filename as a compressed .npz file with
+    one array per column. text is stored as fixed width unicode, so the
+    file can be read without pickle.
+    '''
+    cols = {}
+    for name in plays.dtype.names:
+        col = plays[name]
+        cols[name] = col.astype(str) if col.dtype == object else col
+    writeAtomic(filename, lambda f: np.savez_compressed(f, **cols))
+
+def downloadSeasonPbp(Season=currentSeason, path='pbp', gameIDs=None,
+                      max_workers=8):
+    '''
+    downloads the full-game play-by-play of every game of a season (or of
+    the games in gameIDs), and stores each game's plays under path.
+    resumes from the checkpoint left by an earlier call. returns a
+    SeasonDownload. see the pipeline module.
+    '''
+    directory = seasonPath(path, Season)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    if gameIDs is None:
+        gameIDs = seasonGameIDs(Season)
+    # the checkpoint and file names hold ids as strings, so ids passed as
+    # ints still match them
+    gameIDs = [str(GameID) for GameID in gameIDs]
+
+    checkpoint = readCheckpoint(directory)
+    done = checkpoint['done']
+    # games are only skipped if their file is really there
+    skipped = [g for g in gameIDs
+               if g in done and os.path.exists(gamePath(path, Season, g))]
+    todo = [g for g in gameIDs if g not in set(skipped)]
+
+    lock = threading.Lock()        # guards the checkpoint
+    downloaded = []
+    failed = {}
+
+    def download(GameID):
+        try:
+            data = Game().pbp(GameID=GameID, Season=Season, Period='full')
+            savePlays(gamePath(path, Season, GameID), pbpArray(data))
+        except Exception as e:
+            with lock:
+                failed[GameID] = repr(e)
+                checkpoint['failed'][GameID] = repr(e)
+                writeCheckpoint(directory, checkpoint)
+            return
+        with lock:
+            downloaded.append(GameID)
+            checkpoint['done'].add(GameID)
+            checkpoint['failed'].pop(GameID, None)
+            writeCheckpoint(directory, checkpoint)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(download, todo))
+
+    return SeasonDownload(directory, sorted(downloaded), skipped, failed)
+
+def loadGamePbp(Season, GameID, path='pbp'):
+    '''
+    returns the stored plays of one game as a pandas DataFrame
+    '''
+    with np.load(gamePath(path, Season, GameID)) as f:
+        return pd.DataFrame({name: f[name] for name in f.files})
+
+def loadSeasonPbp(Season=currentSeason, path='pbp'):
+    '''
+    returns the stored plays of every game of a season as one pandas
+    DataFrame, with a GAME_ID column naming each play's game.
+    '''
+    directory = seasonPath(path, Season)
+    games = []
+    for filename in sorted(os.listdir(directory)):
+        if filename.startswith('GameID=') and filename.endswith('.npz'):
+            GameID = filename[len('GameID='):-len('.npz')]
+            df = loadGamePbp(Season, GameID, path)
+            df.insert(0, 'GAME_ID', GameID)
+            games.append(df)
+    if not games:
+        return pd.DataFrame()
+    return pd.concat(games, ignore_index=True)
@@ -37,6 +37,7 @@ For information on the search history capabilities inherited from the Search
 method, please see the search module documentation. 
 """
 from wnbAPI.search import Search, currentSeason
+from wnbAPI.endpoints import endpointMethod, classEndpoints, classParams
              
 class Player(Search):
     '''
@@ -98,28 +99,7 @@ class Player(Search):
         # and that might have been a better choice, but I like
         # having a list of the accessible endpoints built into the
         # object. 
-        self.endpoints = {
-                'awards':
-                    'https://stats.wnba.com/stats/playerawards',
-                'career':
-                    'https://stats.wnba.com/stats/playercareerstats', 
-                'gamelogs':
-                    'https://stats.wnba.com/stats/playergamelogs',
-                'shooting':
-                    'https://stats.wnba.com/stats/playerdashboardbyshootingsplits',
-                'clutch':
-                    'https://stats.wnba.com/stats/playerdashboardbyclutch',
-                'splits':
-                    'https://stats.wnba.com/stats/playerdashboardbygeneralsplits',
-                'lastNGames': 
-                    'https://stats.wnba.com/stats/playerdashboardbylastngames',
-                'opponentSplits':
-                    'https://stats.wnba.com/stats/playerdashboardbyopponent',
-                'teamPerformance':
-                    'https://stats.wnba.com/stats/playerdashboardbyteamperformance',
-                'yearOverYear':
-                    'https://stats.wnba.com/stats/playerdashboardbyyearoveryear'
-                  }
+        self.endpoints = classEndpoints('player')
         
         
         # set default required Parameters. These parameters are required for the 
@@ -128,30 +108,9 @@ class Player(Search):
         # can be passed without affecting return for the methods where they
         # are not required. 
         
-        self.requiredParams = {
-            'DateFrom': '',   # Required but empty string accepted
-            'DateTo':'',      # Required but empty string accepted
-            'GameSegment': '',# Required but empty string accepted
-            'LastNGames':'0', # 0 stands for all games
-            'LeagueID':'10',  # 10 is WNBA. 00 is NBA and 30 is G-League 
-            'Location':'',    # Required but empty string accepted
-            'MeasureType': 'Base',#Required and needs string. 
-            'Month':'0',      # 0 stands for all months 
-            'Outcome':'',     # Required but empty string accepted
-            'OpponentTeamID': '0',# 0 stands for all opponents
-            'PaceAdjust':'N', # Requires Y or N 
-            'PerMode': 'PerGame',# Requires string input
-            'Period': '0',    # 0 stands for all periods
-            'PlusMinus':'N',  # Requires Y or N
-            'Rank': 'N',      # Requires Y or N
-            'SeasonSegment':'',# Required but empty string accepted
-            'SeasonType':'Regular Season', # Requires string input
-            'VsConference': '',# Required but empty string accepted 
-            'VsDivision':'',  # Required but empty string accepted
-            'Season': currentSeason, # Requires string or integer year.
-            'PlayerID': '203399', # 2019 WNBA MVP Elena Delle Donne
-                }
+        self.requiredParams = dict(classParams['player'])
                
+    @endpointMethod('player.awards')
     def awards(self, **params):
         '''
         function to get player awards. 
@@ -176,8 +135,8 @@ class Player(Search):
             'SUBTYPE2', 'SUBTYPE3', 
 
         '''
-        return self.search(self.endpoints['awards'], self.requiredParams, params)
-    
+
+    @endpointMethod('player.career')
     def career(self, **params):
         '''
         function to get player career stats
@@ -256,8 +215,8 @@ class Player(Search):
                 'RANK_PG_TOV', 'RANK_PG_PTS', 'RANK_PG_EFF', 
  
         '''
-        return self.search(self.endpoints['career'], self.requiredParams, params)
 
+    @endpointMethod('player.gamelogs')
     def gamelogs(self, **params):
         '''
         function to get player gamelogs
@@ -315,8 +274,8 @@ class Player(Search):
                 'TD3_RANK', 
 
         '''
-        return self.search(self.endpoints['gamelogs'], self.requiredParams, params)
-        
+
+    @endpointMethod('player.shooting')
     def shooting(self, **params):
         '''
         function to get player shooting dashboard
@@ -367,8 +326,8 @@ class Player(Search):
                 'PCT_UAST_FGM_RANK', 'CFID', 'CFPARAMS', 
             
         '''
-        return self.search(self.endpoints['shooting'], self.requiredParams, params)
-    
+
+    @endpointMethod('player.clutch')
     def clutch(self, **params):
         '''
         function to get player dashboard by clutch    
@@ -431,8 +390,8 @@ class Player(Search):
                 'NBA_FANTASY_PTS_RANK', 'DD2_RANK', 'TD3_RANK', 
                 'CFID', 'CFPARAMS', 
         '''
-        return self.search(self.endpoints['clutch'], self.requiredParams, params)
-    
+
+    @endpointMethod('player.splits')
     def splits(self, **params):
         '''
         function to get player dashboard by general splits
@@ -492,8 +451,8 @@ class Player(Search):
                 'CFID', 'CFPARAMS', 
 
         '''
-        return self.search(self.endpoints['splits'], self.requiredParams, params)
 
+    @endpointMethod('player.lastNGames')
     def lastNGames(self, **params):
         '''
         function to get player dashboard by last N games
@@ -558,8 +517,8 @@ class Player(Search):
                 'CFID', 'CFPARAMS', 
 
         '''
-        return self.search(self.endpoints['lastNGames'], self.requiredParams, params)
-    
+
+    @endpointMethod('player.opponentSplits')
     def opponentSplits(self, **params):
         '''
         function to get player dashboard by opponent splits
@@ -615,8 +574,8 @@ class Player(Search):
                 'CFID', 'CFPARAMS', 
    
         '''
-        return self.search(self.endpoints['opponentSplits'], self.requiredParams, params)
-    
+
+    @endpointMethod('player.teamPerformance')
     def teamPerformance(self, **params):
         '''
         function to get player dashboard by team performance
@@ -695,8 +654,8 @@ class Player(Search):
                 'DD2_RANK', 'TD3_RANK', 'CFID', 
                 'CFPARAMS',          
         '''
-        return self.search(self.endpoints['teamPerformance'], self.requiredParams, params)
-    
+
+    @endpointMethod('player.yearOverYear')
     def yearOverYear(self, **params):
         '''
         function to get player dashboard by year over year
@@ -751,8 +710,6 @@ class Player(Search):
                 'NBA_FANTASY_PTS_RANK', 'DD2_RANK', 'TD3_RANK', 
                 'CFID', 'CFPARAMS', 
         '''
-        return self.search(self.endpoints['yearOverYear'], self.requiredParams, params)
-    
-    
+
 def __main__():
     pass
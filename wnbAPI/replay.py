@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:52:37 2026
+
+########################################################################
+####                                                                ####
+####                         replay module                          ####
+####                                                                ####
+########################################################################
+
+This module holds the ReplayTransport, which records the responses the
+package receives and plays them back later without touching the network.
+
+    Every request the package makes goes through the shared Transport
+    (see the transport module): Search.search and every endpoint method,
+    Game.pbp, schedule() and the logo functions. A ReplayTransport set in
+    its place can work in one of two modes:
+        - 'record' sends each request through a real Transport, and stores
+          the response in a FixtureStore before returning it. Only
+          successful (2xx) responses are stored, unless the
+          ReplayTransport is created with recordErrors=True, so a
+          throttled or failed request isn't played back forever after.
+        - 'replay' answers each request from the FixtureStore, with no
+          network I/O at all. A request with no stored fixture raises a
+          KeyError.
+
+          store = FixtureStore('Tests/fixtures')
+
+          setTransport(ReplayTransport(store, mode='record'))
+          Player().gamelogs(PlayerID='203399', Season='2019')
+
+          and later, offline
+
+          setTransport(ReplayTransport(store))
+          Player().gamelogs(PlayerID='203399', Season='2019')
+
+    Fixtures are keyed by the fingerprint of the request (see the
+    fingerprint module), so a replayed search doesn't have to pass its
+    params in the same order, or with the same value types, as the
+    recorded one. Each fixture is one gzip compressed file in the store's
+    directory, named after its fingerprint, holding a line of JSON (URL,
+    params, status code and headers) followed by the raw response body.
+    Files are written whole and then moved into place, so a store can be
+    recorded into by many threads at once.
+
+    Replayed responses are FixtureResponse objects, which carry the parts
+    of requests.Response the package uses: status_code, headers, content,
+    text, json() and iter_content() (for streamed searches).
+
+    The test modules replay from a store instead of hitting stats.wnba.com
+    when the WNBAPI_FIXTURES environment variable is set to the store's
+    directory, or, if it isn't set, when Tests/fixtures holds any
+    fixtures. Setting WNBAPI_FIXTURE_MODE to 'record' records into the
+    store, i.e. to fill Tests/fixtures from a machine with network access:
+
+          WNBAPI_FIXTURE_MODE=record python -m pytest Tests
+    The AsyncSearch classes can replay too, through
+    AsyncTransport(transport=ReplayTransport(store)).
+"""
+import gzip                # import gzip to compress fixture bodies
+import json                # import json to write fixture metadata
+import os                  # import os to lay out the fixture directory
+import tempfile            # import tempfile to write fixtures atomically
+import threading           # import threading to lock the counters
+
+from requests.structures import CaseInsensitiveDict
+
+from .fingerprint import fingerprint
+from .transport import Transport, Counters
+
+class FixtureResponse(object):
+    '''
+    Response played back from a fixture. Mirrors the parts of
+    requests.Response used by the package.
+    '''
+    def __init__(self, url, status_code, headers, content):
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content.decode('utf-8'))
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        '''
+        returns an iterator over the body in chunks of chunk_size bytes,
+        like a streamed requests.Response
+        '''
+        content = self.content
+        step = chunk_size or len(content) or 1
+        for start in range(0, len(content), step):
+            chunk = content[start:start + step]
+            yield chunk.decode('utf-8') if decode_unicode else chunk
+
+    def close(self):
+        pass
+
+    def __bool__(self):
+        # like requests.Response, responses are truthy unless they
+        # carry an error status code
+        return self.ok
+
+class FixtureStore(object):
+    '''
+    Directory of recorded responses keyed by request fingerprint. see the
+    replay module.
+
+    f.load(url, params) returns the stored FixtureResponse, or None.
+
+    f.save(url, params, response) stores a response.
+    '''
+    def __init__(self, path='wnbAPI_fixtures'):
+        '''
+        path is the directory fixtures are kept in. it is created when the
+        first fixture is saved.
+        '''
+        self.path = path
+
+    def filename(self, url, params):
+        '''
+        returns the path of the fixture for a request
+        '''
+        return os.path.join(self.path, fingerprint(url, params or {}) + '.gz')
+
+    def load(self, url, params=None):
+        '''
+        returns the stored response to a request as a FixtureResponse, or
+        None if none is stored.
+        '''
+        try:
+            with gzip.open(self.filename(url, params), 'rb') as f:
+                meta = json.loads(f.readline().decode('utf-8'))
+                content = f.read()
+        except FileNotFoundError:
+            return None
+        return FixtureResponse(meta['url'], meta['status_code'],
+                               meta['headers'], content)
+
+    def save(self, url, params, response):
+        '''
+        stores the response to a request, replacing any stored before
+        '''
+        meta = {'url': url,
+                'params': dict((str(k), str(v))
+                               for k, v in (params or {}).items()),
+                'status_code': response.status_code,
+                'headers': dict(getattr(response, 'headers', None) or {})}
+        os.makedirs(self.path, exist_ok=True)
+        # write to a temporary file first, so readers never see half a
+        # fixture
+        handle, temp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        with os.fdopen(handle, 'wb') as raw:
+            with gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as f:
+                f.write(json.dumps(meta).encode('utf-8') + b'\n')
+                f.write(response.content)
+        os.replace(temp, self.filename(url, params))
+
+    def __iter__(self):
+        '''
+        iterates over (url, params, FixtureResponse) for every stored
+        fixture
+        '''
+        if not os.path.isdir(self.path):
+            return
+        for name in sorted(os.listdir(self.path)):
+            if not name.endswith('.gz'):
+                continue
+            with gzip.open(os.path.join(self.path, name), 'rb') as f:
+                meta = json.loads(f.readline().decode('utf-8'))
+                content = f.read()
+            yield meta['url'], meta['params'], FixtureResponse(
+                    meta['url'], meta['status_code'], meta['headers'], content)
+
+    def __contains__(self, request):
+        url, params = request
+        return os.path.exists(self.filename(url, params))
+
+    def __len__(self):
+        if not os.path.isdir(self.path):
+            return 0
+        return len([name for name in os.listdir(self.path)
+                    if name.endswith('.gz')])
+
+class ReplayTransport(object):
+    '''
+    Transport which records responses into a FixtureStore, or plays them
+    back from one. see the replay module.
+    '''
+    modes = ('record', 'replay')
+
+    def __init__(self, store, mode='replay', transport=None,
+                 recordErrors=False):
+        '''
+        store is the FixtureStore to use, or the path of its directory.
+
+        mode is 'record' or 'replay'.
+
+        transport is the Transport recorded requests are sent with. If
+        none is passed, a new Transport is created when the first request
+        is recorded.
+
+        recordErrors sets whether responses with a status code outside
+        200-299 are recorded too. they are returned either way.
+        '''
+        if mode not in self.modes:
+            raise ValueError('mode must be one of ' + ', '.join(self.modes))
+        self.store = store if isinstance(store, FixtureStore) \
+                     else FixtureStore(store)
+        self.mode = mode
+        self.transport = transport
+        self.recordErrors = recordErrors
+        self.lock = threading.Lock()
+        self.counters = Counters('recorded', 'unrecorded', 'replayed',
+                                 'missing')
+
+    def getTransport(self):
+        '''
+        returns the Transport recorded requests are sent with
+        '''
+        with self.lock:
+            if self.transport is None:
+                self.transport = Transport()
+            return self.transport
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        '''
+        returns the response to a GET request to url with params, from
+        the store in replay mode, or from the network in record mode.
+        '''
+        if self.mode == 'replay':
+            response = self.store.load(url, params)
+            if response is None:
+                self.counters.add('missing')
+                raise KeyError('no fixture recorded for %s with params %r'
+                               % (url, params))
+            self.counters.add('replayed')
+            return response
+
+        response = self.getTransport().get(url, params=params,
+                                           timeout=timeout, **kwargs)
+        # reading content downloads the whole body of streamed requests,
+        # so they are played back from memory like the rest
+        if self.recordErrors or 200 <= response.status_code < 300:
+            self.store.save(url, params, response)
+            self.counters.add('recorded')
+        else:
+            self.counters.add('unrecorded')
+        return FixtureResponse(url, response.status_code,
+                               getattr(response, 'headers', None),
+                               response.content)
+
+    @property
+    def stats(self):
+        '''
+        returns a dictionary of the ReplayTransport's counters
+        '''
+        return self.counters.snapshot()
+
+    def close(self):
+        '''
+        closes the recording Transport, if one was created
+        '''
+        if self.transport is not None:
+            self.transport.close()
@@ -141,16 +141,12 @@ teams = {'1611661330': {'ta': 'ATL',     # Atlanta and Chicago's data wasn't
 
 
 # creates dictionary of known parameters and accepted values. 
-# at the moment this is purely a convenience object which the user
-# can print (or access by key) to see the known acceptable values
-# for a given parameter. 
+# the user can print (or access by key) this dictionary to see the known
+# acceptable values for a given parameter. 
 #
-# when this dictionary has been cleaned up and finalized, it should
-# also be useful in building an input validation function to notify
-# the user when they've requested an invalid value for a parameter. 
-    # this will likely involve converting this dict to its own class
-    # so that we can store printable strings displaying examples of the
-    # acceptable values, but also store regex strings to validate input 
+# the validate module compiles its param checks from this dictionary
+# when it is imported, to notify the user when they've requested an 
+# invalid value for a parameter before the request is sent. 
 param_list = {
         'DateFrom':['2001-02-10','12/10/2002', '2014-02-14'], # 'MM(-/)DD(-/)YYYY' || 'YYYY(-/)MM(-/)DD,
         'DateTo': ['2018-02-10','02/10/2019','2017-06-30'], #'MM(-/)DD(-/)YYYY' || 'YYYY(-/)MM(-/)DD,
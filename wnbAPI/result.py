@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:05:31 2026
+
+########################################################################
+####                                                                ####
+####                         result module                          ####
+####                                                                ####
+########################################################################
+
+This module holds the Result class, a lazily parsed search result.
+
+    By default, every search parses the whole response body into nested
+    dictionaries and lists, even when only one of its result sets is
+    going to be used. Game.scoreboardv2, for example, returns ten tables,
+    and a job which only reads LineScore pays to parse all ten.
+
+    Lazy results are turned on per object:
+
+          g = Game()
+          g.setLazy()
+
+          r = g.scoreboardv2(GameDate='2019-07-27')
+
+    With lazy results on, endpoint methods return (and store, and point
+    to) a Result instead of a dictionary. A Result holds the response body
+    as raw bytes, and only decodes what is asked for:
+
+        - r.resultSet('LineScore') decodes just that result set, skipping
+          over the rows of the others without parsing them, and keeps it.
+        - r.toFrame('LineScore') returns it as a pandas DataFrame, built
+          column by column (see the decode module).
+        - r.toArrow('LineScore') returns it as a pyarrow Table. pyarrow is
+          optional, and only needed for this method.
+
+    For all three, the name can be left out to use the first result set.
+
+    A Result is also a read-only mapping, so code written for the parsed
+    dictionaries keeps working: r['resultSets'], r.get('parameters'),
+    dict(r), s.dataFrame() and so on parse the whole body the first time
+    they are used (once), exactly as a normal search would have.
+
+    r.json() returns the whole parsed body, and r.body (or r.content)
+    the raw bytes.
+"""
+import json                    # import json to parse the body
+from collections.abc import Mapping
+
+from .decode import frame
+from .export import arrowTable
+from .stream import readResultSet
+
+class Result(Mapping):
+    '''
+    Lazily parsed search result. see the result module.
+    '''
+    def __init__(self, body, status_code=200):
+        '''
+        body is the JSON response body, as bytes (or str).
+
+        status_code is the HTTP status of the response.
+        '''
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.body = body
+        self.status_code = status_code
+        self.parsed = None       # the whole parsed body, once needed
+        self.resultSets = {}     # result sets decoded on their own
+
+    @property
+    def content(self):
+        '''
+        the raw body, named as on a response object
+        '''
+        return self.body
+
+    def json(self):
+        '''
+        returns the whole parsed body, parsing it the first time
+        '''
+        if self.parsed is None:
+            self.parsed = json.loads(self.body.decode('utf-8'))
+        return self.parsed
+
+    def resultSet(self, name=None):
+        '''
+        returns the result set called name (or the first result set if
+        name is None) as a dictionary with the keys 'name', 'headers' and
+        'rowSet'. only that result set is decoded. raises KeyError if the
+        response doesn't have it.
+        '''
+        if self.parsed is not None:
+            # the whole body has already been parsed, so look there
+            found = self.parsed.get('resultSets') or self.parsed.get('resultSet')
+            if isinstance(found, dict):
+                found = [found]
+            for resultSet in found or []:
+                if name is None or resultSet.get('name') == name:
+                    return resultSet
+            raise KeyError('no result set named %r in response' % name)
+
+        if name not in self.resultSets:
+            resultSet = readResultSet(self.body, name)
+            self.resultSets[name] = resultSet
+            self.resultSets[resultSet['name']] = resultSet
+        return self.resultSets[name]
+
+    def toFrame(self, name=None, multiIndex=False):
+        '''
+        returns the result set called name (or the first) as a pandas
+        DataFrame with typed columns. multiIndex keeps two level headers
+        as a MultiIndex (see frame in the decode module).
+        '''
+        return frame(self.resultSet(name), multiIndex)
+
+    def toArrow(self, name=None):
+        '''
+        returns the result set called name (or the first) as a pyarrow
+        Table with typed columns. requires pyarrow.
+        '''
+        return arrowTable(self.resultSet(name))
+
+    # the mapping interface parses the whole body
+    def __getitem__(self, key):
+        return self.json()[key]
+
+    def __iter__(self):
+        return iter(self.json())
+
+    def __len__(self):
+        return len(self.json())
+
+    def __bool__(self):
+        # like the parsed dictionary, an empty body is falsy. checked
+        # without parsing the body if it hasn't been parsed yet.
+        if self.parsed is not None:
+            return bool(self.parsed)
+        return bool(self.body.strip(b' \t\r\n{}'))
+
+    def __repr__(self):
+        return '<Result %d bytes%s>' % (len(self.body),
+                                        ', parsed' if self.parsed is not None else '')
@@ -13,9 +13,9 @@ This module holds the base Search class on which the search subclasses
 are built, and also contains a handful of convenience methods. 
 
     The Search object is the core of this package. It is essentially
-    an extended wrapper for a standard API request using the Python 
-    builtin requests.Session() object. Parameter permutations are the 
-    largest obstacle to accessing the stats.wnba.com/ api, so the Search
+    an extended wrapper for a standard API request sent through the 
+    package's shared keep-alive Transport (see the transport module). 
+    Parameter permutations are the largest obstacle to accessing the stats.wnba.com/ api, so the Search
     object is primarily a parameter handler. 
     
     Features include:
@@ -92,20 +92,59 @@ are built, and also contains a handful of convenience methods.
         - s.search returns the data object created by calling the .json() 
         method of the response object sent by the server. 
         
+        - if a persistent cache has been set with setCache() (see the 
+        cache module), s.search looks there before sending a request, and 
+        stores new results there. 
+        
+    s.setTransport(transport) hands the object its own Transport (see the
+    transport module) instead of the Transport shared by the package. 
+    s.getTransport() returns whichever Transport the object is using. 
+    
     s.back() and s.forw() are used to move the pointer through the search
     history. 
     
+    s.setLimits(maxEntries, maxBytes, maxHistory) caps the memory used by
+    stored results and search history, evicting the least recently used
+    results first (see the store module). Searches whose results were 
+    evicted are skipped by s.back() and s.forw(). 
+    
     s.getPointerParams() returns the parameters which were used to generate
     the data currently showing in the pointer. 
     
     s.setPointerParams() sets params to the parameters which were used to 
     generate the data currently showing in the pointer
     
+    s.stream(method, name, **params) calls an endpoint method but returns
+    an iterator over the rows of one of its result sets, read from the 
+    response as it arrives, instead of the parsed data (see the stream
+    module). 
+    
+    s.setThreadSafe() lets one object serve many threads at once. Each 
+    endpoint call then searches with its own read-only snapshot of the 
+    params merged with the call's arguments, leaving s.params untouched, 
+    and the history, index and pointer are updated together, under a 
+    lock, when the call's result arrives. Without it, a call's params 
+    are merged into s.params, so calls made at the same time from 
+    different threads can pick up each other's params. 
+    
+    s.setLazy() makes searches return Result objects, which keep the raw
+    response and only decode the result sets that are used, instead of 
+    parsed dictionaries (see the result module). 
+    
+    s.export(path) writes the result sets of the search currently in the 
+    pointer to partitioned Parquet or Arrow files, which readExport() 
+    reads back (see the export module). 
+    
     s.dataFrame() returns a pandas dataFrame describing the object currently
     in the pointer. 
         - This dataFrame is not stored and should always be set to a
         variable for further processing. 
     
+    Search.batch(method, paramSets, max_workers) runs one endpoint method
+    over many param dictionaries on a thread pool, and returns the results
+    in order (see the batch module). It is a class method, so it is called
+    on the class: Player.batch('gamelogs', [{'PlayerID': '203399'}, ...]). 
+    
     s.shotchartDetail() is a special method. It is currently the only
     endpoint method that is used by all subclasses, so it lives here
     on the superclass. 
@@ -120,6 +159,12 @@ parameters:
     schedule() - to retrieve a team's season schedule (which requires 
                  the team's TeamID as an argument)
     
+All of these functions, and every Search object that hasn't been given
+its own Transport, send their requests through the shared Transport 
+returned by getTransport(). Call setTransport(transport) to replace it. 
+A ReplayTransport records their responses to disk, or plays them back 
+with no network I/O at all (see the replay module). 
+    
 Additonally, 3 items of interest which are imported to this module from the 
 Resources module can be called directly: 
     - headers - which shows the default headers for the package
@@ -137,16 +182,150 @@ Resources module can be called directly:
 DEBUG = False # set Debug to true and searches will return response objects
 #DEBUG = True # instead of json. 
 
-import numpy as np         # import numpy as pandas pre-req
-import pandas as pd        # import pandas to look at data 
 from datetime import date  # import date to access current year in schedule()
 import requests            # import requests to make requests
+from urllib.parse import parse_qsl # import parse_qsl to read history keys
+import threading           # import threading for thread-safe objects
+import copyreg             # import copyreg to pickle param snapshots
+import time                # import time to time parsing for the hooks
+from types import MappingProxyType # to make read-only param snapshots
+
+# Import the pooled Transport shared by all requests in the package
+from .transport import (Transport, getTransport, setTransport, RateLimiter,
+                        getRateLimiter, setRateLimit, SingleFlight,
+                        getSingleFlight)
+
+# Import the optional persistent response cache
+from .cache import SQLiteCache, getCache, setCache
+
+# Import the record/replay transport used for offline runs
+from .replay import ReplayTransport, FixtureStore, FixtureResponse
+
+# Import the functions used to key stored and cached searches
+from .fingerprint import normalizeParams, sentParams, canonicalParams, fingerprint
+
+# Import the batch runner used by Search.batch
+from .batch import BatchResult, batch as runBatch
+
+# Import the columnar decoder used by Search.dataFrame, and numpy and
+# pandas, which it imports the first time a DataFrame is built
+from .decode import (columns, frame, frames, longFrame, pbpArray,
+                     pbpFrame, np, pd)
+
+# Import the streaming row reader used by Search.stream
+from .stream import RowStream, iterArray
+
+# Import the Parquet/Arrow exporters used by Search.export
+from .export import (exportResult, exportPbp, exportSchedule, readExport,
+                     arrowTable)
+
+# Import the lazily parsed Result returned by searches with setLazy()
+from .result import Result
+
+# Import the bounded result store used for Search.data
+from .store import ResultStore, boundedHistory
+
+# Import the endpoint registry the endpoint methods are built from
+from .endpoints import endpointMethod
+
+# Import the param checks run before every search is sent
+from .validate import validateParams, getValidation, setValidation
+
+# Import the request hooks (see the hooks module)
+from .hooks import addHook, removeHook, clearHooks, hooked, emit
+
+# Import the aggregator exporting the hooks' totals to Prometheus
+from .metrics import MetricsAggregator
 
 # Import default headers, basic team info, currentSeason value, 
 # and list of all possible parameters. 
 from .resources import *
 #from resources import *
 
+def snapshot(params):
+    '''
+    returns a read-only snapshot of params, as stored by thread-safe 
+    objects
+    '''
+    return MappingProxyType(dict(params))
+
+# snapshots can't be copied or pickled as they are, so they are rebuilt 
+# from a dict
+copyreg.pickle(MappingProxyType, lambda view: (snapshot, (dict(view),)))
+
+# The steps every search goes through once its params are settled. 
+# Search.search, the async searches and functional.fetch all run them, 
+# so a request is checked, cached, sent, parsed and reported on the same
+# way whichever of them makes it. 
+
+def cachedSearch(endpoint, searchParams, lazy=False):
+    '''
+    returns the persistent cache's result for a search, or None if there
+    is no cache, the search isn't cached, or DEBUG is set (DEBUG searches
+    need the response object). lazy returns the cached body as a Result.
+    '''
+    cache = getCache()
+    if cache is None or DEBUG:
+        return None
+    if lazy:
+        cached = cache.get(endpoint, searchParams, raw=True)
+        if cached is not None:
+            cached = Result(cached)
+    else:
+        cached = cache.get(endpoint, searchParams)
+    if cached is not None:
+        emit('on_cache_hit', endpoint, searchParams, source='cache')
+    return cached
+
+def parseSearch(endpoint, searchParams, datum, lazy=False):
+    '''
+    parses the response of a sent search and saves successful results to
+    the persistent cache. returns a tuple of the result and the size of
+    the response body in bytes, or None if it isn't known. 
+    
+    lazy results aren't parsed at all until they are used (see the result
+    module). if DEBUG is set, the response object itself is the result. 
+    '''
+    if DEBUG:
+        return datum, None
+    start = time.perf_counter()
+    if lazy:
+        result = Result(datum.content, datum.status_code)
+    else:
+        result = datum.json()
+    size = len(getattr(datum, 'content', b'')) or None
+    if hooked('on_parse_done'):
+        emit('on_parse_done', endpoint, searchParams, stage='json',
+             bytes=size, timings={'parse': time.perf_counter() - start})
+    cache = getCache()
+    if cache is not None and datum.status_code == 200:
+        cache.set(endpoint, searchParams, result.body if lazy else result)
+    return result, size
+
+def runSearch(endpoint, searchParams, transport=None, lazy=False,
+              validate=True):
+    '''
+    runs a search with searchParams, its final params, through every step
+    after its params are built: checks the params (unless validate is
+    False), looks it up in the persistent cache, then sends it through 
+    transport (the shared Transport if None) and parses the response. 
+    returns a tuple of the result and the size of its response body, 
+    which is None for cached results. 
+    '''
+    if validate:
+        validateParams(endpoint, searchParams)
+    cached = cachedSearch(endpoint, searchParams, lazy)
+    if cached is not None:
+        return cached, None
+    if transport is None:
+        transport = getTransport()
+    # headers are set on the transport, which also waits on the shared 
+    # rate limiter and retries failed requests with backoff, raising an 
+    # error if it is unable to connect after 5 tries. 
+    datum = transport.get(endpoint, params=sentParams(endpoint, searchParams),
+                          timeout=(4,100))
+    return parseSearch(endpoint, searchParams, datum, lazy)
+
 class Search(object):
     '''
     While the Search class is not intended for independent usage, it is 
@@ -188,9 +367,11 @@ class Search(object):
         
         self.index = 0      # track index of history for back and forward funcs
         
-        self.data = {}      # store search data. Will contain tuples of 
+        self.data = ResultStore() # store search data. Will contain tuples of 
                             # (params, data object) keyed by tuples of 
-                            # (endpoint, str(params))
+                            # (endpoint, canonicalParams(endpoint, params))
+                            # unlimited unless limits are set with 
+                            # setLimits() (see the store module)
                             
         self.pointer = {}   # hold the "current" data set
     
@@ -199,6 +380,20 @@ class Search(object):
                           
         self.requiredParams = {} # initialize requiredParams to empty dictionary
                                   # to explicitly declare type. 
+        
+        self.transport = None # use the package's shared Transport unless
+                              # one is set with setTransport()
+        
+        self.local = threading.local() # hold per-thread state
+        self.streaming = None # set by stream() while an endpoint method 
+                              # is being streamed
+        
+        self.threadSafe = False # set with setThreadSafe()
+        self.lock = threading.RLock() # guard history, index, pointer and
+                                      # data in thread-safe mode
+        
+        self.lazy = False     # return lazily parsed Results instead of 
+                              # dicts if set with setLazy()
         # Though 3 of the subclasses have large numbers of common required 
         # params,  the current implementation is to explicitly declare all 
         # required params at the class level rather than inheriting
@@ -210,6 +405,28 @@ class Search(object):
         if params:
             self.setParams(params)
             
+    @property
+    def streaming(self):
+        # kept per thread, so streaming a call on one thread doesn't
+        # stream calls made on others
+        return getattr(self.local, 'streaming', None)
+    
+    @streaming.setter
+    def streaming(self, value):
+        self.local.streaming = value
+    
+    def __getstate__(self):
+        # the lock and the per-thread state can't be copied or pickled, so
+        # they are left out, and made anew by __setstate__
+        state = dict(self.__dict__)
+        del state['local'], state['lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.local = threading.local()
+        self.lock = threading.RLock()
+            
     def __call__(self):
         '''
         Calling the Search object returns the current data pointer, and is
@@ -262,6 +479,88 @@ class Search(object):
         if self.params.get(param):
             del self.params[param]
     
+    def setTransport(self, transport):
+        '''
+        hands the object its own Transport to send requests through,
+        instead of the Transport shared by the package. pass None to
+        go back to the shared Transport. 
+        '''
+        self.transport = transport
+        
+    def getTransport(self):
+        '''
+        returns the Transport the object sends its requests through
+        '''
+        if self.transport is None:
+            return getTransport()
+        return self.transport
+    
+    def setLimits(self, maxEntries=None, maxBytes=None, maxHistory=None):
+        '''
+        limits the memory used by the object's stored results and history.
+        None means unlimited, which is the default for all three. 
+        
+        maxEntries and maxBytes cap the number and total size of the 
+        results kept in self.data. the least recently used results are 
+        evicted first. 
+        
+        maxHistory keeps only the most recent maxHistory searches in 
+        self.history. 
+        
+        see the store module. 
+        '''
+        with self.lock:
+            if not isinstance(self.data, ResultStore):
+                store = ResultStore()
+                for key, value in self.data.items():
+                    store[key] = value
+                self.data = store
+            self.data.setLimits(maxEntries, maxBytes)
+            
+            # keep the index pointing at the same search if the oldest 
+            # entries are dropped from history
+            dropped = 0
+            if maxHistory is not None:
+                dropped = max(0, len(self.history) - maxHistory)
+            self.history = boundedHistory(self.history, maxHistory)
+            self.index = max(0, self.index - dropped)
+    
+    def setLazy(self, lazy=True):
+        '''
+        turns lazy results on (or off). while they are on, searches 
+        return, store and point to Result objects which keep the raw 
+        response body and only parse the parts that are used, instead of 
+        parsed dictionaries. see the result module. 
+        '''
+        self.lazy = lazy
+    
+    def setThreadSafe(self, threadSafe=True):
+        '''
+        turns thread-safe mode on (or off). while it is on, endpoint calls
+        don't change self.params: each searches with a read-only snapshot 
+        of self.params updated with the call's arguments. history, index 
+        and pointer are updated together, under a lock, when a call's 
+        result arrives, so one object can be shared by many threads. 
+        '''
+        self.threadSafe = threadSafe
+    
+    def _callParams(self, params):
+        '''
+        returns the params an endpoint call uses: self.params updated with
+        params. 
+        
+        self.params itself is updated, unless the object is thread-safe, 
+        in which case a merged copy is returned instead. 
+        '''
+        if not self.threadSafe:
+            if params:
+                self.setParams(params)
+            return self.params
+        with self.lock:
+            merged = dict(self.params)
+        merged.update(params or {})
+        return merged
+    
     def getParamList(self):
         '''
         returns list of all known parameter keys and accepted values for
@@ -269,13 +568,15 @@ class Search(object):
         '''
         return param_list
         
-    def search(self, endpoint, requiredParams, params):
+    def search(self, endpoint, requiredParams, params, forcedParams=None):
         '''
         univeral method attempts to GET the selected URL with the params
         currently stored in self.params as the parameter values.
         
         If a params argument is included, self.params is updated before the
-        request is sent.
+        request is sent. requiredParams fill in any params that aren't set,
+        and forcedParams replace whatever is set, for this search only. 
+        Neither is kept in self.params. 
         
         raises error if unable to connect after 5 tries. 
         
@@ -297,19 +598,72 @@ class Search(object):
            - in all endpoints tested so far the key 'rowSet' has not varied 
             
         '''
+        # merge the params, record the search in history, and take a 
+        # snapshot of the params to search with
+        key, searchParams = self._prepare(endpoint, requiredParams, params,
+                                          forcedParams)
+        
+        # streamed searches return a RowStream over the response body
+        # instead of downloading and storing it (see the stream module)
+        if self.streaming is not None:
+            return self._stream(endpoint, searchParams)
+        
+        # return the stored result if this search has been done before
+        stored = self._lookup(endpoint, key, searchParams)
+        if stored is not None:
+            return stored
+        
+        # otherwise check the persistent cache, or send the request 
+        # through the object's transport. the params were checked by 
+        # _prepare. 
+        result, size = runSearch(endpoint, searchParams, self.getTransport(),
+                                 self.lazy, validate=False)
+        return self._store(key, searchParams, result, size)
+    
+    def _prepare(self, endpoint, requiredParams, params, forcedParams=None):
+        '''
+        first step of a search, shared by Search.search and the async
+        searches. 
+        
+        merges params into self.params, records the search in history, 
+        and returns a tuple of the search's storage key and the params to 
+        search with: requiredParams, updated with self.params, updated 
+        with forcedParams. the defaults are never written into self.params,
+        so they can't leak into the next method's search. 
+        
+        thread-safe objects leave self.params and history alone, and 
+        return a read-only snapshot. the search is recorded in history by
+        _point() when its result arrives. 
+        '''
+        # build this search's own params. the method's defaults fill in 
+        # anything the object or the call hasn't set. 
+        searchParams = dict(requiredParams or {})
+        with self.lock:
+            searchParams.update(self.params)
+        searchParams.update(params or {})
+        searchParams.update(forcedParams or {})
+        
+        # check the params this search would send before anything is 
+        # stored or sent, so a bad value fails straight away and isn't 
+        # kept in self.params (see the validate module)
+        if getValidation():
+            validateParams(endpoint, searchParams)
+        
         # if parameter argument is submitted, updated the params
-        if params:
+        if params and not self.threadSafe:
             self.setParams(params)
         
+        # build the key for this endpoint/parameter combination. the 
+        # canonical params ignore key order, value types, and params the 
+        # endpoint doesn't accept (see the fingerprint module). 
+        key = (endpoint, canonicalParams(endpoint, searchParams))
         
-        
-        # if requiredParams argument is submitted, update the params
-        if requiredParams:
-            self.setParams(requiredParams)
-      
+        if self.threadSafe:
+            # searchParams is already this call's own copy
+            return key, MappingProxyType(searchParams)
         
         # assign endpoint/parameter combination to history array
-        self.history.append((endpoint, str(self.params)))
+        self.history.append(key)
         # this may result in the same endpoint/parameter combination being
         # included in the array multiple times. This is intentional. If a
         # search is repeated, the user should see that search at both positions
@@ -323,91 +677,161 @@ class Search(object):
         # should reflect that. 
         self.index = len(self.history)-1
         
+        return key, searchParams
+    
+    def _lookup(self, endpoint, key, searchParams):
+        '''
+        second step of a search. returns the result of the search stored
+        in self.data, or None if it has to be found in the persistent 
+        cache or sent (see runSearch). 
+        '''
         # check if endpoint/parameter combination has been requested during this session
-        if self.data.get((endpoint, str(self.params)), 0):
-            # if the search has already been used, return the result of the
-            # previous search. 
-            return self.data[(endpoint, str(self.params))][1]
-        
-        s = requests.Session()
-        s.headers = headers     # set headers
-        s.params = self.params       # set params
-        
-        # Set up error handling for the upcoming API request. 
-        # These features only became necessary when I was testing the object
-        # and repeated searches started to cause failures that weren't 
-        # related to the program itself. 
-        errors = []       # Initialize list to collect request errors 
-                          # if multiple tries are needed. 
-        retry_flag = 0    # set flag to count number of retries
-
-        
-        while True:                                      # open loop
-            try:                                         # handle exceptions
-                datum = s.get(endpoint, timeout=(4,100))  # attempt request 
-                s.close()
-            except (requests.exceptions.Timeout,         
-                    requests.exceptions.TooManyRedirects, # for all exceptions
-                    requests.exceptions.RequestException) as e: 
-                retry_flag += 1                           # increment flag
-                errors.append({endpoint: e})              # store the error
-                
-                if retry_flag == 5:                      # if we hit 5, give up
-                    print(errors)
-                    raise e
-            else: # if we get through the try statement without an error 
-                # store the data in history
-                if not self.data.get(endpoint,False):
-                    self.data[(endpoint, str(self.params))] = {}
-                
-                if not DEBUG:
-                    self.data[(endpoint, str(self.params))] = (self.params, datum.json())
-                    # set the new pointer
-                    self.pointer = datum.json()
-                    # and return the data
-                    return datum.json()
-                if DEBUG:
-                     self.data[(endpoint, str(self.params))] = (self.params, datum)
-                     self.pointer = datum
-                     return datum
+        with self.lock:
+            stored = self.data.get(key, 0)
+        if stored:
+            # if the search has already been used, point to and return the 
+            # result of the previous search. 
+            emit('on_cache_hit', endpoint, searchParams, source='data')
+            return self._point(key, stored[1])
+        return None
+    
+    def _store(self, key, searchParams, result, size=None):
+        '''
+        last step of a search. stores the result of a search found in the
+        persistent cache or sent, sets the pointer and returns the data. 
+        '''
+        self._remember(key, searchParams, result, size)
+        return self._point(key, result)
+    
+    def _point(self, key, result):
+        '''
+        points to the result of the search stored under key, and returns
+        it. thread-safe objects record the search in history here, under 
+        the lock, so history, index and pointer always agree. 
+        '''
+        with self.lock:
+            if self.threadSafe:
+                self.history.append(key)
+                self.index = len(self.history)-1
+            self.pointer = result
+        return result
+    
+    def _stream(self, endpoint, searchParams):
+        '''
+        sends a streamed search and returns a RowStream over the result 
+        set named by stream(). 
+        '''
+        datum = self.getTransport().get(endpoint, 
+                                        params=sentParams(endpoint, searchParams),
+                                        timeout=(4,100), stream=True)
+        name = self.streaming if self.streaming is not True else None
+        return RowStream(datum, name)
+    
+    def stream(self, method, name=None, **params):
+        '''
+        calls the endpoint method named method with params, and returns
+        an iterator over the rows of its result set called name (or the
+        first result set if name is None), read from the response as it
+        arrives rather than parsed all at once. 
+        
+            for row in p.stream('gamelogs', PlayerID='203399'):
+                ...
+        
+        the result isn't stored. see the stream module. 
+        '''
+        self.streaming = name if name is not None else True
+        try:
+            return getattr(self, method)(**params)
+        finally:
+            self.streaming = None
+    
+    def _remember(self, key, searchParams, result, size=None):
+        '''
+        stores the result of a search in self.data, along with the size of
+        its response body in bytes, if known. 
+        '''
+        with self.lock:
+            if isinstance(self.data, ResultStore):
+                self.data.put(key, (searchParams, result), size)
+            else:
+                self.data[key] = (searchParams, result)
 
+    @classmethod
+    def batch(cls, method, paramSets, max_workers=8, **params):
+        '''
+        calls the endpoint method named method once for every param 
+        dictionary in paramSets, on a thread pool of max_workers threads. 
+        
+            results = Player.batch('gamelogs', [{'PlayerID': '203399'}, 
+                                                {'PlayerID': '1628276'}],
+                                   max_workers=8, Season='2019')
+        
+        any other keyword arguments are params shared by every call. 
+        
+        each call is made on its own new object, identical requests are 
+        only sent once, and a failing call doesn't stop the others. 
+        returns a list of BatchResult(params, data, error) named tuples in
+        the same order as paramSets. see the batch module. 
+        '''
+        return runBatch(cls, method, paramSets, max_workers, **params)
 
     def back(self):
         '''
         moves pointer back one search in history. if the current search was
         first in the session, moves to the most recent search. 
+        
+        searches whose results have been evicted from self.data are 
+        skipped. 
         '''
-        if not self.history:
-            return 'No searches recorded.'
-        self.index -= 1
-        if self.index < 0:
-            self.index = len(self.history)-1
-            
-        newPointer = self.history[self.index]
-        self.pointer = self.data[(newPointer)][1]    
-        return self.pointer
+        return self._move(-1)
     
     def forw(self):
         '''
         moves pointer to the next search in history. if current search
         is the most recent, moves to the first search of session. 
+        
+        searches whose results have been evicted from self.data are 
+        skipped. 
+        '''
+        return self._move(1)
+    
+    def _move(self, step):
+        '''
+        moves the index step places through history, wrapping around at
+        either end, until it reaches a search whose result is still 
+        stored. sets and returns the pointer. 
+        
+        if no search in history has a stored result, the pointer and
+        index are left where they were. 
         '''
-        if not self.history:
-            return 'No searches recorded.'
-        self.index += 1
-        if self.index > len(self.history) -1:
-            self.index = 0
+        with self.lock:
+            if not self.history:
+                return 'No searches recorded.'
             
-        newPointer = self.history[self.index]
-        self.pointer = self.data[(newPointer)][1]
-        return self.pointer
+            index = self.index
+            for n in range(len(self.history)):
+                index = (index + step) % len(self.history)
+                stored = self.data.get(self.history[index])
+                if stored is not None:
+                    self.index = index
+                    self.pointer = stored[1]
+                    return self.pointer
+            return self.pointer
     
     def getPointerParams(self):
         '''
         Returns the paramaters that were set for the search that is 
         currently displayed in self.pointer
+        
+        if the result of the current search has been evicted, its params
+        are rebuilt from the history key. 
         '''
-        return self.data[self.history[self.index]][0]
+        with self.lock:
+            key = self.history[self.index]
+            stored = self.data.get(key)
+        if stored is not None:
+            return dict(stored[0])
+        return dict(parse_qsl(key[1], keep_blank_values=True))
         
     def setPointerParams(self):
         '''
@@ -420,10 +844,14 @@ class Search(object):
         self.clearParams()
         self.setParams(self.getPointerParams())
         
-    def dataFrame(self):
+    def dataFrame(self, multiIndex=False):
         '''
         sets the dataset in the pointer to a pandas dataframe
         
+        result sets with two rows of headers (i.e. League.shotLocations) 
+        get 'group.stat' column names, or a pandas MultiIndex if 
+        multiIndex is True. 
+        
         So far all endpoints investigated have the same basic structure
         and so this function works universally. This may not 
         always be the case if endpoints are changed or added. 
@@ -436,25 +864,41 @@ class Search(object):
         if not self.pointer:
             return 'No search recorded.'
         
-        if self.pointer.get('resultSet', False): # check for singular variation
-            data = self.pointer['resultSet']     # get the data from the pointer
-                                                 # then make the data frame.  
-            df = {data['name']: pd.DataFrame(data['rowSet'], columns=data['headers'])}
-        elif self.pointer.get('resultSets', False): # else look for plural
-            data = self.pointer['resultSets']       # retrieve data
-            tables = {}                             # intialize empty dictionary
-            for table in data:                      # loop through the data
-                tables[table['name']] = pd.DataFrame(table['rowSet'],\
-                      columns=table['headers'])  # fill the dictionary, use 
-                                                 # resultSet's as key, df as value 
-           # after the loop, return the full dictionary. 
-            df = tables 
-        else: # if we don't find resultSets or resultSet, but the pointer 
-              # wasn't empty, we don't want to raise an error. just inform
-              # the user that the method couldn't find the search results. 
+        # build a dictionary of data frames keyed by resultSet name, 
+        # reading each resultSet column by column into typed arrays
+        # (see the decode module)
+        start = time.perf_counter()
+        df = frames(self.pointer, multiIndex)
+        if hooked('on_parse_done') and self.history:
+            with self.lock:
+                endpoint = self.history[self.index][0]
+            emit('on_parse_done', endpoint, self.getPointerParams(),
+                 stage='dataFrame',
+                 timings={'parse': time.perf_counter() - start})
+        if df is None: # if we don't find resultSets or resultSet, but the  
+                       # pointer wasn't empty, we don't want to raise an  
+                       # error. just inform the user that the method  
+                       # couldn't find the search results. 
             return 'Unable to find search results.'
         return df
     
+    def export(self, path='lake', format='parquet'):
+        '''
+        writes every result set of the search currently in the pointer to
+        a Parquet (or, with format='arrow', Arrow IPC) file under path, 
+        partitioned by endpoint, result set, Season, SeasonType, TeamID 
+        and PlayerID. returns the list of files written. requires pyarrow. 
+        see the export module. 
+        '''
+        with self.lock:
+            if not self.pointer or not self.history:
+                return 'No search recorded.'
+            pointer = self.pointer
+            endpoint = self.history[self.index][0]
+            params = self.getPointerParams()
+        return exportResult(pointer, endpoint, params, path, format)
+    
+    @endpointMethod('search.shotchartDetail')
     def shotchartDetail(self, **params):
         '''
         Method added 11/1 for shotChartDetail endpoint
@@ -488,36 +932,6 @@ class Search(object):
                 'SHOT_ZONE_RANGE', 'FGA', 'FGM', 
                 'FG_PCT', 
         '''
-        
-        # initialize empty dictionary
-        requiredParams = {}
-        # fill it with object's default required params
-        requiredParams.update(self.requiredParams)
-        # insert additional defaults
-        requiredParams.update({'PlayerID': 0,
-                               'RookieYear': '',
-                               'ContextMeasure': 'PTS',
-                               'GameID': '',
-                               'PlayerPosition': '',
-                               'TeamID': '0',
-                               'DateFrom': '',  
-                               'DateTo':'',
-                               'GameSegment': '',
-                               'LastNGames':'0',
-                               'LeagueID':'10',
-                               'Location':'',
-                               'MeasureType': 'Base',
-                               'Month':'0',
-                               'Period':'0',
-                               'Outcome':'',
-                               'OpponentTeamID': '0',
-                               'VsConference': '',
-                               'VsDivision':'',
-                               'SeasonSegment':'',
-                               'SeasonType':'Regular Season'
-                               })
-        # run the search    
-        return self.search('https://stats.wnba.com/stats/shotchartdetail', requiredParams, params)
 
 
 ########################################################################
@@ -539,13 +953,7 @@ def logo():
     sport-stats blog project that inspired the package. 
     '''
     
-    s = requests.Session()
-    
-    s.headers = headers
-        
-    outp = s.get('https://stats.wnba.com/media/img/league/wnba-logo.svg')
-    s.close()
-    return outp
+    return getTransport().get('https://stats.wnba.com/media/img/league/wnba-logo.svg')
         
 def logo2():
     '''
@@ -560,13 +968,7 @@ def logo2():
 
     '''
    
-    s = requests.Session()
-    
-    s.headers = headers
-    
-    outp =  s.get('https://stats.wnba.com/media/img/league/wnba-secondary-logo.svg')
-    s.close()
-    return outp 
+    return getTransport().get('https://stats.wnba.com/media/img/league/wnba-secondary-logo.svg')
 
 def nbaLogo():
     '''
@@ -581,13 +983,7 @@ def nbaLogo():
     for sports blog related etc. etc. etc. 
     '''
  
-    s = requests.Session()
-    
-    s.headers = headers
-   
-    outp = s.get('https://stats.wnba.com/media/img/league/nba-logoman.svg')  
-    s.close()
-    return outp
+    return getTransport().get('https://stats.wnba.com/media/img/league/nba-logoman.svg')
     
 def teamLogo(TeamID='1611661321'):
         '''
@@ -606,15 +1002,15 @@ def teamLogo(TeamID='1611661321'):
             
         '''
     
-        s = requests.Session()
-        
-        s.headers = headers
-            
-        shortCode = teams[TeamID]['ta']
-       
-        outp =  s.get('https://stats.wnba.com/media/img/teams/logos/' + shortCode + '.svg')
-        s.close()
-        return outp
+        return getTransport().get(teamLogoURL(TeamID))
+
+def teamLogoURL(TeamID='1611661321'):
+    '''
+    returns the URL teamLogo() requests for a TeamID
+    '''
+    shortCode = teams[TeamID]['ta']
+    
+    return 'https://stats.wnba.com/media/img/teams/logos/' + shortCode + '.svg'
     
 
 def schedule(TeamID='1611661324', Season=currentSeason):
@@ -630,16 +1026,16 @@ def schedule(TeamID='1611661324', Season=currentSeason):
     url: 'https://data.wnba.com/data/10s/v2015/json/mobile_teams/wnba/' + 
               str(Season) + '/teams/' + teamName + '_schedule.json')
     '''
-    s = requests.Session()
-    
-    s.headers = headers
-    
+    return getTransport().get(scheduleURL(TeamID, Season))
+
+def scheduleURL(TeamID='1611661324', Season=currentSeason):
+    '''
+    returns the URL schedule() requests for a TeamID and Season
+    '''
     teamName = teams[TeamID]['tn'].lower() #retrieve team shortCode 
         
-    outp = s.get('https://data.wnba.com/data/10s/v2015/json/mobile_teams/wnba/' + 
-              str(Season) + '/teams/' + teamName + '_schedule.json')
-    s.close()
-    return outp             
+    return ('https://data.wnba.com/data/10s/v2015/json/mobile_teams/wnba/' + 
+            str(Season) + '/teams/' + teamName + '_schedule.json')             
 
         
 def __main__():
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:31:05 2026
+
+########################################################################
+####                                                                ####
+####                         store module                           ####
+####                                                                ####
+########################################################################
+
+This module holds the ResultStore class, which is the dictionary every
+Search object keeps its results in (s.data).
+
+    Without limits, a ResultStore behaves exactly like the plain dict
+    s.data used to be: every result is kept until the object is thrown
+    away. That's what you want in the console, but a long running worker
+    which reuses one League() object for a whole season's scrape would
+    grow without bound.
+
+    Limits are set with the Search object's setLimits() method:
+
+          s.setLimits(maxEntries=500)
+
+          or
+
+          s.setLimits(maxBytes=64 * 2**20)
+
+          or
+
+          s.setLimits(maxEntries=500, maxBytes=64 * 2**20, maxHistory=1000)
+
+    maxEntries caps the number of stored results, and maxBytes caps their
+    total size (measured as the size of the response body, or of the
+    result encoded as JSON when the body isn't available). When either
+    limit is passed, the least recently used results are evicted first.
+    Looking a result up, or moving the pointer onto it with back() or
+    forw(), counts as a use.
+
+    maxHistory turns s.history into a ring buffer (a collections.deque)
+    which only keeps the most recent maxHistory searches.
+
+    Evicting a result never breaks the search history. A search whose
+    result was evicted is simply sent again (or read from the persistent
+    cache) the next time it is made, and back() and forw() skip over
+    history entries whose results are gone.
+"""
+import json                             # import json to measure results
+from collections import OrderedDict, deque
+
+class ResultStore(OrderedDict):
+    '''
+    Dictionary of search results with optional LRU eviction.
+
+    Keys are (endpoint, canonical params) tuples, and values are
+    (params, data) tuples, exactly as in the plain dict s.data used to be.
+
+    r.put(key, value, size) stores a value with a known size in bytes.
+    r[key] = value works too, measuring the value if a byte limit is set.
+    '''
+    def __init__(self, maxEntries=None, maxBytes=None):
+        '''
+        maxEntries is the largest number of results kept. None means
+        unlimited.
+
+        maxBytes is the largest total size of the results kept, in bytes.
+        None means unlimited.
+        '''
+        super().__init__()
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.sizes = {}     # store size of each result, keyed like the data
+        self.bytes = 0      # track total size of stored results
+        self.evictions = 0  # count evicted results
+
+    def setLimits(self, maxEntries=None, maxBytes=None):
+        '''
+        changes the limits, evicting results right away if the store is
+        over the new ones. None means unlimited.
+        '''
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        if maxBytes is not None:
+            # results stored before the byte limit was set weren't measured
+            for key, value in self.items():
+                if self.sizes.get(key) is None:
+                    self.measure(key, measure(value))
+        self.evict()
+
+    def put(self, key, value, size=None):
+        '''
+        stores value under key and evicts results if the store is over its
+        limits. size is the value's size in bytes, if it is already known.
+        '''
+        OrderedDict.__setitem__(self, key, value)
+        self.move_to_end(key)
+        if size is None and self.maxBytes is not None:
+            size = measure(value)
+        self.measure(key, size)
+        self.evict(keep=key)
+
+    def measure(self, key, size):
+        '''
+        records the size of the result stored under key
+        '''
+        self.bytes -= self.sizes.get(key) or 0
+        self.sizes[key] = size
+        self.bytes += size or 0
+
+    def evict(self, keep=None):
+        '''
+        removes least recently used results until the store is within its
+        limits. the result stored under keep is never removed, so the
+        newest result is kept even if it is larger than maxBytes on its
+        own.
+        '''
+        while len(self) > 1 and self.overLimits():
+            key = next(iter(self))
+            if key == keep:
+                break
+            del self[key]
+            self.evictions += 1
+
+    def overLimits(self):
+        '''
+        returns True if the store holds more than its limits allow
+        '''
+        if self.maxEntries is not None and len(self) > self.maxEntries:
+            return True
+        if self.maxBytes is not None and self.bytes > self.maxBytes:
+            return True
+        return False
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __getitem__(self, key):
+        value = OrderedDict.__getitem__(self, key)
+        self.move_to_end(key)       # mark as recently used
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __delitem__(self, key):
+        OrderedDict.__delitem__(self, key)
+        self.bytes -= self.sizes.pop(key, None) or 0
+
+    def pop(self, key, *default):
+        if key in self:
+            value = OrderedDict.__getitem__(self, key)
+            del self[key]
+            return value
+        return OrderedDict.pop(self, key, *default)
+
+    def popitem(self, last=True):
+        key, value = OrderedDict.popitem(self, last)
+        self.bytes -= self.sizes.pop(key, None) or 0
+        return key, value
+
+    def clear(self):
+        OrderedDict.clear(self)
+        self.sizes.clear()
+        self.bytes = 0
+
+def measure(value):
+    '''
+    returns the approximate size in bytes of a stored (params, data)
+    tuple: the length of the data encoded as JSON.
+    '''
+    try:
+        return len(json.dumps(value[1], separators=(',', ':')))
+    except (TypeError, ValueError):
+        # DEBUG searches store response objects, which can't be encoded
+        return len(getattr(value[1], 'content', b''))
+
+def boundedHistory(history, maxHistory=None):
+    '''
+    returns history as a ring buffer keeping the last maxHistory entries,
+    or as a plain list if maxHistory is None.
+    '''
+    if maxHistory is None:
+        return list(history)
+    return deque(history, maxlen=maxHistory)
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:12:48 2026
+
+########################################################################
+####                                                                ####
+####                         stream module                          ####
+####                                                                ####
+########################################################################
+
+This module reads rows out of a response body as it arrives, without
+parsing the whole JSON document first.
+
+    A normal search calls response.json(), which holds the whole body,
+    and the whole parsed document, in memory at once. For a league-wide
+    shot chart or a full game of play-by-play that can be many megabytes,
+    even when the caller only wants to look at one row at a time.
+
+    Streaming is opt-in, through the stream() method every Search object
+    has:
+
+          for row in p.stream('shotchartDetail', name='Shot_Chart_Detail',
+                              PlayerID='0'):
+              ...
+
+    s.stream(method, name, **params) calls the endpoint method named
+    method with params, but instead of downloading and storing the result
+    it returns a RowStream over the rows of the result set called name
+    (or the first result set, if name is None). The rows are read from the
+    response body chunk by chunk as they are iterated over. Streamed
+    searches are recorded in history, but their results are not stored,
+    so s.back() and s.forw() skip them.
+
+    The RowStream's headers and name attributes are set once the stream
+    reaches the result set, which is before the first row is returned.
+    rows.dicts() iterates over the rows as {header: value} dictionaries.
+
+    Game.pbp, which uses a different format from the stats endpoints, is
+    streamed play by play, across every period returned:
+
+          for play in g.stream('pbp', GameID='1041900405'):
+              ...
+
+    RowStream and iterArray also accept a response object, a file object,
+    a string, or any iterable of string or bytes chunks, so saved
+    responses can be streamed the same way.
+"""
+import codecs                   # import codecs to decode chunks of bytes
+import json                     # import json to decode single values
+import re                       # import re to find keys in the body
+
+# size of the chunks read from a response body
+CHUNK_SIZE = 64 * 1024
+
+# characters kept from the end of the buffer while searching for a key,
+# so that keys split across two chunks are still found
+OVERLAP = 256
+
+decoder = json.JSONDecoder()
+whitespace = re.compile(r'\s*')
+
+def chunks(source, chunkSize=CHUNK_SIZE):
+    '''
+    returns an iterator over str chunks of source, which can be a
+    response object, a file object, a str or bytes body, or an iterable
+    of str or bytes chunks.
+    '''
+    if hasattr(source, 'iter_content'):       # requests response
+        raw = source.iter_content(chunkSize)
+    elif hasattr(source, 'read'):             # file object
+        raw = iter(lambda: source.read(chunkSize), source.read(0))
+    elif isinstance(source, (str, bytes)):
+        raw = [source]
+    else:
+        raw = source
+
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    for chunk in raw:
+        if isinstance(chunk, bytes):
+            chunk = utf8.decode(chunk)
+        if chunk:
+            yield chunk
+    tail = utf8.decode(b'', final=True)
+    if tail:
+        yield tail
+
+class Scanner(object):
+    '''
+    Reads JSON values out of a stream of text chunks, keeping only the
+    unread part of the text in memory.
+    '''
+    def __init__(self, source, chunkSize=CHUNK_SIZE):
+        self.chunks = chunks(source, chunkSize)
+        self.buffer = ''
+        self.pos = 0            # position of the next unread character
+        self.done = False       # True once the source is exhausted
+
+    def fill(self):
+        '''
+        drops the read part of the buffer and adds the next chunk.
+        returns False if the source is exhausted.
+        '''
+        if self.done:
+            return False
+        try:
+            chunk = next(self.chunks)
+        except StopIteration:
+            self.done = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def find(self, pattern):
+        '''
+        moves past the next match of the compiled regex pattern and
+        returns the match, or returns None if the source runs out first.
+        '''
+        while True:
+            match = pattern.search(self.buffer, self.pos)
+            if match is not None:
+                self.pos = match.end()
+                return match
+            # keep the end of the buffer in case the match is split
+            self.pos = max(self.pos, len(self.buffer) - OVERLAP)
+            if not self.fill():
+                return None
+
+    def peek(self):
+        '''
+        skips whitespace and returns the next character ('' at the end)
+        '''
+        while True:
+            self.pos = whitespace.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def value(self):
+        '''
+        reads and returns the next JSON value
+        '''
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # a number at the very end of the buffer may continue in the
+            # next chunk, so only trust it once something follows it
+            if end < len(self.buffer) or not self.fill():
+                self.pos = end
+                return value
+
+    def items(self):
+        '''
+        reads the items of the array the scanner has just moved into
+        (after its opening bracket), and moves past its closing bracket.
+        '''
+        while True:
+            char = self.peek()
+            if char == ']':
+                self.pos += 1
+                return
+            if char == '':
+                raise ValueError('response body ended inside an array')
+            yield self.value()
+            if self.peek() == ',':
+                self.pos += 1
+
+def keyPattern(key, opening=''):
+    '''
+    returns a compiled regex matching "key": followed by opening
+    '''
+    return re.compile(r'"%s"\s*:\s*%s' % (re.escape(key), re.escape(opening)))
+
+resultSetsPattern = re.compile(r'"resultSets?"\s*:')
+namePattern = keyPattern('name')
+headersPattern = keyPattern('headers')
+rowSetPattern = keyPattern('rowSet', '[')
+
+class RowStream(object):
+    '''
+    Iterable over the rows of one result set in a stats.wnba.com response,
+    read from the response body as they are needed.
+
+    headers and name are set once iteration reaches the result set.
+
+    the source is closed once the rows have been read. a stream which
+    won't be read to the end should be closed, or used as a context
+    manager:
+
+          with p.stream('shotchartDetail', PlayerID='0') as rows:
+              first = next(iter(rows))
+
+    if the response carries an error status code, iterating raises the
+    HTTP error instead of looking for result sets.
+    '''
+    def __init__(self, source, name=None, chunkSize=CHUNK_SIZE):
+        '''
+        source is a response object (requested with stream=True), a file
+        object, a body, or an iterable of chunks.
+
+        name is the name of the result set to read. None reads the first.
+        '''
+        self.source = source
+        self.name = name
+        self.chunkSize = chunkSize
+        self.headers = None
+
+    def __iter__(self):
+        # an error response has no result sets, so raise its error instead
+        status = getattr(self.source, 'status_code', None)
+        if status is not None and status >= 400:
+            try:
+                self.source.raise_for_status()
+            finally:
+                self.close()
+        scanner = Scanner(self.source, self.chunkSize)
+        try:
+            # skip the parameters, which come before the result sets and
+            # can hold a 'name' key of their own
+            if scanner.find(resultSetsPattern) is None:
+                raise KeyError('no result sets in response')
+            while scanner.find(namePattern) is not None:
+                name = scanner.value()
+                if self.name is not None and name != self.name:
+                    continue
+                # result sets list their name, then headers, then rows
+                if scanner.find(headersPattern) is None:
+                    break
+                self.headers = scanner.value()
+                self.name = name
+                if scanner.find(rowSetPattern) is None:
+                    break
+                for row in scanner.items():
+                    yield row
+                return
+            raise KeyError('no result set named %r in response' % self.name)
+        finally:
+            self.close()
+
+    def dicts(self):
+        '''
+        iterates over the rows as {header: value} dictionaries
+        '''
+        for row in self:
+            yield dict(zip(self.headers, row))
+
+    def close(self):
+        '''
+        closes the source, if it can be closed, which releases a streamed
+        response's connection back to the pool.
+        '''
+        close = getattr(self.source, 'close', None)
+        if close is not None:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        # a stream dropped before it was read to the end still gives its
+        # connection back
+        if 'source' in self.__dict__:
+            self.close()
+
+def readResultSet(source, name=None, chunkSize=CHUNK_SIZE):
+    '''
+    returns the result set called name (or the first result set if name
+    is None) from a stats.wnba.com response, decoding only that result
+    set. the rows of other result sets are skipped without being parsed.
+    raises KeyError if there is no such result set.
+    '''
+    scanner = Scanner(source, chunkSize)
+    if scanner.find(resultSetsPattern) is not None:
+        while scanner.find(namePattern) is not None:
+            found = scanner.value()
+            if name is not None and found != name:
+                continue
+            if scanner.find(headersPattern) is None:
+                break
+            headers = scanner.value()
+            if scanner.find(keyPattern('rowSet')) is None:
+                break
+            return {'name': found, 'headers': headers,
+                    'rowSet': scanner.value()}
+    raise KeyError('no result set named %r in response' % name)
+
+def iterArray(source, key, chunkSize=CHUNK_SIZE):
+    '''
+    iterates over the items of every array stored under key in a JSON
+    response, in order. i.e. iterArray(response, 'pla') iterates over the
+    plays of every period of a play-by-play response.
+    '''
+    scanner = Scanner(source, chunkSize)
+    pattern = keyPattern(key, '[')
+    try:
+        while scanner.find(pattern) is not None:
+            for item in scanner.items():
+                yield item
+    finally:
+        close = getattr(source, 'close', None)
+        if close is not None:
+            close()
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:59:50 2026
+
+########################################################################
+####                                                                ####
+####                       stubserver module                        ####
+####                                                                ####
+########################################################################
+
+This module holds the StubServer, a local stand-in for stats.wnba.com
+and data.wnba.com, for load testing code built on the package without
+sending a single request to the real API.
+
+    The StubServer is a threaded HTTP server on localhost which answers
+    the routes the package uses:
+        - stats.wnba.com/stats/<endpoint>, for every endpoint in the
+          endpoint registry (see the endpoints module)
+        - data.wnba.com play by play (Game.pbp) and schedule routes
+        - the stats.wnba.com logo images
+
+    Responses are played back from a FixtureStore, if one is given (see
+    the replay module), and are otherwise made up: synthetic result sets
+    with the headers listed in each endpoint method's docstring, play by
+    play periods and schedules shaped like the real ones.
+
+          with StubServer(latency=0.05, errorRate=0.01, rows=100) as server:
+              setTransport(server.transport())
+              Player.batch('gamelogs', paramSets, max_workers=32)
+
+    server.transport() returns a LocalTransport, a Transport (see the
+    transport module) which sends every request to the StubServer instead
+    of the real host. Everything else about the Transport works as usual,
+    so retries, rate limiting, single-flight and connection pooling can be
+    measured against the server. Any Transport options can be passed, i.e.
+    server.transport(poolSize=32, backoff=0.01).
+
+    How the server behaves is set when it is created:
+        - latency: seconds to wait before answering, or a (low, high)
+          tuple to wait a random time between the two
+        - errorRate: the fraction of requests answered 500
+        - throttleRate: the fraction of requests answered 429
+        - retryAfter: the Retry-After header sent with 429s, or None
+        - rows: the number of rows in each synthetic result set, play by
+          play period and schedule, which sets the payload size
+        - store: an optional FixtureStore of recorded responses
+        - seed: seeds the random choices, for repeatable runs
+
+    server.stats returns counters for the server: requests answered,
+    errors, throttled responses and bytes sent.
+
+    The server can also be run on its own, for load testing from other
+    processes:
+
+          python -m wnbAPI.stubserver --port 8000 --latency 0.05
+
+    in which case requests are sent to http://localhost:8000/<host><path>,
+    i.e. http://localhost:8000/stats.wnba.com/stats/playergamelogs
+"""
+import json                # import json to encode synthetic payloads
+import random              # import random to pick errors and latencies
+import threading           # import threading to serve in the background
+import time                # import time to add latency
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qsl
+
+from .endpoints import byURL
+from .transport import Transport, Counters
+
+# a small svg served for every logo route
+logoBody = (b'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">'
+            b'<rect width="10" height="10"/></svg>')
+
+def syntheticValue(header, row):
+    '''
+    returns a made up value for a result set column, roughly of the type
+    the real column holds
+    '''
+    if header.endswith('_ID') or header == 'GAME_ID':
+        return str(1021900000 + row)
+    if 'NAME' in header or 'ABBREVIATION' in header or header.endswith('_TEXT'):
+        return header.title() + ' ' + str(row)
+    if 'DATE' in header:
+        return '2019-%02d-%02dT00:00:00' % (5 + row % 5, 1 + row % 28)
+    if header.endswith('_PCT'):
+        return round((row % 100) / 100.0, 3)
+    return row % 50
+
+def syntheticStats(url, rows):
+    '''
+    returns a made up stats.wnba.com response for the endpoint at url,
+    with rows rows in each result set
+    '''
+    resultSets = {}
+    for spec in byURL.get(url, []):
+        resultSets.update(spec.resultSets)
+    if not resultSets:      # endpoints without documented headers
+        resultSets = {'ResultSet': ['ID', 'VALUE']}
+    return {'resource': url.rsplit('/', 1)[-1],
+            'parameters': {},
+            'resultSets': [{'name': name,
+                            'headers': headers,
+                            'rowSet': [[syntheticValue(h, row) for h in headers]
+                                       for row in range(rows)]}
+                           for name, headers in resultSets.items()]}
+
+def syntheticPlays(period, rows):
+    '''
+    returns a made up list of rows play by play events for a period
+    '''
+    plays = []
+    for evt in range(rows):
+        seconds = max(600 - evt * 600 // max(rows, 1), 0)
+        plays.append({'evt': evt + 1, 'cl': '%02d:%02d' % divmod(seconds, 60),
+                      'de': 'Play ' + str(evt + 1), 'locX': evt % 500 - 250,
+                      'locY': -80 if evt % 5 == 0 else evt % 400,
+                      'opt1': 0, 'opt2': 0, 'mtype': evt % 10,
+                      'etype': evt % 13, 'opid': '', 'tid': 1611661322,
+                      'pid': 203399, 'hs': evt, 'vs': evt // 2,
+                      'epid': '', 'oftid': 1611661322,
+                      'ord': period * 10000 + evt})
+    return plays
+
+def syntheticPbp(path, rows):
+    '''
+    returns a made up Game.pbp response for a pbp route, for a single
+    period or for the full game
+    '''
+    gameID, period = path.rsplit('/', 1)[-1].split('_')[:2]
+    if period == 'full':
+        return {'g': {'mid': 0, 'gid': gameID, 'gcode': '20191010/WASCON',
+                      'next': '',
+                      'pd': [{'p': p, 'pla': syntheticPlays(p, rows)}
+                             for p in range(1, 5)]}}
+    return {'g': {'mid': 0, 'gid': gameID, 'gcode': '20191010/WASCON',
+                  'next': '', 'p': int(period),
+                  'pla': syntheticPlays(int(period), rows)}}
+
+def syntheticSchedule(path, rows):
+    '''
+    returns a made up schedule() response for a schedule route
+    '''
+    team = {'tid': 1611661322, 're': '26-8', 'ta': 'WAS', 'tn': 'Mystics',
+            'tc': 'Washington', 's': '89'}
+    opponent = {'tid': 1611661323, 're': '15-19', 'ta': 'CON', 'tn': 'Sun',
+                'tc': 'Connecticut', 's': '78'}
+    games = [{'gid': str(1021900000 + game),
+              'gcode': '2019%02d%02d/CONWAS' % (5 + game % 5, 1 + game % 28),
+              'seri': '', 'is': 1,
+              'gdte': '2019-%02d-%02d' % (5 + game % 5, 1 + game % 28),
+              'htm': '2019-05-24T19:30:00', 'vtm': '2019-05-24T19:30:00',
+              'etm': '2019-05-24T19:30:00', 'an': 'Entertainment & Sports Arena',
+              'ac': 'Washington', 'as': 'DC', 'st': '3', 'stt': 'Final',
+              'v': opponent, 'h': team}
+             for game in range(rows)]
+    return {'gscd': {'tid': 1611661322, 'g': games, 'ta': 'WAS',
+                     'tn': 'Mystics', 'tc': 'Washington'}}
+
+class StubHandler(BaseHTTPRequestHandler):
+    '''
+    answers one request to the StubServer. paths are the real URL's host
+    followed by its path, i.e. /stats.wnba.com/stats/playergamelogs
+    '''
+    # keep connections alive, like the real servers
+    protocol_version = 'HTTP/1.1'
+    # send the body as soon as it is written. otherwise it waits for the
+    # client to acknowledge the headers, adding ~40ms to every request
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        stub = self.server.stub
+        status, headers, body = stub.answer(self.path)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass                 # don't print a line for every request
+
+class StubServer(object):
+    '''
+    Local stand-in for stats.wnba.com and data.wnba.com. see the
+    stubserver module.
+    '''
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, errorRate=0.0,
+                 throttleRate=0.0, retryAfter=None, rows=25, store=None,
+                 seed=None):
+        '''
+        host and port are the address to listen on. port 0 picks a free
+        port.
+
+        latency, errorRate, throttleRate, retryAfter, rows, store and seed
+        are described in the stubserver module.
+        '''
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.errorRate = errorRate
+        self.throttleRate = throttleRate
+        self.retryAfter = retryAfter
+        self.rows = rows
+        self.store = store
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counters = Counters('requests', 'errors', 'throttled', 'bytes')
+        # synthetic bodies only depend on the route, so each is encoded
+        # once and kept
+        self.payloads = {}
+        self.httpd = None
+        self.thread = None
+
+    @property
+    def url(self):
+        '''
+        the base URL of the running server
+        '''
+        return 'http://%s:%d' % (self.host, self.port)
+
+    def start(self):
+        '''
+        starts serving on a background thread and returns the server
+        '''
+        self.httpd = ThreadingHTTPServer((self.host, self.port), StubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.stub = self
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever,
+                                       daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        '''
+        stops the server
+        '''
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def localURL(self, url):
+        '''
+        returns the URL on the server standing in for a real URL
+        '''
+        parts = urlsplit(url)
+        local = self.url + '/' + parts.netloc + parts.path
+        if parts.query:
+            local += '?' + parts.query
+        return local
+
+    def transport(self, **options):
+        '''
+        returns a LocalTransport sending requests to the server, created
+        with any Transport options passed
+        '''
+        return LocalTransport(self, **options)
+
+    def draw(self):
+        '''
+        returns (delay, fate) for a request: the seconds to wait before
+        answering, and 'throttle', 'error' or None
+        '''
+        with self.lock:
+            if isinstance(self.latency, (tuple, list)):
+                delay = self.random.uniform(*self.latency)
+            else:
+                delay = self.latency
+            roll = self.random.random()
+        if roll < self.throttleRate:
+            return delay, 'throttle'
+        if roll < self.throttleRate + self.errorRate:
+            return delay, 'error'
+        return delay, None
+
+    def answer(self, path):
+        '''
+        returns (status, headers, body) answering a request for path
+        '''
+        delay, fate = self.draw()
+        if delay > 0:
+            time.sleep(delay)
+        self.counters.add('requests')
+
+        if fate == 'throttle':
+            self.counters.add('throttled')
+            headers = {'Content-Type': 'text/plain'}
+            if self.retryAfter is not None:
+                headers['Retry-After'] = str(self.retryAfter)
+            return 429, headers, b'Too Many Requests'
+        if fate == 'error':
+            self.counters.add('errors')
+            return 500, {'Content-Type': 'text/plain'}, b'Internal Server Error'
+
+        status, headers, body = self.payload(path)
+        self.counters.add('bytes', len(body))
+        return status, headers, body
+
+    def payload(self, path):
+        '''
+        returns (status, headers, body) of the recorded or synthetic
+        response for path
+        '''
+        route, _, query = path.lstrip('/').partition('?')
+        host, _, routePath = route.partition('/')
+        routePath = '/' + routePath
+        scheme = 'http' if '/scores/pbp/' in routePath else 'https'
+        url = scheme + '://' + host + routePath
+
+        if self.store is not None:
+            recorded = self.store.load(url, dict(parse_qsl(query,
+                                                 keep_blank_values=True)))
+            if recorded is not None:
+                return recorded.status_code, {'Content-Type':
+                        recorded.headers.get('Content-Type',
+                                             'application/json')}, \
+                       recorded.content
+
+        with self.lock:
+            cached = self.payloads.get(url)
+        if cached is not None:
+            return cached
+
+        if routePath.endswith('.svg'):
+            answer = 200, {'Content-Type': 'image/svg+xml'}, logoBody
+        else:
+            if url in byURL:
+                data = syntheticStats(url, self.rows)
+            elif '/scores/pbp/' in routePath:
+                data = syntheticPbp(routePath, self.rows)
+            elif routePath.endswith('_schedule.json'):
+                data = syntheticSchedule(routePath, self.rows)
+            else:
+                return 404, {'Content-Type': 'text/plain'}, b'Not Found'
+            answer = (200, {'Content-Type': 'application/json'},
+                      json.dumps(data).encode('utf-8'))
+        with self.lock:
+            self.payloads[url] = answer
+        return answer
+
+    @property
+    def stats(self):
+        '''
+        returns a dictionary of the server's counters
+        '''
+        return self.counters.snapshot()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+class LocalTransport(Transport):
+    '''
+    Transport which sends every request to a StubServer instead of the
+    real host. see the stubserver module.
+    '''
+    def __init__(self, server, **options):
+        Transport.__init__(self, **options)
+        self.server = server
+
+    def request(self, url, params, timeout, **kwargs):
+        # only the URL the request is sent to changes. rate limiting,
+        # single-flight and the request hooks all see the real URL.
+        return Transport.request(self, self.server.localURL(url), params,
+                                 timeout, **kwargs)
+
+def main():
+    '''
+    runs a StubServer in the foreground, configured from the command line
+    '''
+    import argparse        # only needed when run as a script
+    parser = argparse.ArgumentParser(
+            description='local stand-in for stats.wnba.com and data.wnba.com')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--retry-after', type=int, default=None)
+    parser.add_argument('--rows', type=int, default=25)
+    parser.add_argument('--fixtures', default=None,
+                        help='directory of recorded fixtures to serve')
+    args = parser.parse_args()
+
+    store = None
+    if args.fixtures:
+        from .replay import FixtureStore
+        store = FixtureStore(args.fixtures)
+    server = StubServer(args.host, args.port, args.latency, args.error_rate,
+                        args.throttle_rate, args.retry_after, args.rows, store)
+    server.start()
+    print('serving on ' + server.url)
+    try:
+        server.thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:14:51 2026
+
+########################################################################
+####                                                                ####
+####                          sync module                           ####
+####                                                                ####
+########################################################################
+
+This module keeps a local store of player and team game logs up to
+date, adding only the games played since the last sync.
+
+    A job which refreshes every player's logs each night, to pick up one
+    new game, would otherwise rebuild each player's whole season every
+    time. syncGamelogs instead keeps every game it has seen in a store,
+    and adds only the games which aren't in it yet:
+
+          store = GamelogStore('gamelogs.sqlite')
+
+          results = syncGamelogs('player', ['203399', '1628276'],
+                                 Season='2019', store=store)
+
+    Every sync downloads the whole season, since the gamelogs endpoints
+    don't reliably filter by DateFrom (see Player.gamelogs), and games are
+    matched to the stored ones by GAME_ID. Games already in the store are
+    ignored, so nothing is stored twice, and the store is the only place
+    the logs are kept, so it must be passed in.
+
+    syncGamelogs runs its requests through Search.batch (see the batch
+    module), and returns one SyncResult named tuple per entity, in order:
+        - entity: the PlayerID or TeamID
+        - new: the number of games added to the store
+        - error: the exception raised while syncing, or None
+
+    store.frame('player', '203399', '2019') returns an entity's stored
+    logs as a DataFrame (see the decode module), and store.latest(...)
+    returns the (GAME_DATE, GAME_ID) of its latest stored game.
+
+    The GamelogStore is a SQLite file, with one row per game, keyed by
+    kind ('player' or 'team'), entity, Season, SeasonType and GAME_ID.
+"""
+import json                # import json to store rows
+import sqlite3             # import sqlite3 to hold the store
+import threading           # import threading to lock the connection
+from collections import namedtuple
+
+from .decode import frame
+from .player import Player
+from .team import Team
+
+SyncResult = namedtuple('SyncResult', ['entity', 'new', 'error'])
+
+# the search class and id param used for each kind of entity
+kinds = {'player': (Player, 'PlayerID'),
+         'team': (Team, 'TeamID')}
+
+class GamelogStore(object):
+    '''
+    SQLite store of game log rows. see the sync module.
+    '''
+    def __init__(self, path='wnbAPI_gamelogs.sqlite'):
+        '''
+        path is the SQLite file to use, which is created if it doesn't
+        exist. ':memory:' keeps the store in memory.
+        '''
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS gamelogs ('
+                'kind TEXT, entity TEXT, season TEXT, seasonType TEXT, '
+                'gameID TEXT, gameDate TEXT, row TEXT, '
+                'PRIMARY KEY (kind, entity, season, seasonType, gameID))')
+        self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS headers ('
+                'kind TEXT PRIMARY KEY, headers TEXT)')
+        self.connection.commit()
+
+    def latest(self, kind, entity, Season, SeasonType='Regular Season'):
+        '''
+        returns (GAME_DATE, GAME_ID) of the latest stored game of an
+        entity, or None if none are stored.
+        '''
+        with self.lock:
+            return self.connection.execute(
+                    'SELECT gameDate, gameID FROM gamelogs WHERE kind = ? AND '
+                    'entity = ? AND season = ? AND seasonType = ? '
+                    'ORDER BY gameDate DESC, gameID DESC LIMIT 1',
+                    (kind, str(entity), str(Season), SeasonType)).fetchone()
+
+    def append(self, kind, entity, Season, SeasonType, resultSet):
+        '''
+        adds the rows of a gamelogs result set which aren't stored yet,
+        and returns the number added.
+        '''
+        headers = resultSet['headers']
+        gameID = headers.index('GAME_ID')
+        gameDate = headers.index('GAME_DATE')
+        rows = [(kind, str(entity), str(Season), SeasonType, str(row[gameID]),
+                 str(row[gameDate]), json.dumps(row))
+                for row in resultSet['rowSet']]
+        with self.lock:
+            self.connection.execute(
+                    'INSERT OR REPLACE INTO headers VALUES (?, ?)',
+                    (kind, json.dumps(headers)))
+            # rows already stored are ignored, and not counted
+            added = self.connection.executemany(
+                    'INSERT OR IGNORE INTO gamelogs VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    rows).rowcount
+            self.connection.commit()
+        return added
+
+    def resultSet(self, kind, entity, Season, SeasonType='Regular Season'):
+        '''
+        returns an entity's stored logs as a result set dictionary, newest
+        game first, like the gamelogs endpoints return them
+        '''
+        with self.lock:
+            headers = self.connection.execute(
+                    'SELECT headers FROM headers WHERE kind = ?',
+                    (kind,)).fetchone()
+            rows = self.connection.execute(
+                    'SELECT row FROM gamelogs WHERE kind = ? AND entity = ? '
+                    'AND season = ? AND seasonType = ? '
+                    'ORDER BY gameDate DESC, gameID DESC',
+                    (kind, str(entity), str(Season), SeasonType)).fetchall()
+        return {'name': kind.title() + 'GameLogs',
+                'headers': json.loads(headers[0]) if headers else [],
+                'rowSet': [json.loads(row[0]) for row in rows]}
+
+    def frame(self, kind, entity, Season, SeasonType='Regular Season'):
+        '''
+        returns an entity's stored logs as a pandas DataFrame
+        '''
+        return frame(self.resultSet(kind, entity, Season, SeasonType))
+
+    def close(self):
+        '''
+        closes the SQLite connection
+        '''
+        with self.lock:
+            self.connection.close()
+
+def syncGamelogs(kind, entities, Season, store, SeasonType='Regular Season',
+                 max_workers=8, **params):
+    '''
+    brings the game logs of every entity (PlayerIDs if kind is 'player',
+    TeamIDs if kind is 'team') in store, a GamelogStore, up to date for a
+    season, adding only games which aren't stored yet. any other keyword
+    arguments are params sent with every request. returns a list of
+    SyncResults in the same order as entities. see the sync module.
+    '''
+    cls, idParam = kinds[kind]
+    paramSets = [{idParam: entity} for entity in entities]
+
+    results = []
+    for entity, result in zip(entities, cls.batch('gamelogs', paramSets,
+                                                  max_workers, Season=Season,
+                                                  SeasonType=SeasonType,
+                                                  **params)):
+        if result.error is not None:
+            results.append(SyncResult(entity, 0, result.error))
+            continue
+        try:
+            data = result.data
+            resultSet = (data.get('resultSets') or [data.get('resultSet')])[0]
+            new = store.append(kind, entity, Season, SeasonType, resultSet)
+        except Exception as e:
+            results.append(SyncResult(entity, 0, e))
+        else:
+            results.append(SyncResult(entity, new, None))
+    return results
@@ -38,7 +38,8 @@ method, please see the search module documentation.
     
 """
 
-from wnbAPI.search import Search, currentSeason, teamLogo
+from wnbAPI.search import Search, currentSeason, teamLogo, schedule
+from wnbAPI.endpoints import endpointMethod, classEndpoints, classParams
     
 class Team(Search):
     '''
@@ -131,30 +132,7 @@ class Team(Search):
         # and that might have been a better choice, but I like
         # having a list of the accessible endpoints built into the
         # object. 
-        self.endpoints = {
-            'details':
-                'https://stats.wnba.com/stats/teamdetails',
-           'roster':
-                'https://stats.wnba.com/stats/commonteamroster',
-            'gamelogs':
-                'https://stats.wnba.com/stats/teamgamelogs',
-            'shooting': 
-                'https://stats.wnba.com/stats/teamdashboardbyshootingsplits',
-            'clutch':
-                'https://stats.wnba.com/stats/leaguedashteamclutch',
-            'lineups':
-                'https://stats.wnba.com/stats/teamdashlineups',
-            'playerDashboard':
-                'https://stats.wnba.com/stats/teamplayerdashboard',
-            'dashboardBySplits':
-                'https://stats.wnba.com/stats/teamdashboardbygeneralsplits', 
-            'onOff':
-                'https://stats.wnba.com/stats/teamplayeronoffdetails',
-            'onOffSummary':
-                'https://stats.wnba.com/stats/teamplayeronoffsummary',
-            'yearByYearStats':
-                'https://stats.wnba.com/stats/teamyearbyyearstats'
-             }
+        self.endpoints = classEndpoints('team')
         
         # set default required Parameters. These parameters are required for the 
         # majority of the methods in the class. When not required, can 
@@ -162,31 +140,10 @@ class Team(Search):
         # can be passed without affecting return for the methods where they
         # are not required. 
         
-        self.requiredParams = {
-            'DateFrom': '',   # Required but empty string accepted
-            'DateTo':'',      # Required but empty string accepted
-            'GameSegment': '',# Required but empty string accepted
-            'LastNGames':'0', # 0 stands for all games
-            'LeagueID':'10',  # 10 is WNBA. 00 is NBA and 30 is G-League 
-            'Location':'',    # Required but empty string accepted
-            'MeasureType': 'Base',#Required and needs string. 
-            'Month':'0',      # 0 stands for all months 
-            'Outcome':'',     # Required but empty string accepted
-            'OpponentTeamID': '0',# 0 stands for all opponents
-            'PaceAdjust':'N',
-            'PerMode': 'PerGame',# Requires string input
-            'Period': '0',    # 0 stands for all periods
-            'PlusMinus':'N',  # Requires Y or N
-            'Rank': 'N',      # Requires Y or N
-            'SeasonSegment':'',# Required but empty string accepted
-            'SeasonType':'Regular Season', # Requires string input
-            'TeamID':'1611661322', # 2019 World Champion Washington Mystics
-            'VsConference': '',# Required but empty string accepted 
-            'VsDivision':'',  # Required but empty string accepted
-            'Season': str(currentSeason) # Requires string or integer year. 
-            }
+        self.requiredParams = dict(classParams['team'])
         
 
+    @endpointMethod('team.details')
     def details(self, **params):
         '''
         method to get 'team details'
@@ -233,8 +190,8 @@ class Team(Search):
         
         
         '''        
-        return self.search(self.endpoints['details'], self.requiredParams, params)
-    
+
+    @endpointMethod('team.roster')
     def roster(self, **params):
         '''
         method to get team roster
@@ -260,8 +217,7 @@ class Team(Search):
         
                
         '''
-        return self.search(self.endpoints['roster'], self.requiredParams, params)
-    
+
     def logo(self, **params):
         '''
         method to pull team logo as .svg
@@ -276,10 +232,9 @@ class Team(Search):
            
            
         '''
-        if params: 
-            self.setParams(params)
+        params = self._callParams(params)
             
-        return teamLogo(TeamID =self.params.get('TeamID','1611661328'))
+        return teamLogo(TeamID =params.get('TeamID','1611661328'))
         
     def schedule(self, **params):
         '''
@@ -361,12 +316,12 @@ class Team(Search):
         # this method doesn't use the core Search.search method, so
         # if params are entered as an argument we need to
         # set those here instead of passing them to search. 
-        if params: 
-            self.setParams(params)
+        params = self._callParams(params)
         #call the schedule method that was imported earlier.     
-        return self.search.schedule(TeamID=self.params.get('TeamID','1611661322'), Season=self.params.get('Season', '2019'))
+        return schedule(TeamID=params.get('TeamID','1611661322'), Season=params.get('Season', '2019'))
         
         
+    @endpointMethod('team.gamelogs')
     def gamelogs(self, **params):
         '''
         method to get team gamelogs
@@ -420,8 +375,8 @@ class Team(Search):
                       'VsConference, 'VsDivision', 'Season', 
                       'ShotClockRange']
         '''
-        return self.search(self.endpoints['gamelogs'], self.requiredParams, params)
-  
+
+    @endpointMethod('team.shooting')
     def shooting(self, **params):
         '''
         Method added 10/29 for team shooting splits endpoint. 
@@ -465,10 +420,8 @@ class Team(Search):
         PARAMS UNTESTED. 
         
         '''
-        
-        return self.search(self.endpoints['shooting'], self.requiredParams, params)
-    
 
+    @endpointMethod('team.clutch')
     def clutch(self, **params):
         '''
         method to get team clutch stats
@@ -522,21 +475,8 @@ class Team(Search):
                 'PFD_RANK', 'PTS_RANK', 'PLUS_MINUS_RANK', 
                 'CFID', 'CFPARAMS', 
         '''            
-        requiredParams = {}
-        
-        requiredParams.update(self.requiredParams)
-        
-        requiredParams.update({'ClutchTime': 'Last 5 Minutes',
-                               'AheadBehind':'Ahead or Behind',
-                               'PointDiff':'5',
-                               'GameScope': '',
-                               'PlayerExperience':'',
-                               'PlayerPosition':'',
-                               'StarterBench':''
-                               })
-        
-        return self.search(self.endpoints['clutch'], requiredParams, params)
-  
+
+    @endpointMethod('team.lineups')
     def lineups(self, **params):
         '''
         method to get team dashboard by lineups
@@ -608,16 +548,8 @@ class Team(Search):
                 'PLUS_MINUS_RANK', 
         
         '''
-        requiredParams = {}
-        
-        requiredParams.update(self.requiredParams)
-            
-        requiredParams.update({'GroupQuantity':'5',
-                               'GameID':''
-                               })
-        
-        return self.search(self.endpoints['lineups'], requiredParams, params)
 
+    @endpointMethod('team.players')
     def players(self, **params):
         '''
         method to get team player dashboard
@@ -692,8 +624,8 @@ class Team(Search):
                  'DD2_RANK', 'TD3_RANK', 
              
         '''
-        return self.search(self.endpoints['playerDashboard'], self.requiredParams, params)
-        
+
+    @endpointMethod('team.splits')
     def splits(self, **params):
         '''
         method to get team player dashboard by splits
@@ -751,8 +683,8 @@ class Team(Search):
     
 
         '''           
-        return self.search(self.endpoints['dashboardBySplits'], self.requiredParams, params)
-    
+
+    @endpointMethod('team.onOff')
     def onOff(self, **params):
         '''
         method to get team player on Off information
@@ -826,8 +758,8 @@ class Team(Search):
                 'PTS_RANK', 'PLUS_MINUS_RANK', 
     
     '''
-        return self.search(self.endpoints['onOff'], self.requiredParams, params)
-    
+
+    @endpointMethod('team.onOffSummary')
     def onOffSummary(self, **params):
         '''
         method to get team player on/off summary
@@ -890,8 +822,8 @@ class Team(Search):
             'NET_RATING', 
                   
         '''
-        return self.search(self.endpoints['onOffSummary'], self.requiredParams, params)
-    
+
+    @endpointMethod('team.yearByYear')
     def yearByYear(self, **params):
         '''
         method to get team year by year stats
@@ -918,7 +850,6 @@ class Team(Search):
                 'TOV', 'BLK', 'PTS', 
                 'PTS_RANK', 
         '''
-        return self.search(self.endpoints['yearByYearStats'],self.requiredParams, params)
 
 def __main__():
     pass
\ No newline at end of file
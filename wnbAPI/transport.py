@@ -0,0 +1,574 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:12:40 2026
+
+########################################################################
+####                                                                ####
+####                       transport module                         ####
+####                                                                ####
+########################################################################
+
+This module holds the Transport class, which owns the HTTP connections
+used by every request the package makes.
+
+    Before this module existed, Search.search, Game.pbp, schedule() and
+    the logo functions each built a brand new requests.Session(), sent one
+    GET request and closed it. That meant every single endpoint call paid
+    for a new TCP connection and TLS handshake with stats.wnba.com.
+
+    A Transport wraps one requests.Session() with keep-alive connection
+    pools mounted on it, so consecutive requests to the same host reuse
+    an open connection.
+
+          t = Transport()
+
+          or
+
+          t = Transport(poolSize=20)
+
+          or
+
+          t = Transport(poolSize=20, hostPoolSizes={'stats.wnba.com': 50})
+
+    poolSize is the number of connections kept open per host. hostPoolSizes
+    overrides that number for individual hosts.
+
+    By default the whole package shares one module level Transport, which is
+    created on first use. It can be replaced with your own configured
+    Transport (or any object with a compatible get() method):
+
+          setTransport(Transport(poolSize=50))
+
+    getTransport() returns the shared Transport.
+
+    A single Search object (or subclass) can also be handed its own
+    transport with s.setTransport(t), in which case that object stops
+    using the shared one.
+
+    Failed requests are retried by the Transport. Connection errors and
+    the retryable status codes in retryStatuses (429 Too Many Requests and
+    the 5xx gateway errors) are retried up to retries times, waiting an
+    exponentially growing, randomly jittered delay between tries. When the
+    server sends a Retry-After header, that delay is used instead. After
+    the last retry, connection errors are printed and raised, and retryable
+    status codes are returned as they are.
+
+    Every Transport also waits on a RateLimiter before each request. The
+    RateLimiter is a token bucket per host, shared by every Transport in
+    the process, so the limit holds no matter how many Search objects or
+    threads are making requests. It is unlimited until a rate is set:
+
+          setRateLimit(5)                      # 5 requests/second per host
+
+          or
+
+          setRateLimit(2, host='data.wnba.com')  # for one host only
+
+    Identical requests made at the same time share one fetch. While a
+    request is in flight, any other thread asking the same Transport for
+    the same URL and params waits for it and gets the same response
+    object, instead of sending a request of its own. So a dozen threads,
+    each with its own Team() object on the shared Transport, asking for
+    the same roster at once send one request between them. Transports
+    never share with each other, since their sessions (headers, cookies,
+    proxies) and settings may differ. Requests with extra options
+    (i.e. stream=True) are always sent on their own, and a Transport
+    created with singleFlight=False never shares.
+
+    While any request hooks are added (see the hooks module), every
+    Transport raises the on_request_start, on_retry and on_response
+    events, timing how long each request spent waiting on the rate
+    limiter, waiting for the response, downloading the body and backing
+    off between retries.
+
+    t.stats returns counters for the Transport: requests sent, retries,
+    throttled (429) responses, requests answered by another thread's
+    fetch (shared), and the seconds spent waiting on the rate limiter
+    (rateLimitWait) and on backoff between retries (backoffWait).
+"""
+import random                             # import random to jitter backoff
+import threading                          # import threading to lock counters
+import time                               # import time to wait and measure
+from email.utils import parsedate_to_datetime # to read Retry-After dates
+from urllib.parse import urlsplit         # import urlsplit to find hosts
+
+import requests                           # import requests to make requests
+from requests.adapters import HTTPAdapter # import adapter to size pools
+from requests.structures import CaseInsensitiveDict
+
+# import default headers
+from .resources import headers
+
+# import the request hooks
+from .hooks import hooked, emit
+
+# status codes which mean the request should be tried again later
+retryStatuses = frozenset([429, 500, 502, 503, 504])
+
+class RateLimiter(object):
+    '''
+    Token bucket rate limiter, keeping a separate bucket for each host.
+
+    r.reserve(host) takes a token from the host's bucket and returns the
+    number of seconds the caller has to wait before sending its request
+    (0.0 if it can go right away). Tokens are reserved in order, so
+    waiting callers are let through one after another at the set rate.
+    '''
+    def __init__(self, rate=None, burst=1, hostRates=None):
+        '''
+        rate is the number of requests per second allowed per host.
+        None means unlimited.
+
+        burst is the number of requests allowed through at once after
+        the bucket has been idle.
+
+        hostRates is an optional dictionary of {host: rate} overriding
+        rate for particular hosts.
+        '''
+        self.rate = rate
+        self.burst = burst
+        self.hostRates = dict(hostRates or {})
+        self.lock = threading.Lock()
+        self.buckets = {}   # store (tokens, time) tuples keyed by host
+
+    def setRate(self, rate, host=None):
+        '''
+        sets the rate for one host, or the default rate if no host is
+        passed. None means unlimited.
+        '''
+        if host is None:
+            self.rate = rate
+        else:
+            self.hostRates[host] = rate
+
+    def reserve(self, host):
+        '''
+        takes a token for host and returns the seconds to wait for it
+        '''
+        rate = self.hostRates.get(host, self.rate)
+        if not rate:
+            return 0.0
+        with self.lock:
+            now = time.monotonic()
+            tokens, last = self.buckets.get(host, (self.burst, now))
+            # refill for the time since the last request, then take one.
+            # tokens go negative when requests are waiting on the bucket.
+            tokens = min(self.burst, tokens + (now - last) * rate) - 1
+            self.buckets[host] = (tokens, now)
+        if tokens >= 0:
+            return 0.0
+        return -tokens / rate
+
+class SingleFlight(object):
+    '''
+    Runs one call at a time per key. Callers asking for a key which is
+    already running wait for that call and share its result (or its
+    exception).
+    '''
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}     # store running calls keyed by key
+
+    def do(self, key, function):
+        '''
+        returns (result, leader). leader is True if this caller ran
+        function(), and False if it shared the result of a caller which
+        was already running it.
+        '''
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = Call()
+
+        if leader:
+            try:
+                call.result = function()
+            except BaseException as e:
+                call.error = e
+            finally:
+                # callers arriving from now on start a new call
+                with self.lock:
+                    del self.calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        return call.result, leader
+
+class Call(object):
+    '''
+    A call running in a SingleFlight
+    '''
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+def flightKey(url, params, transport=None):
+    '''
+    returns the key under which identical requests share a fetch. the
+    transport sending them is part of the key, so requests are only
+    shared by callers of the same transport.
+    '''
+    params = params or {}
+    return (id(transport), url,
+            tuple(sorted((str(k), str(v)) for k, v in params.items())))
+
+class Counters(object):
+    '''
+    Thread-safe dictionary of counters
+    '''
+    def __init__(self, *names):
+        self.lock = threading.Lock()
+        self.counts = dict.fromkeys(names, 0)
+
+    def add(self, name, amount=1):
+        with self.lock:
+            self.counts[name] = self.counts.get(name, 0) + amount
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.counts)
+
+class Timings(object):
+    '''
+    Seconds spent in each phase of one request, for the request hooks
+    (see the hooks module)
+    '''
+    phases = ('rateLimit', 'firstByte', 'download', 'backoff')
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.seconds = dict((phase, 0.0) for phase in self.phases)
+        self.bytes = None
+
+    def add(self, phase, seconds):
+        self.seconds[phase] += seconds
+
+    def done(self):
+        '''
+        returns the timings as a dictionary, with the total time since
+        the request started. download is None for streamed requests.
+        '''
+        timings = dict(self.seconds)
+        if self.bytes is None:
+            timings['download'] = None
+        timings['total'] = time.perf_counter() - self.start
+        return timings
+
+def backoffDelay(attempt, backoff=0.5, maxBackoff=30.0):
+    '''
+    returns the delay before retry number attempt (counting from 0): 
+    exponential backoff capped at maxBackoff, with full random jitter so
+    that parallel clients don't retry in lockstep.
+    '''
+    return random.uniform(0, min(maxBackoff, backoff * 2 ** attempt))
+
+def retryAfter(response):
+    '''
+    returns the delay in seconds requested by a response's Retry-After
+    header, or None if it doesn't have a usable one. The header can
+    either be a number of seconds or an HTTP date.
+    '''
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+class Transport(object):
+    '''
+    Keep-alive HTTP transport shared by all requests in the package.
+
+    t.get(url, params) sends a GET request over a pooled connection and
+    returns the requests.Response object, retrying failed requests.
+
+    t.close() closes all pooled connections. A closed Transport can still
+    be used; new connections are opened as needed.
+    '''
+    def __init__(self, poolSize=10, hostPoolSizes=None, timeout=(4, 100),
+                 session=None, retries=4, backoff=0.5, maxBackoff=30.0,
+                 rateLimiter=None, singleFlight=True):
+        '''
+        poolSize sets the number of keep-alive connections kept per host.
+
+        hostPoolSizes is an optional dictionary of {host: poolSize} used
+        to give particular hosts (i.e. 'stats.wnba.com') larger or smaller
+        pools than the default.
+
+        timeout is the default (connect, read) timeout used by get() when
+        no timeout is passed.
+
+        session is an optional pre-configured requests.Session(). Its
+        headers are kept, and the package's default headers are added for
+        any it doesn't set. If none is passed, a new one is created.
+
+        retries is the number of times a failed request is retried.
+        backoff is the base delay in seconds between retries, which
+        doubles with every retry up to maxBackoff.
+
+        rateLimiter is an optional RateLimiter to use instead of the one
+        shared by the process.
+
+        singleFlight sets whether identical requests made at the same
+        time share one fetch.
+        '''
+        if session is None:
+            session = requests.Session()
+            # set the package's default headers on the session. Copying
+            # the dict keeps changes to the session from leaking back into
+            # the resources module.
+            session.headers = CaseInsensitiveDict(headers)
+        else:
+            # keep the headers of a session that was passed in, and only
+            # fill in the defaults it doesn't set
+            for key, value in headers.items():
+                session.headers.setdefault(key, value)
+        self.session = session
+
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.maxBackoff = maxBackoff
+        self.rateLimiter = rateLimiter
+        self.singleFlight = singleFlight
+        self.counters = Counters('requests', 'retries', 'throttled', 'shared',
+                                 'rateLimitWait', 'backoffWait')
+        self.poolSize = poolSize
+        self.hostPoolSizes = dict(hostPoolSizes or {})
+
+        # mount the default pools for every host
+        self.mount('http://', poolSize)
+        self.mount('https://', poolSize)
+
+        # mount the per-host pools. requests matches the longest prefix,
+        # so these take priority over the defaults above.
+        for host, size in self.hostPoolSizes.items():
+            self.mount('http://' + host + '/', size)
+            self.mount('https://' + host + '/', size)
+
+    def mount(self, prefix, poolSize):
+        '''
+        mounts a connection pool adapter holding poolSize keep-alive
+        connections for all URLs beginning with prefix.
+        '''
+        adapter = HTTPAdapter(pool_connections=poolSize, pool_maxsize=poolSize)
+        self.session.mount(prefix, adapter)
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        '''
+        sends a GET request to url with params over a pooled connection
+        and returns the response object.
+
+        if an identical request is already in flight, waits for it and
+        returns its response instead.
+        '''
+        if timeout is None:
+            timeout = self.timeout
+        if not self.singleFlight or kwargs:
+            return self.send(url, params, timeout, **kwargs)
+
+        response, leader = getSingleFlight().do(
+                flightKey(url, params, self),
+                lambda: self.send(url, params, timeout))
+        if not leader:
+            self.counters.add('shared')
+        return response
+
+    def send(self, url, params=None, timeout=None, **kwargs):
+        '''
+        sends a GET request to url with params over a pooled connection
+        and returns the response object.
+
+        waits on the rate limiter before every try, and retries
+        connection errors and retryable status codes with backoff. 
+        raises the last error if the request still fails after all
+        retries.
+
+        while hooks are added, raises the request events and times each
+        phase of the request (see the hooks module).
+        '''
+        if timeout is None:
+            timeout = self.timeout
+        limiter = self.getRateLimiter()
+        host = urlsplit(url).hostname
+        # only measure requests while someone is listening
+        timings = Timings() if hooked() else None
+
+        errors = []       # collect request errors to print on failure
+        attempt = 0       # count retries
+        while True:
+            self.wait('rateLimitWait', limiter.reserve(host), timings,
+                      'rateLimit')
+            self.counters.add('requests')
+            if timings is not None:
+                emit('on_request_start', url, params, attempt=attempt)
+            try:
+                response = self.timedRequest(url, params, timeout, timings,
+                                             **kwargs)
+            except requests.exceptions.RequestException as e:
+                errors.append({url: e})
+                if attempt >= self.retries:   # out of retries, give up
+                    print(errors)
+                    raise e
+                delay = None
+                reason = e
+            else:
+                if response.status_code not in retryStatuses \
+                        or attempt >= self.retries:
+                    if timings is not None:
+                        emit('on_response', url, params,
+                             status=response.status_code,
+                             bytes=timings.bytes, attempts=attempt + 1,
+                             timings=timings.done())
+                    return response
+                if response.status_code == 429:
+                    self.counters.add('throttled')
+                delay = retryAfter(response)
+                reason = response.status_code
+                # hand a streamed response's pooled connection back
+                # before waiting, instead of when it's garbage collected
+                response.close()
+
+            if delay is None:
+                delay = backoffDelay(attempt, self.backoff, self.maxBackoff)
+            self.counters.add('retries')
+            if timings is not None:
+                emit('on_retry', url, params, attempt=attempt, delay=delay,
+                     reason=reason)
+            self.wait('backoffWait', delay, timings, 'backoff')
+            attempt += 1
+
+    def request(self, url, params, timeout, **kwargs):
+        '''
+        sends one GET request over the session, and returns the response
+        '''
+        return self.session.get(url, params=params, timeout=timeout,
+                                **kwargs)
+
+    def timedRequest(self, url, params, timeout, timings, **kwargs):
+        '''
+        sends one GET request. if timings is passed, the body is read 
+        separately from the headers, so the time spent on each is added 
+        to timings. 
+        '''
+        if timings is None:
+            return self.request(url, params, timeout, **kwargs)
+        streamed = kwargs.pop('stream', False)
+        start = time.perf_counter()
+        response = self.request(url, params, timeout, stream=True, **kwargs)
+        timings.add('firstByte', time.perf_counter() - start)
+        if streamed:           # the caller reads the body itself
+            timings.bytes = None
+            return response
+        start = time.perf_counter()
+        timings.bytes = len(response.content)
+        timings.add('download', time.perf_counter() - start)
+        return response
+
+    def wait(self, counter, delay, timings=None, phase=None):
+        '''
+        sleeps for delay seconds and adds the time to counter, and to 
+        phase of timings if timings are passed
+        '''
+        if delay > 0:
+            time.sleep(delay)
+            self.counters.add(counter, delay)
+            if timings is not None:
+                timings.add(phase, delay)
+
+    def getRateLimiter(self):
+        '''
+        returns the RateLimiter the Transport waits on
+        '''
+        if self.rateLimiter is None:
+            return getRateLimiter()
+        return self.rateLimiter
+
+    @property
+    def stats(self):
+        '''
+        returns a dictionary of the Transport's counters
+        '''
+        return self.counters.snapshot()
+
+    def close(self):
+        '''
+        closes all open pooled connections
+        '''
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# the shared transport. created on first call to getTransport() so that
+# importing the package doesn't open anything.
+_transport = None
+_transportLock = threading.Lock()
+
+def getTransport():
+    '''
+    returns the Transport shared by the package, creating it if needed.
+    '''
+    global _transport
+    if _transport is None:
+        with _transportLock:
+            # the first threads of a pool can get here at once. only one
+            # of them creates the Transport.
+            if _transport is None:
+                _transport = Transport()
+    return _transport
+
+def setTransport(transport):
+    '''
+    replaces the Transport shared by the package and returns the
+    previous one (or None if none had been created yet).
+
+    transport can be a Transport or any object with a compatible
+    get(url, params=None, timeout=None) method.
+    '''
+    global _transport
+    with _transportLock:
+        previous = _transport
+        _transport = transport
+    return previous
+
+# the single-flight group shared by every Transport in the process
+_singleFlight = SingleFlight()
+
+def getSingleFlight():
+    '''
+    returns the SingleFlight shared by every Transport in the process
+    '''
+    return _singleFlight
+
+# the rate limiter shared by every Transport in the process. unlimited
+# until a rate is set.
+_rateLimiter = RateLimiter()
+
+def getRateLimiter():
+    '''
+    returns the RateLimiter shared by every Transport in the process
+    '''
+    return _rateLimiter
+
+def setRateLimit(rate, host=None):
+    '''
+    sets the requests per second allowed by the shared RateLimiter, for
+    one host or, if no host is passed, for every host without its own
+    rate. None means unlimited.
+    '''
+    _rateLimiter.setRate(rate, host)
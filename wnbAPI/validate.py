@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:20:44 2026
+
+########################################################################
+####                                                                ####
+####                        validate module                         ####
+####                                                                ####
+########################################################################
+
+This module checks the params of every search before it is sent, so a
+typo in a param value fails straight away instead of after a round trip
+to stats.wnba.com (and 5 retries, see the transport module).
+
+    The checks are compiled once, when the module is imported, from
+    param_list (see the resources module):
+        - params whose values the API matches against a fixed list
+          (MeasureType, PerMode, SeasonType, GameSegment, ...) must be one
+          of the values in param_list, or an empty string where the API
+          allows one. These are held as frozensets.
+        - params with a format (dates, IDs, seasons and counts) must match
+          a precompiled regular expression.
+        - params whose valid values aren't known (TwoWay, Height, ...)
+          aren't checked.
+
+    Each endpoint's own rejected values (i.e. MeasureType 'Usage' for
+    playergamelogs) are read from the endpoint registry (see the endpoints
+    module). Only params which are actually sent are checked, so a bad
+    value for a param an endpoint ignores doesn't fail the search.
+
+    Search.search (and the async searches, batches and fetch()) call
+    validateParams before recording or sending anything. It raises a
+    ValueError naming every bad param:
+
+          Player().gamelogs(MeasureType='Basic')
+
+          ValueError: invalid params for playergamelogs: MeasureType='Basic'
+          (expected one of 'Advanced', 'Base', ...)
+
+    setValidation(False) turns the checks off, for values the checks
+    don't know about yet, and returns the previous setting.
+"""
+import re                  # import re to compile the format checks
+
+from .resources import param_list
+from .endpoints import byURL
+from .fingerprint import sentParams
+
+# params whose values must be one of those in param_list, mapped to
+# whether the API also accepts an empty string. Taken from the regular
+# expressions the API quotes in its error messages (see the comments on
+# param_list).
+listedParams = {
+        'GameSegment': True,
+        'Location': True,
+        'MeasureType': False,
+        'Outcome': True,
+        'PaceAdjust': False,
+        'PerMode': False,
+        'PlusMinus': False,
+        'Rank': False,
+        'SeasonSegment': True,
+        'SeasonType': False,
+        'VsConference': True,
+        'VsDivision': True,
+        'GameScope': True,
+        'PlayerExperience': True,
+        'PlayerPosition': True,
+        'StarterBench': True,
+        'Conference': True,
+        'Division': True,
+        'ShotClockRange': True,
+        'Scope': True,
+        'ActiveFlag': True,
+        'ClutchTime': True,
+        }
+
+# params which must match a format instead of a list
+formats = {
+        # 'MM(-/)DD(-/)YYYY' or 'YYYY(-/)MM(-/)DD', or empty for all dates
+        'DateFrom': r'(\d{1,2}[-/]\d{1,2}[-/]\d{4}|\d{4}[-/]\d{1,2}[-/]\d{1,2})?',
+        'DateTo': r'(\d{1,2}[-/]\d{1,2}[-/]\d{4}|\d{4}[-/]\d{1,2}[-/]\d{1,2})?',
+        'LastNGames': r'\d{1,2}',         # 100 doesn't work, 30 and below do
+        'LeagueID': r'\d\d',              # 10 is WNBA. 00 NBA, 30 G-League
+        'Month': r'\d{1,2}',
+        'OpponentTeamID': r'\d+',         # valid Team ID or 0
+        'Period': r'\d{1,2}',             # 0 for all, then quarters and OTs
+        'Season': r'\d{4}',
+        'PlayerID': r'\d*',               # 0 or '' where not required
+        'TopX': r'\d*',
+        'GroupQuantity': r'[1-5]',
+        'PORound': r'\d?',
+        'PointDiff': r'\d*',
+        'DraftPick': r'\d*',
+        'DraftYear': r'(\d{4})?',
+        'GameID': r'(\d{10})?',
+        }
+
+def compileChecks():
+    '''
+    returns a dictionary of checks keyed by param name. each check is a
+    frozenset of accepted values, or a compiled regular expression.
+    '''
+    checks = {}
+    for param, emptyAllowed in listedParams.items():
+        values = set(str(value) for value in param_list[param])
+        if emptyAllowed:
+            values.add('')
+        checks[param] = frozenset(values)
+    for param, pattern in formats.items():
+        checks[param] = re.compile(pattern + r'\Z')
+    return checks
+
+checks = compileChecks()
+
+def compileRejects():
+    '''
+    returns {param: frozenset of values, or None for any value} keyed by
+    endpoint URL, for URLs used by only one endpoint method
+    '''
+    rejects = {}
+    for url, shared in byURL.items():
+        if len(shared) == 1 and shared[0].rejects:
+            rejects[url] = shared[0].rejects
+    return rejects
+
+rejectedParams = compileRejects()
+
+# whether searches are checked before they are sent
+_validation = True
+
+def getValidation():
+    '''
+    returns True if searches are checked before they are sent.
+    '''
+    return _validation
+
+def setValidation(on):
+    '''
+    turns checking searches before they are sent on or off, and returns
+    the previous setting.
+    '''
+    global _validation
+    previous = _validation
+    _validation = bool(on)
+    return previous
+
+def describe(check):
+    '''
+    returns what a check expects, for error messages
+    '''
+    if isinstance(check, frozenset):
+        return 'one of ' + ', '.join(repr(value) for value in sorted(check))
+    return 'a value matching ' + repr(check.pattern[:-2])
+
+def problems(endpoint, params):
+    '''
+    returns a list of strings describing each bad param that would be
+    sent to endpoint. an empty list means the params are fine.
+    '''
+    found = []
+    sent = sentParams(endpoint, params)
+    rejects = rejectedParams.get(endpoint, {})
+    for param, value in sent.items():
+        check = checks.get(param)
+        if check is not None:
+            if isinstance(check, frozenset):
+                ok = value in check
+            else:
+                ok = check.match(value) is not None
+            if not ok:
+                found.append('%s=%r (expected %s)' % (param, value,
+                                                      describe(check)))
+                continue
+        if param in rejects:
+            rejected = rejects[param]
+            if rejected is None or value in rejected:
+                found.append('%s=%r (not accepted by this endpoint)'
+                             % (param, value))
+    return found
+
+def validateParams(endpoint, params):
+    '''
+    raises a ValueError naming every bad param that would be sent to
+    endpoint. does nothing if validation is off.
+    '''
+    if not _validation:
+        return
+    found = problems(endpoint, params)
+    if found:
+        raise ValueError('invalid params for %s: %s'
+                         % (endpoint.rsplit('/', 1)[-1], '; '.join(found)))